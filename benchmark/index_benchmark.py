@@ -0,0 +1,201 @@
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from db import MIGRATIONS_DIR, SCHEMA_PATH, SqliteBackend, list_migrations, read_script  # noqa: E402
+
+
+# 比較「沒有 / 加上 migration 003 索引」時，熱門查詢的執行時間 (其他索引兩次量測都保留)。
+# 只在本機 SQLite 暫存檔上執行 (會重建資料表，請勿指向正式資料庫)。
+#
+#   cd benchmark
+#   python index_benchmark.py --orders 200000
+
+HOT_PATH_MIGRATION = os.path.join(MIGRATIONS_DIR, "003_hot_path_indexes.sql")
+CREATE_INDEX = re.compile(r"CREATE\s+(?:UNIQUE\s+)?(?:NONCLUSTERED\s+)?INDEX\s+(\w+)\s+ON\s+([\w\[\]]+)[^;]*;", re.IGNORECASE)
+DROP_INDEX = re.compile(r"DROP\s+INDEX\s+(\w+)\s+ON\s+([\w\[\]]+)", re.IGNORECASE)
+
+# 選項代碼 (drink_option)：尺寸 2 種、冰量 6 種、甜度 5 種、加料 4 種
+OPTION_COUNTS = (2, 6, 5, 4)
+
+QUERIES = {
+    "待處理訂單 (admin_orders)": """
+        SELECT o.order_id, c.phone, o.status, o.tot_price
+        FROM [order] o LEFT JOIN customer c ON o.customer_id = c.customer_id
+        WHERE o.store_id = ? AND COALESCE(o.tot_price, 0) > 0 AND o.status = ?
+        ORDER BY o.order_id ASC
+    """,
+    "歷史訂單第一頁 (keyset)": """
+        SELECT o.order_id, c.phone, o.status, o.tot_price, o.created_at
+        FROM [order] o LEFT JOIN customer c ON o.customer_id = c.customer_id
+        WHERE o.store_id = ? AND COALESCE(o.tot_price, 0) > 0 AND o.status = ?
+        ORDER BY o.order_id DESC LIMIT 51
+    """,
+    "歷史訂單日期篩選": """
+        SELECT o.order_id, o.tot_price
+        FROM [order] o
+        WHERE o.store_id = ? AND o.created_at >= ? AND o.created_at < ?
+        ORDER BY o.order_id DESC LIMIT 51
+    """,
+    "訂單明細 (item by order_id)": """
+        SELECT i.item_id, p.name, i.option_key, i.quantity, p.price
+        FROM item i JOIN product p ON i.product_id = p.product_id
+        WHERE i.order_id = ?
+    """,
+    "顧客登入 (customer by phone)": """
+        SELECT customer_id FROM customer WHERE phone = ?
+    """,
+}
+
+
+def hot_path_indexes():
+    """
+    migration 003 加上的索引 (回傳 [(索引名稱, SQL)])；其他索引 (封存表、結帳冪等鍵...) 不動，
+    「加索引前」才是只有主鍵 + 其他功能本來就需要的索引。
+    後來的 migration 換掉的索引 (007 把 IX_item_order_spec 換成 IX_item_order_option) 改用取代它的那個，
+    定義一律以 sql_database.sql 目前的版本為準
+    """
+    names = [m.group(1) for m in CREATE_INDEX.finditer(read_script(HOT_PATH_MIGRATION))]
+    for version, _, path in list_migrations():
+        if version <= 3:
+            continue
+        script = read_script(path)
+        for old, table in DROP_INDEX.findall(script):
+            replacement = [m.group(1) for m in CREATE_INDEX.finditer(script) if m.group(2) == table]
+            if old in names and replacement:
+                names[names.index(old)] = replacement[0]
+
+    current = {m.group(1): m.group(0) for m in CREATE_INDEX.finditer(read_script(SCHEMA_PATH))}
+    return [(name, current[name]) for name in names if name in current]
+
+
+def generate(conn, rng, n_customers, n_orders, items_per_order):
+    store_ids = [r[0] for r in conn.execute("SELECT store_id FROM store")]
+    product_ids = [r[0] for r in conn.execute("SELECT product_id FROM product")]
+
+    print(f"產生 {n_customers} 位顧客...")
+    conn.execute("DELETE FROM customer")
+    phones = [f"09{p:08d}" for p in rng.sample(range(10 ** 8), n_customers)]
+    conn.executemany(
+        "INSERT INTO customer (customer_id, phone) VALUES (?, ?)",
+        ((i + 1, phone) for i, phone in enumerate(phones)),
+    )
+
+    print(f"產生 {n_orders} 筆訂單與明細...")
+    start = time.time() - 365 * 86400
+    orders, items = [], []
+    item_id = 0
+    for order_id in range(1, n_orders + 1):
+        created = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(start + order_id * 365 * 86400 / n_orders))
+        status = "未完成" if rng.random() < 0.01 else "已完成"
+        total = 0
+        for _ in range(rng.randint(1, items_per_order * 2 - 1)):
+            item_id += 1
+            qty = rng.randint(1, 3)
+            total += qty * 50
+            option_key = sum(rng.randint(1, n) << (8 * i) for i, n in enumerate(OPTION_COUNTS))
+            items.append((item_id, order_id, rng.choice(product_ids), option_key, qty))
+        orders.append((order_id, rng.choice(store_ids), rng.randint(1, n_customers), total, 1, status, created))
+    conn.executemany(
+        "INSERT INTO [order] (order_id, store_id, customer_id, tot_price, tot_amount, status, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)", orders)
+    conn.executemany(
+        "INSERT INTO item (item_id, order_id, product_id, option_key, quantity) "
+        "VALUES (?, ?, ?, ?, ?)", items)
+    conn.commit()
+    return store_ids, items, phones
+
+
+def make_params(rng, store_ids, items, phones):
+    store_id = rng.choice(store_ids)
+    item = rng.choice(items)
+    day = time.strftime("%Y-%m-%d", time.gmtime(time.time() - rng.randint(1, 360) * 86400))
+    return {
+        "待處理訂單 (admin_orders)": (store_id, "未完成"),
+        "歷史訂單第一頁 (keyset)": (store_id, "已完成"),
+        "歷史訂單日期篩選": (store_id, day + " 00:00:00", day + " 23:59:59"),
+        "訂單明細 (item by order_id)": (item[1],),
+        "顧客登入 (customer by phone)": (rng.choice(phones),),
+    }
+
+
+def measure(conn, rng, store_ids, items, phones, repeat):
+    result = {}
+    for name, sql in QUERIES.items():
+        samples = []
+        for _ in range(repeat):
+            params = make_params(rng, store_ids, items, phones)[name]
+            t0 = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            samples.append((time.perf_counter() - t0) * 1000)
+        result[name] = samples
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比較加索引前後熱門查詢的執行時間 (SQLite)")
+    parser.add_argument("--orders", type=int, default=200000)
+    parser.add_argument("--customers", type=int, default=50000)
+    parser.add_argument("--items-per-order", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=33)
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "drinkshop_index_benchmark.sqlite3"))
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(args.db + suffix):
+            os.remove(args.db + suffix)
+
+    backend = SqliteBackend(args.db)
+    conn = backend.connect()
+    backend.init_schema(conn)
+    backend.seed(conn)
+
+    indexes = hot_path_indexes()
+    for name, _ in indexes:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    conn.commit()
+
+    store_ids, items, phones = generate(conn, rng, args.customers, args.orders, args.items_per_order)
+    conn.execute("ANALYZE")
+
+    print("\n量測：沒有 migration 003 的索引 ...")
+    before = measure(conn, random.Random(args.seed), store_ids, items, phones, args.repeat)
+
+    print("建立索引 ...")
+    t0 = time.perf_counter()
+    for name, sql in indexes:
+        conn.execute(backend.translate(sql))
+    conn.commit()
+    conn.execute("ANALYZE")
+    print(f"建立 {len(indexes)} 個索引花費 {time.perf_counter() - t0:.1f} 秒")
+
+    print("量測：加上索引 ...")
+    after = measure(conn, random.Random(args.seed), store_ids, items, phones, args.repeat)
+
+    print(f"\n資料量：{args.orders} 筆訂單 / {len(items)} 筆明細 / {args.customers} 位顧客，每個查詢執行 {args.repeat} 次\n")
+    print(f"{'查詢':<28}{'加索引前 (ms)':>16}{'加索引後 (ms)':>16}{'倍數':>10}")
+    for name in QUERIES:
+        b = statistics.median(before[name])
+        a = statistics.median(after[name])
+        print(f"{name:<28}{b:>16.3f}{a:>16.3f}{b / a if a else float('inf'):>10.1f}x")
+
+    print("\n執行計畫 (加索引後)：")
+    params = make_params(random.Random(args.seed), store_ids, items, phones)
+    for name, sql in QUERIES.items():
+        plan = "; ".join(backend.explain(conn, sql, params[name]))
+        print(f"  {name}: {plan}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
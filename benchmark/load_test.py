@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE_DIR)
+
+from db import read_seed_csv  # noqa: E402
+
+
+# 整個點餐流程的壓力測試：多個虛擬使用者同時操作，統計每個路由的 p50 / p95 / p99 與吞吐量。
+#   顧客：customer_login → order_drink → add_item × N → order_summary → checkout → order_success
+#   店家：admin_orders 重新整理，偶爾把一張訂單改成已完成 (admin_update_status)
+#
+# 預設會用暫存的 SQLite 資料庫自己啟動一個 server (有 gunicorn 就用 gunicorn，沒有就用 flask run)，
+# 也可以用 --base-url 指向已經在跑的環境 (請勿指向正式站，會真的下單)。
+# 結果存在 benchmark/results/，加上 --compare 會和上一次 (或指定檔案) 比較 p95。
+#
+#   python benchmark/load_test.py --customers 20 --stores 4 --duration 30 --compare
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# 飲料選項以代碼送出，跟瀏覽器一樣從點餐頁的 <select> 取得可選的值
+OPTION_FIELDS = ("size", "ice", "sugar", "topping")
+SELECT_RE = re.compile(r'<select name="(\w+)"[^>]*>(.*?)</select>', re.S)
+OPTION_VALUE_RE = re.compile(r'<option value="(\d+)"')
+
+TOKEN_RE = re.compile(r'name="checkout_token" value="([^"]+)"')
+ORDER_ID_RE = re.compile(r'name="order_id" value="(\d+)"')
+
+
+class Recorder:
+    """收集每一次 request 的 (路由, 耗時)；warm-up 期間的資料不列入"""
+
+    def __init__(self, warmup_until):
+        self.warmup_until = warmup_until
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.errors = {}
+        self.flows = 0
+
+    def record(self, route, seconds, ok):
+        if time.monotonic() < self.warmup_until:
+            return
+        with self.lock:
+            if ok:
+                self.samples.setdefault(route, []).append(seconds)
+            else:
+                self.errors[route] = self.errors.get(route, 0) + 1
+
+    def flow_done(self):
+        if time.monotonic() >= self.warmup_until:
+            with self.lock:
+                self.flows += 1
+
+
+class VirtualUser:
+    def __init__(self, base_url, recorder, rng):
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.rng = rng
+        self.http = requests.Session()
+
+    def call(self, route, method, path, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = self.http.request(method, self.base_url + path, allow_redirects=False, timeout=30, **kwargs)
+            ok = response.status_code < 400
+        except requests.RequestException:
+            response, ok = None, False
+        self.recorder.record(route, time.perf_counter() - started, ok)
+        return response
+
+
+def form_choices(html):
+    """點餐頁 → {"size": ["1", "2"], "ice": [...], ...}"""
+    choices = {}
+    for name, body in SELECT_RE.findall(html):
+        if name in OPTION_FIELDS:
+            choices[name] = OPTION_VALUE_RE.findall(body)
+    return choices
+
+
+def customer_flow(user, store_ids, product_ids, max_items):
+    rng = user.rng
+    user.call("GET customer_login", "GET", "/customer_login")
+    phone = f"09{rng.randrange(10 ** 8):08d}"
+    user.call("POST customer_login", "POST", "/customer_login",
+              data={"phone": phone, "store_id": rng.choice(store_ids)})
+    page = user.call("GET order_drink", "GET", "/order_drink")
+    choices = form_choices(page.text) if page is not None else {}
+    if not all(choices.get(name) for name in OPTION_FIELDS):
+        return
+    for _ in range(rng.randint(1, max_items)):
+        data = {name: rng.choice(choices[name]) for name in OPTION_FIELDS}
+        data.update(product_id=rng.choice(product_ids), quantity=rng.randint(1, 3))
+        user.call("POST add_item", "POST", "/add_item", data=data)
+    summary = user.call("GET order_summary", "GET", "/order_summary")
+    match = TOKEN_RE.search(summary.text) if summary is not None else None
+    if not match:
+        return
+    user.call("POST checkout", "POST", "/checkout", data={"checkout_token": match.group(1)})
+    user.call("GET order_success", "GET", "/order_success")
+    user.recorder.flow_done()
+
+
+def store_flow(user, store_id, complete_ratio):
+    page = user.call("GET admin_orders", "GET", "/admin_orders")
+    if page is None or page.status_code != 200:
+        # session 失效 (或第一次) 就重新登入
+        user.call("POST admin_login", "POST", "/admin_login", data={"shopId": store_id})
+        return
+    order_ids = ORDER_ID_RE.findall(page.text)
+    if order_ids and user.rng.random() < complete_ratio:
+        user.call("POST admin_update_status", "POST", "/admin_update_status",
+                  data={"order_id": user.rng.choice(order_ids)})
+
+
+def run_user(kind, index, args, recorder, deadline, store_ids, product_ids):
+    user = VirtualUser(args.base_url, recorder, random.Random(f"{args.seed}:{kind}:{index}"))
+    store_id = store_ids[index % len(store_ids)]
+    while time.monotonic() < deadline:
+        if kind == "customer":
+            customer_flow(user, store_ids, product_ids, args.max_items)
+        else:
+            store_flow(user, store_id, args.complete_ratio)
+        if args.think:
+            time.sleep(user.rng.uniform(0, 2 * args.think))
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo, hi = int(k), min(int(k) + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(recorder, seconds):
+    routes = {}
+    for route, values in sorted(recorder.samples.items()):
+        values.sort()
+        routes[route] = {
+            "count": len(values),
+            "errors": recorder.errors.get(route, 0),
+            "rps": len(values) / seconds,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+            "max_ms": values[-1] * 1000,
+        }
+    for route, count in recorder.errors.items():
+        routes.setdefault(route, {"count": 0, "errors": count, "rps": 0, "p50_ms": 0, "p95_ms": 0, "p99_ms": 0, "max_ms": 0})
+    total = sum(r["count"] for r in routes.values())
+    return {
+        "routes": routes,
+        "total_requests": total,
+        "total_errors": sum(r["errors"] for r in routes.values()),
+        "rps": total / seconds,
+        "flows_per_second": recorder.flows / seconds,
+    }
+
+
+# ---------- 本機 server ----------
+
+def start_server(args):
+    """用暫存 SQLite 建好資料，啟動 server 並等它可以回應；回傳 (process, 暫存資料夾)"""
+    tmp = tempfile.mkdtemp(prefix="drinkshop-load-")
+    # 快取版本檔與 profile 也放在暫存資料夾，不要動到專案 instance/ 底下正在用的檔案
+    env = dict(os.environ, DB_BACKEND="sqlite", SQLITE_PATH=os.path.join(tmp, "load.sqlite3"),
+               CACHE_DIR=os.path.join(tmp, "cache"), PROFILE_DIR=os.path.join(tmp, "profiles"),
+               FLASK_APP="web", DB_POOL_MAX=str(args.threads),
+               METRICS_SAMPLE_RATE=os.environ.get("METRICS_SAMPLE_RATE", "1"))
+    subprocess.run([sys.executable, "-m", "flask", "init-db"], cwd=BASE_DIR, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+
+    port = str(args.port)
+    if shutil.which("gunicorn"):
+        cmd = ["gunicorn", "-w", str(args.workers), "--threads", str(args.threads),
+               "-b", f"127.0.0.1:{port}", "--log-level", "warning", "web:app"]
+    else:
+        print("找不到 gunicorn，改用 flask run (單一 process、多執行緒)")
+        cmd = [sys.executable, "-m", "flask", "run", "--port", port, "--with-threads"]
+    proc = subprocess.Popen(cmd, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    args.base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(args.base_url + "/customer_login", timeout=1)
+            return proc, tmp
+        except requests.RequestException:
+            time.sleep(0.1)
+    proc.terminate()
+    raise SystemExit("server 啟動失敗")
+
+
+# ---------- 結果存檔 / 比較 ----------
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save_result(result):
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    name = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}_{result['revision']}.json"
+    path = os.path.join(RESULTS_DIR, name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=1)
+    return path
+
+
+def previous_result(exclude):
+    if not os.path.isdir(RESULTS_DIR):
+        return None
+    names = sorted(n for n in os.listdir(RESULTS_DIR) if n.endswith(".json"))
+    names = [n for n in names if os.path.join(RESULTS_DIR, n) != exclude]
+    return os.path.join(RESULTS_DIR, names[-1]) if names else None
+
+
+def print_report(summary, baseline=None):
+    base_routes = baseline["summary"]["routes"] if baseline else {}
+    header = f"{'路由':<24}{'次數':>8}{'錯誤':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+    if baseline:
+        header += f"{'p95 變化':>12}"
+    print("\n" + header + "  (毫秒)")
+    for route, r in summary["routes"].items():
+        line = (f"{route:<24}{r['count']:>8}{r['errors']:>6}{r['rps']:>9.1f}"
+                f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}")
+        old = base_routes.get(route)
+        if old and old["p95_ms"]:
+            line += f"{(r['p95_ms'] / old['p95_ms'] - 1) * 100:>+11.0f}%"
+        print(line)
+    print(f"\n總計 {summary['total_requests']} 次 request、{summary['total_errors']} 次錯誤，"
+          f"{summary['rps']:.1f} req/s，完成 {summary['flows_per_second']:.2f} 張訂單/秒")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="點餐流程壓力測試")
+    parser.add_argument("--base-url", help="測試已經在跑的 server；不給就自己用 SQLite 啟動一個")
+    parser.add_argument("--customers", type=int, default=20, help="顧客虛擬使用者數")
+    parser.add_argument("--stores", type=int, default=4, help="店家虛擬使用者數 (每個固定一家門市)")
+    parser.add_argument("--duration", type=float, default=30, help="量測秒數 (不含 warm-up)")
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument("--think", type=float, default=0, help="每輪之間平均停頓秒數")
+    parser.add_argument("--max-items", type=int, default=4, help="每張訂單最多 add_item 幾次")
+    parser.add_argument("--complete-ratio", type=float, default=0.3, help="店家每次重新整理後完成一張訂單的機率")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn worker 數")
+    parser.add_argument("--threads", type=int, default=8, help="每個 worker 的執行緒數")
+    parser.add_argument("--compare", nargs="?", const="latest", help="和上一次 (或指定的結果檔) 比較")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    proc = tmp = None
+    if not args.base_url:
+        proc, tmp = start_server(args)
+
+    _, store_rows = read_seed_csv("store")
+    _, product_rows = read_seed_csv("product")
+    store_ids = [r[0] for r in store_rows]
+    product_ids = [r[0] for r in product_rows]
+
+    baseline_path = previous_result(None) if args.compare == "latest" else args.compare
+
+    try:
+        started = time.monotonic()
+        recorder = Recorder(started + args.warmup)
+        deadline = started + args.warmup + args.duration
+        threads = [
+            threading.Thread(target=run_user, daemon=True,
+                             args=(kind, i, args, recorder, deadline, store_ids, product_ids))
+            for kind, count in (("customer", args.customers), ("store", args.stores))
+            for i in range(count)
+        ]
+        print(f"{args.customers} 位顧客 + {args.stores} 家店家，warm-up {args.warmup:.0f} 秒、量測 {args.duration:.0f} 秒 → {args.base_url}")
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        measured = time.monotonic() - recorder.warmup_until
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    summary = summarize(recorder, measured)
+    result = {
+        "revision": git_revision(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {k: v for k, v in vars(args).items() if k not in ("compare", "no_save")},
+        "summary": summary,
+    }
+
+    baseline = None
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"比較基準：{os.path.basename(baseline_path)} ({baseline['revision']})")
+    print_report(summary, baseline)
+
+    if not args.no_save:
+        print(f"\n結果已存到 {save_result(result)}")
+    return 1 if summary["total_errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+# ================== 程序內快取 ==================
+#
+# 商品目錄、門市清單這類「一個月才改一次」的資料，沒必要每個 request 都查資料庫。
+# VersionedCache 把 loader() 的結果放在記憶體，遇到以下情況才重新載入：
+#   - 超過 ttl 秒 (保底，就算忘了手動失效也會自己更新)
+#   - 版本號改變 (invalidate() 會改寫 version 檔，所有 gunicorn worker 下次取用時都會發現)
+# 檢查版本只需要一次 os.stat，不會碰資料庫。
+
+
+def write_version(path):
+    """改寫版本檔；版本號就是它的 mtime。
+    檔案系統的 mtime 精度可能只到幾毫秒，明確指定奈秒時間，連續兩次改寫才不會拿到同一個版本"""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    now = time.time_ns()
+    with open(path, "w") as f:
+        f.write(str(now))
+    os.utime(path, ns=(now, now))
+
+
+class VersionedCache:
+    def __init__(self, name, loader, ttl=600, version_path=None):
+        """
+        name         : 快取名稱 (統計資料用)
+        loader       : 重新載入資料的函式
+        ttl          : 最長保存秒數
+        version_path : 跨 process 共用的版本檔；None 代表只在本 process 內失效
+        """
+        self.name = name
+        self._loader = loader
+        self.ttl = ttl
+        self.version_path = version_path
+
+        self._lock = threading.Lock()
+        self._value = None
+        self._loaded_at = 0.0
+        self._loaded_version = None
+        self._local_version = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self):
+        """目前的資料版本 (ETag 之類需要「資料有沒有變」的地方可以直接用)"""
+        if not self.version_path:
+            return str(self._local_version)
+        try:
+            return str(os.stat(self.version_path).st_mtime_ns)
+        except FileNotFoundError:
+            return "0"
+
+    def get(self):
+        version = self.version
+        now = time.monotonic()
+        value = self._value
+        if (self._loaded_version == version and value is not None
+                and now - self._loaded_at < self.ttl):
+            self.hits += 1
+            return value
+
+        with self._lock:
+            # 其他 thread 可能已經在等鎖的期間載入好了
+            if (self._loaded_version == version and self._value is not None
+                    and time.monotonic() - self._loaded_at < self.ttl):
+                self.hits += 1
+                return self._value
+            self.misses += 1
+            self._value = self._loader()
+            self._loaded_at = time.monotonic()
+            self._loaded_version = version
+            return self._value
+
+    def invalidate(self):
+        """讓所有 process 的快取在下一次 get() 時重新載入"""
+        with self._lock:
+            self._local_version += 1
+            self._value = None
+        if self.version_path:
+            write_version(self.version_path)
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "version": self.version,
+            "ttl": self.ttl,
+            "loaded": self._value is not None,
+        }
+
+
+# ================== 最近使用 (LRU) 對照表 ==================
+#
+# 「電話 → customer_id」這種一旦建立就不會改變的對照，熟客再次登入時不必查資料庫。
+# 只保留最近用到的 max_size 筆，超過就丟掉最久沒用的；每個 process 各自一份。
+
+
+class LruCache:
+    def __init__(self, name, max_size=10000):
+        self.name = name
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "max_size": self.max_size,
+        }
+
+
+# ================== 依門市版本號快取的查詢結果 ==================
+#
+# 店家平板一直重新整理待處理訂單，但結果只有在「該門市」有人結帳或店家更新狀態時才會變。
+# StoreResultCache 給每家門市一個版本號 (<folder>/<門市>.version 的 mtime)，寫入的地方呼叫 bump(store_id)：
+#   - 查詢結果以 JSON 存在 <folder>/<門市>.json (記著當時的版本)，所有 gunicorn worker 共用
+#   - 本 process 另外在記憶體留一份，版本沒變時連檔案都不用讀
+#   - 超過 ttl 秒一律重查 (保底，例如有人直接在資料庫改了訂單)
+# 沒有變動時的成本只有一次 os.stat。
+
+
+class StoreResultCache:
+    def __init__(self, name, loader, folder, ttl=300):
+        """
+        name   : 快取名稱 (統計資料用)
+        loader : loader(store_id) 回傳可以轉成 JSON 的查詢結果
+        folder : 版本檔與結果檔的資料夾 (同一台機器的 worker 共用)
+        ttl    : 最長保存秒數
+        """
+        self.name = name
+        self._loader = loader
+        self.folder = folder
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._memory = {}   # 門市 -> (版本, 產生時間, 結果)
+
+        self.hits = 0
+        self.file_hits = 0
+        self.misses = 0
+        self.bumps = 0
+
+    def _path(self, store_id, suffix):
+        return os.path.join(self.folder, f"{int(store_id)}{suffix}")
+
+    def version(self, store_id):
+        try:
+            return str(os.stat(self._path(store_id, ".version")).st_mtime_ns)
+        except FileNotFoundError:
+            return "0"
+
+    def get(self, store_id, version=None):
+        """version 可以由呼叫端先取好 (例如同時拿來算 ETag)，確保結果與版本一致"""
+        key = int(store_id)
+        version = version or self.version(key)
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry and entry[0] == version and now - entry[1] < self.ttl:
+            self.hits += 1
+            return entry[2]
+
+        entry = self._read(key)
+        if entry and entry[0] == version and now - entry[1] < self.ttl:
+            self.file_hits += 1
+        else:
+            # 先記下查詢前的版本：查詢期間若有人 bump，存下的舊版本下次就對不上，不會留下過期結果
+            self.misses += 1
+            entry = (version, now, self._loader(key))
+            self._write(key, entry)
+        with self._lock:
+            self._memory[key] = entry
+        return entry[2]
+
+    def bump(self, store_id):
+        """該門市的資料有異動：所有 worker 下一次 get() 都會重新查詢"""
+        write_version(self._path(store_id, ".version"))
+        with self._lock:
+            self.bumps += 1
+            self._memory.pop(int(store_id), None)
+
+    def clear(self):
+        """資料庫重建後呼叫：丟掉所有門市的結果與版本"""
+        with self._lock:
+            self._memory.clear()
+        try:
+            names = os.listdir(self.folder)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith((".json", ".version")):
+                try:
+                    os.remove(os.path.join(self.folder, name))
+                except FileNotFoundError:
+                    pass   # 其他 worker 已經刪掉了
+
+    def _read(self, key):
+        try:
+            with open(self._path(key, ".json"), encoding="utf-8") as f:
+                data = json.load(f)
+            return data["version"], data["saved_at"], data["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, key, entry):
+        os.makedirs(self.folder, exist_ok=True)
+        path = self._path(key, ".json")
+        # 先寫暫存檔再換名，其他 worker 不會讀到寫一半的檔案
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": entry[0], "saved_at": entry[1], "value": entry[2]}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "file_hits": self.file_hits,
+            "misses": self.misses,
+            "bumps": self.bumps,
+            "ttl": self.ttl,
+            "stores": len(self._memory),
+        }
@@ -1,16 +1,27 @@
+import hashlib
+import json
 import os
-import time
+import threading
 import requests
 import re
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, urlparse
+from urllib3.util.retry import Retry
 
 # Selenium 相關模組
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+
 def sanitize_filename(name):
     """
     將產品名稱轉換為合法的檔案名稱。
@@ -21,44 +32,126 @@ def sanitize_filename(name):
     # 移除前後空白
     return name.strip()
 
-def download_image(url, folder, filename):
-    """下載圖片並儲存"""
+# ---------- 圖片下載 (多執行緒 + 重試 + 略過未變動) ----------
+
+DOWNLOAD_WORKERS = 8
+# 記錄每個檔案是從哪個網址下載、內容雜湊多少；重跑時網址相同且檔案沒被改過就不再下載
+# (放在 crawler 資料夾，不要放進 static 被網站公開)
+STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "image_state.json")
+
+def create_session():
+    """所有下載共用一個 Session (keep-alive)，連線失敗或 429/5xx 會自動退避重試"""
+    retry = Retry(
+        total=4,
+        backoff_factor=0.5,   # 0.5, 1, 2, 4 秒
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=DOWNLOAD_WORKERS, pool_maxsize=DOWNLOAD_WORKERS)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+def image_ext(url):
+    """判斷副檔名 (預設 jpg)"""
+    path = urlparse(url).path.lower()
+    for ext in ("png", "jpeg", "webp"):
+        if path.endswith("." + ext):
+            return ext
+    return "jpg"
+
+def file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def load_state():
     try:
-        response = requests.get(url, stream=True, timeout=10)
-        if response.status_code == 200:
-            # 判斷副檔名 (預設 jpg)
-            ext = 'jpg'
-            if '.png' in url: ext = 'png'
-            elif '.jpeg' in url: ext = 'jpeg'
-            elif '.webp' in url: ext = 'webp'
-            
-            full_path = os.path.join(folder, f"{filename}.{ext}")
-            
-            # 如果檔名重複，加上編號
-            counter = 1
-            while os.path.exists(full_path):
-                full_path = os.path.join(folder, f"{filename}_{counter}.{ext}")
-                counter += 1
-            
-            with open(full_path, 'wb') as f:
-                for chunk in response.iter_content(1024):
-                    f.write(chunk)
-            print(f"[成功] 下載: {filename}")
-        else:
-            print(f"[失敗] 無法下載 (Status {response.status_code}): {url}")
-    except Exception as e:
-        print(f"[錯誤] 下載圖片時發生錯誤: {e}")
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
 
-def main():
-    target_url = "https://order.quickclick.cc/tw/food/P_kKKKKMjer/"
-    
-    # 使用相對路徑 (前提：必須在 crawler 資料夾內執行 python crawler.py)
-    output_folder = "../static/product_images"
+def save_state(state):
+    with open(STATE_PATH + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(STATE_PATH + ".tmp", STATE_PATH)
 
-    # 建立輸出資料夾
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
+def is_unchanged(folder, file_name, url, state):
+    entry = state.get(file_name)
+    if not entry or entry.get("url") != url:
+        return False
+    full_path = os.path.join(folder, file_name)
+    return os.path.exists(full_path) and file_sha1(full_path) == entry.get("sha1")
 
+def download_image(session, url, folder, file_name):
+    """下載到暫存檔再改名，中途失敗不會留下半張圖；同名檔直接覆蓋 (不再產生 _1、_2)"""
+    response = session.get(url, timeout=10)
+    response.raise_for_status()
+    full_path = os.path.join(folder, file_name)
+    with open(full_path + ".part", "wb") as f:
+        f.write(response.content)
+    os.replace(full_path + ".part", full_path)
+    return hashlib.sha1(response.content).hexdigest()
+
+def download_all(targets, folder):
+    """
+    targets : [(檔名不含副檔名, 圖片網址)]
+    回傳 (下載數, 略過數, 失敗數)
+    """
+    state = load_state()
+    lock = threading.Lock()
+    jobs = []
+    skipped = 0
+    seen = set()
+    for name, url in targets:
+        file_name = f"{name}.{image_ext(url)}"
+        if file_name in seen:   # 同一個商品出現在多個分類
+            continue
+        seen.add(file_name)
+        if is_unchanged(folder, file_name, url, state):
+            skipped += 1
+            continue
+        jobs.append((file_name, url))
+
+    session = create_session()
+
+    def work(file_name, url):
+        sha1 = download_image(session, url, folder, file_name)
+        with lock:
+            state[file_name] = {"url": url, "sha1": sha1}
+        return file_name
+
+    downloaded = failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            futures = {pool.submit(work, file_name, url): (file_name, url) for file_name, url in jobs}
+            for future in as_completed(futures):
+                file_name, url = futures[future]
+                try:
+                    future.result()
+                    downloaded += 1
+                    print(f"[成功] 下載: {file_name}")
+                except Exception as e:
+                    failed += 1
+                    print(f"[失敗] {file_name} ({url}): {e}")
+    finally:
+        # 中斷 (Ctrl+C) 也把已完成的部分記下來，下次從剩下的繼續
+        session.close()
+        save_state(state)
+    return downloaded, skipped, failed
+
+# ---------- 頁面載入 (明確等待，取代固定 sleep) ----------
+
+PAGE_TIMEOUT = 20     # 等第一批商品出現的上限秒數
+SCROLL_TIMEOUT = 3    # 捲到底後等新內容出現的上限秒數；超過就當作已經到底
+PRODUCT_IMG = (By.CSS_SELECTOR, "img[alt]")
+
+def open_browser():
     # 設定 Selenium (使用無頭模式，即不顯示瀏覽器視窗，若想看過程可註解掉 '--headless')
     chrome_options = Options()
     # chrome_options.add_argument("--headless") 
@@ -66,88 +159,190 @@ def main():
     chrome_options.add_argument("--window-size=1920,1080")
     
     # 偽裝 User-Agent 以防被擋
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
 
     print("啟動瀏覽器中...")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
 
-    try:
-        print(f"前往頁面: {target_url}")
-        driver.get(target_url)
-        
-        # 等待初始載入
-        time.sleep(5)
-
-        # 模擬捲動頁面以觸發 Lazy Loading (圖片懶加載)
-        print("捲動頁面載入所有內容...")
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        while True:
-            # 捲動到底部
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2) # 等待載入
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-        
-        # 解析 HTML
-        print("解析頁面結構...")
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+def load_page_source(driver, url):
+    print(f"前往頁面: {url}")
+    driver.get(url)
+
+    # 等到第一批商品圖片出現就開始，不再固定等 5 秒
+    WebDriverWait(driver, PAGE_TIMEOUT).until(lambda d: d.find_elements(*PRODUCT_IMG))
+
+    # 模擬捲動頁面以觸發 Lazy Loading (圖片懶加載)：
+    # 每次捲到底後等「頁面變高或圖片變多」，一有新內容就繼續捲，等不到才結束
+    print("捲動頁面載入所有內容...")
+    while True:
+        height = driver.execute_script("return document.body.scrollHeight")
+        count = len(driver.find_elements(*PRODUCT_IMG))
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, SCROLL_TIMEOUT, poll_frequency=0.2).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") > height
+                or len(d.find_elements(*PRODUCT_IMG)) > count
+            )
+        except TimeoutException:
+            break
+    return driver.page_source
+
+def parse_products(html, base_url):
+    """回傳 [{"name", "price", "image_url", "file"}]，同名商品 (出現在多個分類) 只留第一個"""
+    soup = BeautifulSoup(html, 'html.parser')
+    images = soup.find_all('img')
+    print(f"找到 {len(images)} 個圖片標籤，開始過濾...")
+
+    products = {}
+    for img in images:
+        src = img.get('src')
+        alt = img.get('alt')
+
+        if not src or not alt:
+            continue
+            
+        full_url = urljoin(base_url, src)
+
+        skip_keywords = ['icon', 'logo', 'arrow', 'banner', 'loading', 'fb', 'line', 'instagram']
+        if any(keyword in alt.lower() for keyword in skip_keywords):
+            continue
         
-        images = soup.find_all('img')
-        download_count = 0
+        # --- 價格抓取邏輯 ---
+        price = ""
+        try:
+            # 往上層找 3 層 parent
+            parents = img.find_parents(limit=3)
+            for parent in parents:
+                text = parent.get_text()
+                # 更新 Regex: 支援 $40, NT$40 等格式
+                price_match = re.search(r'(?:NT)?\$\s*(\d+)', text)
+                if price_match:
+                    price = price_match.group(1)
+                    break 
+        except Exception as e:
+            print(f"找價格時發生小錯誤: {e}")
+
+        # 清理檔名
+        name = sanitize_filename(alt)
         
-        print(f"找到 {len(images)} 個圖片標籤，開始過濾與下載...")
+        # 避免空檔名
+        if not name or name in products:
+            continue
 
-        for img in images:
-            src = img.get('src')
-            alt = img.get('alt')
+        # 檔名沿用 產品名_價格 的格式 (product.csv 的 photo_url 也是這樣)
+        file_stem = f"{name}_{price}" if price else name
+        products[name] = {
+            "name": name,
+            "price": int(price) if price else None,
+            "image_url": full_url,
+            "file": f"{file_stem}.{image_ext(full_url)}",
+        }
+        print(f"發現產品: {file_stem} -> {full_url}")
+    return list(products.values())
 
-            if not src or not alt:
-                continue
-                
-            full_url = urljoin(target_url, src)
 
-            skip_keywords = ['icon', 'logo', 'arrow', 'banner', 'loading', 'fb', 'line', 'instagram']
-            if any(keyword in alt.lower() for keyword in skip_keywords):
-                continue
-            
-            # --- 價格抓取邏輯 ---
-            price = ""
-            try:
-                # 往上層找 3 層 parent
-                parents = img.find_parents(limit=3)
-                for parent in parents:
-                    text = parent.get_text()
-                    # 更新 Regex: 支援 $40, NT$40 等格式
-                    price_match = re.search(r'(?:NT)?\$\s*(\d+)', text)
-                    if price_match:
-                        price = price_match.group(1)
-                        break 
-            except Exception as e:
-                print(f"找價格時發生小錯誤: {e}")
-
-            # 清理檔名
-            safe_name = sanitize_filename(alt)
-            
-            # 如果有找到價格，加入檔名 (格式: 產品名_價格)
-            if price:
-                safe_name = f"{safe_name}_{price}"
-            
-            # 避免空檔名
-            if not safe_name:
-                continue
+# ---------- 商品清單 manifest 與差異 ----------
+# manifest 記錄每個商品的價格、圖片網址、雜湊與第一次 / 最後一次看到的時間；
+# 和上一次比較後輸出 catalog_diff.json，交給 flask --app web apply-catalog-diff 只更新有變動的商品
+
+CRAWLER_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(CRAWLER_DIR, "catalog_manifest.json")
+DIFF_PATH = os.path.join(CRAWLER_DIR, "catalog_diff.json")
+
+def load_json(path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+def write_json(path, data):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+def photo_url(file_name):
+    return f"static/product_images/{file_name}"
+
+def update_manifest(products, state, now):
+    """
+    把這次爬到的商品併進 manifest，回傳 (manifest, diff)
+    removed 只列出「上次還在、這次沒出現」的商品；manifest 仍保留它們 (last_seen 停在最後看到的時間)
+    """
+    manifest = load_json(MANIFEST_PATH, {"products": {}})
+    old = manifest["products"]
+    diff = {"generated_at": now, "added": [], "removed": [], "repriced": []}
+
+    current = set()
+    for p in products:
+        name = p["name"]
+        current.add(name)
+        entry = old.get(name)
+        change = {"name": name, "price": p["price"], "photo_url": photo_url(p["file"])}
+        if entry is None:
+            diff["added"].append(change)
+            entry = {"first_seen": now}
+        elif entry.get("removed"):
+            # 下架後又重新上架：算新增，first_seen 保留最早的時間
+            diff["added"].append(change)
+        elif entry["price"] != p["price"]:
+            diff["repriced"].append(dict(change, old_price=entry["price"]))
 
-            print(f"發現產品: {safe_name} -> {full_url}")
-            download_image(full_url, output_folder, safe_name)
-            download_count += 1
+        entry.update(
+            price=p["price"], image_url=p["image_url"], file=p["file"],
+            sha1=state.get(p["file"], {}).get("sha1"), last_seen=now, removed=False,
+        )
+        old[name] = entry
 
-        print(f"\n任務完成！共下載 {download_count} 張圖片，儲存於 '{output_folder}' 資料夾。")
+    for name, entry in old.items():
+        if name not in current and not entry.get("removed"):
+            entry["removed"] = True
+            diff["removed"].append({"name": name, "price": entry["price"]})
 
-    except Exception as e:
-        print(f"發生錯誤: {e}")
+    manifest["updated_at"] = now
+    return manifest, diff
+
+def main():
+    target_url = "https://order.quickclick.cc/tw/food/P_kKKKKMjer/"
+    
+    # 使用相對路徑 (前提：必須在 crawler 資料夾內執行 python crawler.py)
+    output_folder = "../static/product_images"
+
+    # 建立輸出資料夾
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+
+    driver = open_browser()
+    try:
+        html = load_page_source(driver, target_url)
+    except TimeoutException:
+        print(f"發生錯誤: {PAGE_TIMEOUT} 秒內沒有載入任何商品")
+        return
     finally:
+        # 頁面抓完就可以關掉瀏覽器，下載交給 thread pool 並行處理
         driver.quit()
 
+    print("解析頁面結構...")
+    products = parse_products(html, target_url)
+    if not products:
+        # 頁面改版或被擋時不要把所有商品都當成下架
+        print("沒有解析到任何商品，不更新 manifest")
+        return
+
+    targets = [(os.path.splitext(p["file"])[0], p["image_url"]) for p in products]
+    print(f"\n共 {len(targets)} 個商品，開始下載 (同時 {DOWNLOAD_WORKERS} 條連線)...")
+    downloaded, skipped, failed = download_all(targets, output_folder)
+    print(f"\n下載 {downloaded} 張、未變動略過 {skipped} 張、失敗 {failed} 張，儲存於 '{output_folder}' 資料夾。")
+
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    manifest, diff = update_manifest(products, load_state(), now)
+    write_json(MANIFEST_PATH, manifest)
+    write_json(DIFF_PATH, diff)
+
+    print(f"\n商品異動：新增 {len(diff['added'])}、下架 {len(diff['removed'])}、改價 {len(diff['repriced'])}")
+    for p in diff["repriced"]:
+        print(f"  改價 {p['name']}: {p['old_price']} -> {p['price']}")
+    print(f"差異已寫入 {DIFF_PATH}，執行 flask --app web apply-catalog-diff 套用到資料庫")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
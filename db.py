@@ -0,0 +1,726 @@
+import csv
+import itertools
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_PATH = os.path.join(BASE_DIR, "sql", "sql_database.sql")
+MIGRATIONS_DIR = os.path.join(BASE_DIR, "sql", "migrations")
+SEED_DIR = os.path.join(BASE_DIR, "database_data")
+
+# 匯入種子資料的順序 (外鍵相依：store / product / customer 沒有外鍵)
+SEED_TABLES = ["store", "product", "customer"]
+
+# 主鍵由資料庫產生的資料表 → 主鍵欄位；匯入時要保留 CSV 內的編號
+# 全新安裝是 IDENTITY，經由 migrations/001_identity_keys.sql 升級的資料庫則是 SEQUENCE (<欄位>_seq) + DEFAULT
+IDENTITY_TABLES = {"customer": "customer_id", "[order]": "order_id", "item": "item_id"}
+
+SCHEMA_VERSION_DDL = """
+CREATE TABLE schema_version
+(
+    version     INT,
+    name        NVARCHAR(100),
+    applied_at  DATETIME2 DEFAULT (SYSUTCDATETIME()),
+    PRIMARY KEY (version)
+);
+"""
+
+
+# ================== 儲存後端 ==================
+#
+# web.py 只透過 backend.connect() 取得 DB-API 連線，SQL 盡量寫成兩邊都吃得下的語法：
+#   - 用 COALESCE 取代 ISNULL
+#   - 中文字串一律用 ? 參數傳入，不寫 N'...'
+#   - [order] 這種中括號識別字 SQLite 也支援
+# 用環境變數 DB_BACKEND 切換：mssql (預設，Azure SQL) / sqlite (本機壓測、profiling 用)
+
+
+def read_script(path):
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return f.read()
+
+
+def split_batches(script):
+    """把 T-SQL 腳本依 GO 切成多個 batch，並略過 USE xxx; (連線字串已經指定資料庫)"""
+    batches = re.split(r"^\s*GO\s*$", script, flags=re.MULTILINE | re.IGNORECASE)
+    result = []
+    for batch in batches:
+        batch = re.sub(r"^\s*USE\s+\w+\s*;?\s*$", "", batch, flags=re.MULTILINE | re.IGNORECASE)
+        if batch.strip():
+            result.append(batch)
+    return result
+
+
+def read_seed_csv(table, folder=SEED_DIR):
+    """回傳 (欄位名稱, 資料列)，檔名即資料表名稱 (與 python_sql_insert/sql_insert.py 相同規則)"""
+    with open(os.path.join(folder, f"{table}.csv"), "r", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        columns = next(reader)
+        rows = [row for row in reader if row]
+    return columns, rows
+
+
+def write_seed_csv(table, columns, rows, folder=SEED_DIR):
+    """read_seed_csv 的反向；先寫暫存檔再改名，寫到一半中斷也不會弄壞原檔"""
+    path = os.path.join(folder, f"{table}.csv")
+    with open(path + ".tmp", "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+    os.replace(path + ".tmp", path)
+
+
+def table_sql_name(table):
+    """CSV 檔名 → SQL 裡的資料表名稱 (order 是保留字，要加中括號)"""
+    return "[order]" if table == "order" else table
+
+
+def iter_csv_batches(path, batch_size):
+    """
+    逐批讀取 CSV，記憶體只放得下一批；回傳 (欄位名稱, 批次 generator)
+    空字串視為 NULL (例如尚未結帳的 tot_price)
+    """
+    f = open(path, "r", encoding="utf-8-sig", newline="")
+    reader = csv.reader(f)
+    columns = next(reader)
+
+    def batches():
+        with f:
+            while True:
+                batch = [
+                    [value if value != "" else None for value in row]
+                    for row in itertools.islice(reader, batch_size) if row
+                ]
+                if not batch:
+                    return
+                yield batch
+
+    return columns, batches()
+
+
+def load_csv(backend, conn, table, path, batch_size=5000, report=None):
+    """
+    把一個 CSV 串流匯入資料表：每批一次 executemany (mssql 用 fast_executemany)，整張表一個交易
+    report(table, rows, seconds) 每批呼叫一次，可用來印進度；回傳匯入筆數
+    """
+    name = table_sql_name(table)
+    columns, batches = iter_csv_batches(path, batch_size)
+    cursor = conn.cursor()
+    started = time.monotonic()
+    rows = 0
+    try:
+        backend.identity_insert(cursor, name, True)
+        for batch in batches:
+            backend.bulk_insert(cursor, name, columns, batch)
+            rows += len(batch)
+            if report:
+                report(table, rows, time.monotonic() - started)
+        backend.identity_insert(cursor, name, False)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return rows
+
+
+def list_migrations(folder=MIGRATIONS_DIR):
+    """回傳 [(版本, 名稱, 路徑)]，檔名格式為 001_identity_keys.sql"""
+    result = []
+    if not os.path.isdir(folder):
+        return result
+    for file_name in sorted(os.listdir(folder)):
+        match = re.match(r"^(\d+)_(\w+)\.sql$", file_name)
+        if match:
+            result.append((int(match.group(1)), match.group(2), os.path.join(folder, file_name)))
+    return result
+
+
+def apply_migrations(backend, conn, folder=MIGRATIONS_DIR):
+    """依序套用尚未執行的 migration，每一個 migration 一個交易；回傳套用的版本清單"""
+    if not backend.has_table(conn, "schema_version"):
+        backend.run_script(conn, SCHEMA_VERSION_DDL)
+        conn.commit()
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT version FROM schema_version")
+    done = {row[0] for row in cursor.fetchall()}
+
+    applied = []
+    for version, name, path in list_migrations(folder):
+        if version in done:
+            continue
+        try:
+            backend.run_script(conn, read_script(path))
+            conn.execute("INSERT INTO schema_version (version, name) VALUES (?, ?)", (version, name))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append((version, name))
+    return applied
+
+
+class SqlServerBackend:
+    name = "mssql"
+
+    def __init__(self, conn_str):
+        self.conn_str = conn_str
+
+    def connect(self):
+        # pyodbc 只有在真的要連 SQL Server 時才需要 (本機用 SQLite 不必裝 ODBC Driver)
+        import pyodbc
+        return pyodbc.connect(self.conn_str)
+
+    @property
+    def IntegrityError(self):
+        """違反唯一索引 / 外鍵時丟出的例外類別"""
+        import pyodbc
+        return pyodbc.IntegrityError
+
+    # pyodbc 的訊息結尾帶著 SQL Server 原生錯誤碼，例如 "... (2601) (SQLExecDirectW)"
+    # 2601 = 唯一索引重複、2627 = 唯一 / 主鍵限制重複 (外鍵錯誤是 547)
+    DUPLICATE_KEY_ERRORS = re.compile(r"\((2601|2627)\)")
+
+    def is_duplicate_key(self, exc, table, column, index):
+        """IntegrityError 是否為違反指定的唯一索引 (而不是外鍵之類的其他限制)
+        先看原生錯誤碼 (訊息文字可能是中文或其他語系)，再確認是哪個索引 (索引名稱不會被翻譯)"""
+        text = " ".join(str(arg) for arg in exc.args)
+        return bool(self.DUPLICATE_KEY_ERRORS.search(text)) and f"'{index}'" in text
+
+    def run_script(self, conn, script):
+        cursor = conn.cursor()
+        for batch in split_batches(script):
+            cursor.execute(batch)
+
+    def init_schema(self, conn):
+        self.run_script(conn, read_script(SCHEMA_PATH))
+        conn.commit()
+
+    def has_table(self, conn, table):
+        cursor = conn.cursor()
+        cursor.execute("SELECT OBJECT_ID(?, 'U')", (table,))
+        return cursor.fetchone()[0] is not None
+
+    def seed(self, conn, folder=SEED_DIR):
+        for table in SEED_TABLES:
+            load_csv(self, conn, table, os.path.join(folder, f"{table}.csv"))
+
+    def identity_insert(self, cursor, table, on):
+        """
+        匯入前 (on=True) / 後 (on=False) 呼叫，讓 CSV 內的固定編號寫得進去、匯入後新增的資料不會撞號
+          IDENTITY：打開 / 關閉 IDENTITY_INSERT (寫入比目前值大的編號時 SQL Server 會自動往前推)
+          SEQUENCE：本來就能直接寫入；匯入後把序號推到 MAX(主鍵) + 1
+        """
+        key = IDENTITY_TABLES.get(table)
+        if key is None:
+            return
+        cursor.execute("SELECT COLUMNPROPERTY(OBJECT_ID(?), ?, 'IsIdentity')", (table, key))
+        if cursor.fetchone()[0] == 1:
+            cursor.execute(f"SET IDENTITY_INSERT {table} {'ON' if on else 'OFF'}")
+        elif not on:
+            self._restart_sequence(cursor, table, key)
+
+    def _restart_sequence(self, cursor, table, key):
+        sequence = f"{key}_seq"
+        cursor.execute(f"""
+            SELECT CAST(s.current_value AS BIGINT), (SELECT MAX({key}) FROM {table})
+            FROM sys.sequences s
+            WHERE s.object_id = OBJECT_ID(?, 'SO')
+        """, (sequence,))
+        row = cursor.fetchone()
+        if row is None or row[1] is None or row[1] <= row[0]:
+            return   # 沒有序號、沒有資料，或序號已經超過匯入的編號 (序號不往回調)
+        # RESTART WITH 只接受常數，只能組字串 (值來自上面的查詢，不是使用者輸入)
+        cursor.execute(f"ALTER SEQUENCE {sequence} RESTART WITH {int(row[1]) + 1}")
+
+    def bulk_insert(self, cursor, table, columns, rows):
+        """多筆 INSERT；fast_executemany 會把所有參數打包成一次送出 (不 commit)"""
+        if not rows:
+            return
+        placeholders = ", ".join("?" for _ in columns)
+        cursor.fast_executemany = True
+        cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+
+    def increment_rows(self, cursor, table, keys, values, rows):
+        """
+        累加式 upsert：鍵值已存在就把 values 欄位加上去，不存在就新增 (不 commit)
+        rows 每一列為 keys + values 的值；HOLDLOCK 讓同時結帳的兩個交易不會都判斷成「不存在」
+        """
+        if not rows:
+            return
+        columns = list(keys) + list(values)
+        cursor.executemany(f"""
+            MERGE {table} WITH (HOLDLOCK) AS t
+            USING (VALUES ({", ".join("?" for _ in columns)})) AS s ({", ".join(columns)})
+            ON {" AND ".join(f"t.{k} = s.{k}" for k in keys)}
+            WHEN MATCHED THEN
+                UPDATE SET {", ".join(f"t.{v} = t.{v} + s.{v}" for v in values)}
+            WHEN NOT MATCHED THEN
+                INSERT ({", ".join(columns)}) VALUES ({", ".join(f"s.{c}" for c in columns)});
+        """, rows)
+
+    def limit_clause(self, n):
+        """接在 ORDER BY 後面，只取前 n 筆"""
+        return f"OFFSET 0 ROWS FETCH NEXT {int(n)} ROWS ONLY"
+
+    def insert_returning(self, cursor, table, columns, values, key):
+        """INSERT 一筆並在同一個 round trip 取回資料庫產生的主鍵"""
+        placeholders = ", ".join("?" for _ in columns)
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) OUTPUT INSERTED.{key} VALUES ({placeholders})",
+            values,
+        )
+        return cursor.fetchone()[0]
+
+    def find_or_create(self, cursor, table, column, value, key):
+        """
+        依唯一欄位找出一列，不存在就新增；一個敘述 (一次 round trip) 取回主鍵 (不 commit)
+        HOLDLOCK 鎖住「這個值」的範圍，兩個 request 同時用同一支電話登入也只會新增一筆。
+        已存在時做一次不改值的 UPDATE，OUTPUT 才會回傳那一列。
+        """
+        cursor.execute(f"""
+            MERGE {table} WITH (HOLDLOCK) AS t
+            USING (VALUES (?)) AS s ({column})
+            ON t.{column} = s.{column}
+            WHEN MATCHED THEN
+                UPDATE SET t.{column} = s.{column}
+            WHEN NOT MATCHED THEN
+                INSERT ({column}) VALUES (s.{column})
+            OUTPUT INSERTED.{key};
+        """, (value,))
+        return cursor.fetchone()[0]
+
+    def explain(self, conn, sql, params=()):
+        """回傳估計執行計畫 (SHOWPLAN_TEXT 必須獨立一個 batch 開關)"""
+        cursor = conn.cursor()
+        cursor.execute("SET SHOWPLAN_TEXT ON")
+        try:
+            cursor.execute(sql, params)
+            lines = []
+            while True:
+                lines.extend(row[0] for row in cursor.fetchall())
+                if not cursor.nextset():
+                    break
+            return lines
+        finally:
+            cursor.execute("SET SHOWPLAN_TEXT OFF")
+
+
+class SqliteBackend:
+    name = "sqlite"
+
+    # T-SQL → SQLite 的語法改寫 (只處理 sql/ 底下腳本實際用到的部分)
+    #   x INT IDENTITY(1,1) + PRIMARY KEY (x) → x INTEGER PRIMARY KEY AUTOINCREMENT (見 translate)
+    #   SQLite 沒有 NONCLUSTERED / INCLUDE (...)，索引只保留鍵值欄位
+    #   DROP INDEX x ON table → DROP INDEX x
+    #   IF EXISTS (查詢) THROW n, N'訊息', s; → 在 Python 端執行 SELECT EXISTS (查詢)，成立就丟出例外 (見 run_script)
+    IDENTITY_COLUMN = re.compile(r"\b(\w+)\s+INT\s+IDENTITY\s*\(\s*\d+\s*,\s*\d+\s*\)", re.IGNORECASE)
+
+    REWRITES = [
+        (r"\bNONCLUSTERED\s+", ""),
+        (r"\s+INCLUDE\s*\([^)]*\)", ""),
+        (r"\bSYSUTCDATETIME\(\)", "CURRENT_TIMESTAMP"),
+        (r"\bDROP\s+INDEX\s+(\w+)\s+ON\s+[\w\[\]]+", r"DROP INDEX \1"),
+        (r"\bN'", "'"),
+    ]
+
+    GUARD = re.compile(
+        r"^(?:\s|--[^\n]*)*IF\s+EXISTS\s*\((?P<query>.*)\)\s*THROW\s+\d+\s*,\s*N?'(?P<message>(?:[^']|'')*)'\s*,\s*\d+\s*;\s*$",
+        re.IGNORECASE | re.DOTALL,
+    )
+
+    IntegrityError = sqlite3.IntegrityError
+
+    def is_duplicate_key(self, exc, table, column, index):
+        """IntegrityError 是否為違反指定的唯一索引 (SQLite 的訊息只有欄位名稱，沒有索引名稱)"""
+        return str(exc) == f"UNIQUE constraint failed: {table}.{column}"
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # 連線池會在不同 thread 之間轉手，因此關掉 check_same_thread
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def translate(self, batch):
+        # 沒有 AUTOINCREMENT 的 rowid 會重複使用 max(rowid) + 1：最新的訂單被封存搬走後，
+        # 下一張訂單會拿到同一個 order_id，和 order_archive 撞號。
+        # AUTOINCREMENT 只能寫在欄位上，所以把表格層級的 PRIMARY KEY (x) 移到欄位定義
+        for column in self.IDENTITY_COLUMN.findall(batch):
+            table_key = rf"PRIMARY\s+KEY\s*\(\s*{column}\s*\)"
+            batch, n = re.subn(table_key + r"\s*,", "", batch, flags=re.IGNORECASE)
+            if not n:
+                batch = re.sub(r",\s*" + table_key, "", batch, flags=re.IGNORECASE)
+        batch = self.IDENTITY_COLUMN.sub(r"\1 INTEGER PRIMARY KEY AUTOINCREMENT", batch)
+        for pattern, repl in self.REWRITES:
+            batch = re.sub(pattern, repl, batch, flags=re.IGNORECASE)
+        return batch
+
+    def run_script(self, conn, script):
+        # executescript 會先偷偷 COMMIT 目前的交易，因此改成逐句執行
+        for batch in split_batches(script):
+            buffer = ""
+            for line in self.translate(batch).splitlines(keepends=True):
+                buffer += line
+                if sqlite3.complete_statement(buffer):
+                    self._execute(conn, buffer)
+                    buffer = ""
+            if buffer.strip() and not re.fullmatch(r"(\s|--[^\n]*)*", buffer):
+                self._execute(conn, buffer)
+
+    def _execute(self, conn, statement):
+        guard = self.GUARD.match(statement)
+        if guard is None:
+            conn.execute(statement)
+        elif conn.execute(f"SELECT EXISTS ({guard['query']})").fetchone()[0]:
+            raise sqlite3.DatabaseError(guard["message"].replace("''", "'"))
+
+    def init_schema(self, conn):
+        self.run_script(conn, read_script(SCHEMA_PATH))
+        conn.commit()
+
+    def has_table(self, conn, table):
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        return row is not None
+
+    def seed(self, conn, folder=SEED_DIR):
+        for table in SEED_TABLES:
+            load_csv(self, conn, table, os.path.join(folder, f"{table}.csv"))
+
+    def identity_insert(self, cursor, table, on):
+        """SQLite 的 INTEGER PRIMARY KEY 可以直接寫入指定編號"""
+
+    def bulk_insert(self, cursor, table, columns, rows):
+        """多筆 INSERT (不 commit)"""
+        if not rows:
+            return
+        placeholders = ", ".join("?" for _ in columns)
+        cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+
+    def increment_rows(self, cursor, table, keys, values, rows):
+        """累加式 upsert：鍵值已存在就把 values 欄位加上去，不存在就新增 (不 commit)"""
+        if not rows:
+            return
+        columns = list(keys) + list(values)
+        cursor.executemany(f"""
+            INSERT INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" for _ in columns)})
+            ON CONFLICT ({", ".join(keys)}) DO UPDATE SET
+                {", ".join(f"{v} = {v} + excluded.{v}" for v in values)}
+        """, rows)
+
+    def limit_clause(self, n):
+        """接在 ORDER BY 後面，只取前 n 筆"""
+        return f"LIMIT {int(n)}"
+
+    def insert_returning(self, cursor, table, columns, values, key):
+        """INSERT 一筆並在同一個 round trip 取回資料庫產生的主鍵"""
+        placeholders = ", ".join("?" for _ in columns)
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) RETURNING {key}",
+            values,
+        )
+        return cursor.fetchone()[0]
+
+    def find_or_create(self, cursor, table, column, value, key):
+        """
+        依唯一欄位找出一列，不存在就新增；一個敘述取回主鍵 (不 commit)
+        唯一索引是 partial index (WHERE column IS NOT NULL)，ON CONFLICT 要寫出相同條件才對得上
+        """
+        cursor.execute(f"""
+            INSERT INTO {table} ({column}) VALUES (?)
+            ON CONFLICT ({column}) WHERE {column} IS NOT NULL DO UPDATE SET {column} = excluded.{column}
+            RETURNING {key}
+        """, (value,))
+        return cursor.fetchone()[0]
+
+    def explain(self, conn, sql, params=()):
+        rows = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        return [row[-1] for row in rows]
+
+
+def create_backend(name=None):
+    """依設定建立後端 (預設讀環境變數 DB_BACKEND)"""
+    name = (name or os.environ.get("DB_BACKEND", "mssql")).lower()
+
+    if name == "sqlite":
+        path = os.environ.get("SQLITE_PATH", os.path.join(BASE_DIR, "instance", "drinkshop.sqlite3"))
+        return SqliteBackend(path)
+
+    if name == "mssql":
+        # ---------- Azure SQL Connection Config ----------
+        server = os.environ.get("MSSQL_SERVER", "drinkshop-sqlserver.database.windows.net,1433")
+        database = os.environ.get("MSSQL_DATABASE", "DrinkShopDB")
+        username = os.environ.get("MSSQL_USERNAME", "drinkshopadmin")
+        password = os.environ.get("MSSQL_PASSWORD", "DrinkShop2025")
+        conn_str = (
+            "DRIVER={ODBC Driver 17 for SQL Server};"
+            f"SERVER={server};"
+            f"DATABASE={database};"
+            f"UID={username};"
+            f"PWD={password};"
+            "Encrypt=yes;"
+            "TrustServerCertificate=no;"
+            "Connection Timeout=30;"
+        )
+        return SqlServerBackend(conn_str)
+
+    raise ValueError(f"不支援的 DB_BACKEND: {name}")
+
+
+# ================== 資料庫連線池 ==================
+#
+# 每個 request 都 pyodbc.connect() 一次，等於每次都要跟 Azure SQL 重新做 TLS 握手。
+# 這裡改成每個 process 維護一組可重複使用的連線：
+#   - gunicorn fork 出來的 worker 不會沿用 master 的連線 (以 pid 判斷，fork 後重建)
+#   - 同一個 worker 內的多個 thread 以 Condition 互斥，取不到連線時排隊等待
+#   - 取出時檢查連線是否健康、超過壽命的連線會被回收重建
+
+
+class PoolTimeout(Exception):
+    """等待可用連線超過 timeout"""
+
+
+class ConnectionPool:
+    def __init__(self, connect, min_size=1, max_size=10, timeout=10,
+                 recycle=1800, ping_after=30, ping_sql="SELECT 1"):
+        """
+        connect     : 建立新連線的函式
+        min_size    : fill() 預先建立的連線數
+        max_size    : 同時存在的連線上限 (使用中 + 閒置)
+        timeout     : 連線全部被占用時，最多等待幾秒
+        recycle     : 連線存活超過幾秒就關掉重建 (避免被 Azure 閘道端默默切斷)
+        ping_after  : 連線閒置超過幾秒，取出前先執行 ping_sql 確認健康 (0 = 每次都檢查)
+        """
+        if min_size > max_size:
+            raise ValueError("min_size 不可大於 max_size")
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_after = ping_after
+        self.ping_sql = ping_sql
+
+        self._cond = threading.Condition()
+        self._reset_state()
+
+    def _reset_state(self):
+        # idle 內每筆為 (conn, 最後歸還時間)；建立時間另外記在 _created_at
+        self._pid = os.getpid()
+        self._idle = deque()
+        self._created_at = {}
+        self._size = 0
+        self._in_use = 0
+        self._warmed = False
+        self._counters = {
+            "checkouts": 0,
+            "created": 0,
+            "recycled": 0,
+            "failed_health_checks": 0,
+            "discarded": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def _check_fork(self):
+        # fork 後子 process 不可以使用父 process 的 socket，直接丟掉 (不要 close，以免影響父 process)
+        if self._pid != os.getpid():
+            self._cond = threading.Condition()
+            self._reset_state()
+
+    def _open(self):
+        conn = self._connect()
+        with self._cond:
+            self._created_at[id(conn)] = time.monotonic()
+            self._counters["created"] += 1
+        return conn
+
+    def _close_quietly(self, conn):
+        self._created_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, conn):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(self.ping_sql)
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def fill(self):
+        """預先建立 min_size 條連線 (worker 啟動時呼叫可避免第一批 request 等握手)"""
+        self._check_fork()
+        while True:
+            with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._open()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+
+    def warm_up(self):
+        """每個 process 第一次呼叫時在背景執行 fill()，不占用當下的 request；
+        gunicorn fork 出來的 worker 會各自重新觸發一次"""
+        if self._warmed and self._pid == os.getpid():
+            return
+        self._check_fork()
+        with self._cond:
+            if self._warmed:
+                return
+            self._warmed = True
+        threading.Thread(target=self._fill_quietly, name="db-pool-fill", daemon=True).start()
+
+    def _fill_quietly(self):
+        try:
+            self.fill()
+        except Exception:
+            pass   # 資料庫暫時連不上：之後的 request 取用時會自己建立連線 (並回報錯誤)
+
+    def acquire(self):
+        self._check_fork()
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        wait_start = None
+
+        while True:
+            with self._cond:
+                # 1. 先拿閒置的連線
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if not waited:
+                        waited = True
+                        wait_start = time.monotonic()
+                        self._counters["waits"] += 1
+                    if remaining <= 0:
+                        self._counters["timeouts"] += 1
+                        self._counters["wait_seconds"] += time.monotonic() - wait_start
+                        raise PoolTimeout(f"等待資料庫連線超過 {self.timeout} 秒")
+                    self._cond.wait(remaining)
+
+                if waited:
+                    self._counters["wait_seconds"] += time.monotonic() - wait_start
+                    waited = False
+
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    self._in_use += 1
+                    new_conn = False
+                else:
+                    # 2. 沒有閒置的，但還沒到上限 → 先佔位再建立新連線 (建立時不持有鎖)
+                    self._size += 1
+                    self._in_use += 1
+                    new_conn = True
+
+            if new_conn:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._counters["checkouts"] += 1
+                return conn
+
+            # 3. 檢查閒置連線：超過壽命就回收，閒置太久就先 ping
+            now = time.monotonic()
+            created_at = self._created_at.get(id(conn), now)
+            if self.recycle and now - created_at > self.recycle:
+                self._drop(conn, "recycled")
+                continue
+            if now - last_used >= self.ping_after and not self._is_healthy(conn):
+                self._drop(conn, "failed_health_checks")
+                continue
+
+            with self._cond:
+                self._counters["checkouts"] += 1
+            return conn
+
+    def _drop(self, conn, reason):
+        self._close_quietly(conn)
+        with self._cond:
+            self._size -= 1
+            self._in_use -= 1
+            self._counters[reason] += 1
+            self._cond.notify()
+
+    def release(self, conn, discard=False):
+        """歸還連線；未 commit 的交易一律 rollback，避免下一個使用者接手半套交易"""
+        if self._pid != os.getpid():
+            return
+        if not discard:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        if discard:
+            self._drop(conn, "discarded")
+            return
+
+        with self._cond:
+            self._in_use -= 1
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """with pool.connection() as conn: ... 不論是否發生例外都會歸還連線"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            # 連線本身可能已經壞掉 (例如網路中斷)，release 內 rollback 失敗就會丟掉
+            self.release(conn)
+
+    def close_all(self):
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self):
+        with self._cond:
+            data = dict(self._counters)
+            data.update({
+                "pid": self._pid,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+            })
+        return data
@@ -0,0 +1,19 @@
+import os
+
+
+# ================== gunicorn 設定 ==================
+#
+# gunicorn 啟動時會自動讀取目前目錄的 gunicorn.conf.py (Azure 部署的啟動指令也明確指定了這個檔案)。
+# 店家平板以 SSE (/admin_orders/stream) 訂閱待處理訂單，每條連線會占住一條 thread 好幾分鐘；
+# 預設的 sync worker 一次只能服務一個 request，幾台平板開著就會把所有 worker 占滿、整個網站沒有回應。
+# 因此改用 gthread：每個 worker 有 GUNICORN_THREADS 條 thread，SSE 只占其中一條。
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", 2))
+# 同時開著的平板數 + 一般 request 的併發量；資料庫連線另由 DB_POOL_MAX 限制
+threads = int(os.environ.get("GUNICORN_THREADS", 32))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+# 重新部署時等進行中的 request (含 SSE，最長 ORDER_FEED_MAX_AGE 秒) 結束的時間，超過就強制結束
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+accesslog = "-"
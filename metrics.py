@@ -0,0 +1,305 @@
+import logging
+import random
+import threading
+import time
+
+
+# ================== 每個 request 的耗時與資料庫統計 ==================
+#
+# 每個 request 都會記錄「路由、狀態碼、總耗時」(只多兩次 perf_counter)。
+# 另外依 sample_rate 抽樣一部分 request 做詳細量測：
+#   - 資料庫：查詢次數、查詢耗時 (execute + fetch)、取回筆數
+#   - 模板：render_template 耗時 (Flask 的 before_render_template / template_rendered signal)
+#   - 超過 slow_query_ms 的查詢連同 SQL 與參數寫進 log
+# 統計值以 Prometheus 文字格式從 /metrics 輸出。
+# 注意：數字是「每個 process」各自累計，gunicorn 多個 worker 時每次抓到的是其中一個 worker 的值。
+
+logger = logging.getLogger("drinkshop.metrics")
+
+# request 耗時 histogram 的上界 (秒)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class RequestStats:
+    """單一個抽樣中的 request 累計的數字"""
+
+    __slots__ = ("db_queries", "db_seconds", "db_rows", "render_seconds", "_render_started")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.db_rows = 0
+        self.render_seconds = 0.0
+        self._render_started = None
+
+
+class InstrumentedCursor:
+    """把 execute / fetch 的耗時與筆數記到目前 request 的 RequestStats，其餘屬性直接轉給原本的 cursor"""
+
+    def __init__(self, cursor, stats, metrics):
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_stats", stats)
+        object.__setattr__(self, "_metrics", metrics)
+        object.__setattr__(self, "_sql", None)
+        object.__setattr__(self, "_params", None)
+        object.__setattr__(self, "_elapsed", 0.0)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        # 例如 bulk_insert 會設定 cursor.fast_executemany
+        setattr(self._cursor, name, value)
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def _timed(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stats.db_seconds += elapsed
+            object.__setattr__(self, "_elapsed", self._elapsed + elapsed)
+
+    def _begin(self, sql, params):
+        self._finish()
+        self._stats.db_queries += 1
+        object.__setattr__(self, "_sql", sql)
+        object.__setattr__(self, "_params", params)
+        object.__setattr__(self, "_elapsed", 0.0)
+
+    def _finish(self):
+        """一個查詢的 execute + fetch 都結束後 (下一次 execute 或 cursor 用完) 才判斷是否為慢查詢"""
+        if self._sql is not None:
+            self._metrics.check_slow_query(self._sql, self._params, self._elapsed)
+            object.__setattr__(self, "_sql", None)
+
+    def execute(self, sql, params=()):
+        self._begin(sql, params)
+        self._timed(self._cursor.execute, sql, params)
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        self._begin(sql, f"<{len(seq_of_params)} rows>")
+        self._timed(self._cursor.executemany, sql, seq_of_params)
+        return self
+
+    def fetchone(self):
+        row = self._timed(self._cursor.fetchone)
+        if row is not None:
+            self._stats.db_rows += 1
+        return row
+
+    def fetchall(self):
+        rows = self._timed(self._cursor.fetchall)
+        self._stats.db_rows += len(rows)
+        self._finish()
+        return rows
+
+    def fetchmany(self, size=None):
+        rows = self._timed(self._cursor.fetchmany, *(() if size is None else (size,)))
+        self._stats.db_rows += len(rows)
+        return rows
+
+
+class InstrumentedConnection:
+    def __init__(self, conn, stats, metrics):
+        self._conn = conn
+        self._stats = stats
+        self._metrics = metrics
+        self._cursors = []
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self):
+        cursor = InstrumentedCursor(self._conn.cursor(), self._stats, self._metrics)
+        self._cursors.append(cursor)
+        return cursor
+
+    def execute(self, sql, params=()):
+        # pyodbc / sqlite3 的 connection.execute 都是「開一個 cursor 再 execute」的捷徑
+        return self.cursor().execute(sql, params)
+
+    def close_cursors(self):
+        for cursor in self._cursors:
+            cursor._finish()
+        self._cursors.clear()
+
+
+class RequestMetrics:
+    def __init__(self, sample_rate=0.05, slow_query_ms=200, namespace="drinkshop"):
+        """
+        sample_rate   : 0 ~ 1，多少比例的 request 做資料庫 / 模板的詳細量測
+        slow_query_ms : 超過這個毫秒數的查詢寫進 log (只有被抽樣的 request 會量)
+        """
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+        self.namespace = namespace
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._requests = {}   # (route, method, status) -> 次數
+        self._durations = {}  # route -> [各 bucket 次數..., 總秒數, 次數]
+        self._sampled = {}    # route -> [次數, 查詢數, 查詢秒數, 筆數, 模板秒數]
+        self.slow_queries = 0
+
+    # ---------- 接上 Flask ----------
+
+    def init_app(self, app):
+        from flask import before_render_template, request, template_rendered
+
+        @app.before_request
+        def _start_request():
+            self._local.started = time.perf_counter()
+            sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+            self._local.stats = RequestStats() if sampled else None
+
+        @app.teardown_request
+        def _end_request(exc=None):
+            started = getattr(self._local, "started", None)
+            if started is None:
+                return
+            # SSE 這種長連線的耗時沒有意義 (連線多久就算多久)，只計次數
+            route = request.url_rule.rule if request.url_rule else "<unmatched>"
+            status = getattr(self._local, "status", 500 if exc else 200)
+            self._record(route, request.method, status, time.perf_counter() - started,
+                         self._local.stats, timed=not getattr(self._local, "streaming", False))
+            self._local.started = None
+            self._local.stats = None
+            self._local.streaming = False
+
+        @app.after_request
+        def _remember_status(response):
+            self._local.status = response.status_code
+            self._local.streaming = response.is_streamed
+            return response
+
+        def _before_render(sender, template, context, **extra):
+            stats = self.current()
+            if stats is not None:
+                stats._render_started = time.perf_counter()
+
+        def _after_render(sender, template, context, **extra):
+            stats = self.current()
+            if stats is not None and stats._render_started is not None:
+                stats.render_seconds += time.perf_counter() - stats._render_started
+                stats._render_started = None
+
+        before_render_template.connect(_before_render, app, weak=False)
+        template_rendered.connect(_after_render, app, weak=False)
+
+    def current(self):
+        """目前 thread 正在處理、而且被抽樣的 request；沒有就回傳 None"""
+        return getattr(self._local, "stats", None)
+
+    def wrap(self, conn):
+        """被抽樣的 request 才包一層量測用的 proxy，其他情況 (背景 thread、沒抽到) 原樣回傳"""
+        stats = self.current()
+        if stats is None:
+            return conn
+        return InstrumentedConnection(conn, stats, self)
+
+    def check_slow_query(self, sql, params, elapsed):
+        if elapsed * 1000 < self.slow_query_ms:
+            return
+        with self._lock:
+            self.slow_queries += 1
+        logger.warning("slow query %.1f ms: %s | params=%r", elapsed * 1000, " ".join(sql.split()), params)
+
+    # ---------- 統計 ----------
+
+    def _record(self, route, method, status, seconds, stats, timed=True):
+        with self._lock:
+            key = (route, method, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            if not timed:
+                return
+            hist = self._durations.get(route)
+            if hist is None:
+                hist = self._durations[route] = [0] * len(DURATION_BUCKETS) + [0.0, 0]
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    hist[i] += 1
+            hist[-2] += seconds
+            hist[-1] += 1
+            if stats is not None:
+                s = self._sampled.get(route)
+                if s is None:
+                    s = self._sampled[route] = [0, 0, 0.0, 0, 0.0]
+                s[0] += 1
+                s[1] += stats.db_queries
+                s[2] += stats.db_seconds
+                s[3] += stats.db_rows
+                s[4] += stats.render_seconds
+
+    def render(self, extra=()):
+        """
+        輸出 Prometheus 文字格式
+        extra : [(名稱, 型別, 說明, [(labels dict, 值)])]，讓 web.py 把連線池 / 快取等既有統計一併輸出
+        """
+        ns = self.namespace
+        with self._lock:
+            requests_ = dict(self._requests)
+            durations = {k: list(v) for k, v in self._durations.items()}
+            sampled = {k: list(v) for k, v in self._sampled.items()}
+            slow = self.slow_queries
+
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{ns}_{name}{format_labels(labels)} {format_value(value)}")
+
+        family("requests_total", "counter", "HTTP requests by route, method and status",
+               [({"route": r, "method": m, "status": s}, n) for (r, m, s), n in sorted(requests_.items())])
+
+        lines.append(f"# HELP {ns}_request_duration_seconds Wall time per request")
+        lines.append(f"# TYPE {ns}_request_duration_seconds histogram")
+        for route, hist in sorted(durations.items()):
+            for bound, count in zip(DURATION_BUCKETS, hist):
+                lines.append(f"{ns}_request_duration_seconds_bucket{format_labels({'route': route, 'le': bound})} {count}")
+            lines.append(f"{ns}_request_duration_seconds_bucket{format_labels({'route': route, 'le': '+Inf'})} {hist[-1]}")
+            lines.append(f"{ns}_request_duration_seconds_sum{format_labels({'route': route})} {format_value(hist[-2])}")
+            lines.append(f"{ns}_request_duration_seconds_count{format_labels({'route': route})} {hist[-1]}")
+
+        per_route = sorted(sampled.items())
+        family("sampled_requests_total", "counter", "Requests with DB / template instrumentation",
+               [({"route": r}, s[0]) for r, s in per_route])
+        family("db_queries_total", "counter", "DB queries issued by sampled requests",
+               [({"route": r}, s[1]) for r, s in per_route])
+        family("db_seconds_total", "counter", "Time spent in DB execute/fetch by sampled requests",
+               [({"route": r}, s[2]) for r, s in per_route])
+        family("db_rows_total", "counter", "Rows fetched by sampled requests",
+               [({"route": r}, s[3]) for r, s in per_route])
+        family("render_seconds_total", "counter", "Template render time of sampled requests",
+               [({"route": r}, s[4]) for r, s in per_route])
+        family("slow_queries_total", "counter", "Queries slower than the slow query threshold", [({}, slow)])
+        family("metrics_sample_rate", "gauge", "Fraction of requests instrumented", [({}, self.sample_rate)])
+
+        for name, kind, help_text, samples in extra:
+            family(name, kind, help_text, samples)
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def format_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
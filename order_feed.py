@@ -0,0 +1,185 @@
+import json
+import os
+import queue
+import threading
+import time
+
+
+# ================== 店家待處理訂單即時推播 (Server-Sent Events) ==================
+#
+# 以前每台店家平板每 10 秒整頁重新整理，每次都重跑待處理訂單的查詢。
+# 現在每個 process 只有一條背景 thread 負責偵測變化：
+#   - 只查「目前有人訂閱」的門市，多家門市合併成一個查詢
+#   - 和上一次的結果比對，只把新增 / 金額變動 / 已完成(消失) 的訂單推給該門市的訂閱者
+#   - checkout、admin_update_status 寫入後呼叫 notify()，不必等到下一輪就會立刻檢查
+# 新訂閱者 (含斷線重連) 第一次會收到完整清單 (reset = true)，之後只收差異。
+# 每條 SSE 連線最多維持 max_age 秒就結束，瀏覽器的 EventSource 會自動重連，
+# 平板一直開著也不會永遠占住同一條 worker thread。
+
+
+PENDING_ORDERS_SQL = """
+    SELECT o.order_id, o.store_id, c.phone, o.status, o.tot_price
+    FROM [order] o
+    LEFT JOIN customer c ON o.customer_id = c.customer_id
+    WHERE o.store_id IN ({placeholders})
+      AND COALESCE(o.tot_price, 0) > 0
+      AND o.status = ?
+    ORDER BY o.order_id ASC
+"""
+
+
+class OrderFeed:
+    def __init__(self, get_connection, interval=2.0, heartbeat=15.0, max_age=300.0):
+        """
+        get_connection : 回傳 context manager 的函式 (web.get_db_connection)
+        interval       : 背景偵測的間隔秒數
+        heartbeat      : 沒有變化時多久送一次註解行，避免 proxy 把閒置連線切掉
+        max_age        : 一條 SSE 連線最多維持幾秒 (之後由瀏覽器重連)
+        """
+        self._get_connection = get_connection
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._subscribers = {}   # store_id -> set(queue)
+        self._fresh = set()      # 還沒收過完整清單的 queue
+        self._snapshots = {}     # store_id -> {order_id: order dict}
+        self._thread = None
+        self._pid = None
+        self.polls = 0
+        self.events_sent = 0
+
+    # ---------- 訂閱管理 ----------
+
+    def subscribe(self, store_id):
+        q = queue.Queue(maxsize=50)
+        with self._lock:
+            self._subscribers.setdefault(store_id, set()).add(q)
+            self._fresh.add(q)
+            self._ensure_thread()
+        self._wake.set()
+        return q
+
+    def unsubscribe(self, store_id, q):
+        with self._lock:
+            subs = self._subscribers.get(store_id)
+            if subs is not None:
+                subs.discard(q)
+                if not subs:
+                    del self._subscribers[store_id]
+                    self._snapshots.pop(store_id, None)
+            self._fresh.discard(q)
+
+    def notify(self):
+        """有訂單寫入時呼叫，讓偵測 thread 立刻檢查一次"""
+        self._wake.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "stores": len(self._subscribers),
+                "subscribers": sum(len(s) for s in self._subscribers.values()),
+                "polls": self.polls,
+                "events_sent": self.events_sent,
+            }
+
+    # ---------- 背景偵測 ----------
+
+    def _ensure_thread(self):
+        # gunicorn fork 之後 thread 不會跟著過去，需要在子 process 重新啟動
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name="order-feed", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            with self._lock:
+                if not self._subscribers:
+                    continue
+            try:
+                self._poll()
+            except Exception as e:
+                print(f"[order_feed] 偵測訂單變化時發生錯誤: {e}")
+
+    def _poll(self):
+        with self._lock:
+            store_ids = list(self._subscribers)
+        if not store_ids:
+            return
+
+        placeholders = ", ".join("?" for _ in store_ids)
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(PENDING_ORDERS_SQL.format(placeholders=placeholders), (*store_ids, "未完成"))
+            rows = cursor.fetchall()
+        self.polls += 1
+
+        current = {store_id: {} for store_id in store_ids}
+        for r in rows:
+            current.setdefault(r[1], {})[r[0]] = {
+                "order_id": r[0], "phone": r[2] or "未知", "status": r[3] or "未完成", "tot_price": r[4] or 0
+            }
+
+        with self._lock:
+            for store_id, orders in current.items():
+                subs = self._subscribers.get(store_id)
+                if not subs:
+                    continue
+                old = self._snapshots.get(store_id, {})
+                self._snapshots[store_id] = orders
+
+                upsert = [o for oid, o in orders.items() if old.get(oid) != o]
+                remove = [oid for oid in old if oid not in orders]
+                diff = {"reset": False, "upsert": upsert, "remove": remove}
+                full = {"reset": True, "upsert": list(orders.values()), "remove": []}
+
+                for q in list(subs):
+                    if q in self._fresh:
+                        payload = full
+                    elif upsert or remove:
+                        payload = diff
+                    else:
+                        continue
+                    try:
+                        q.put_nowait(payload)
+                        self._fresh.discard(q)
+                        self.events_sent += 1
+                    except queue.Full:
+                        # 客戶端太慢，清空後下一輪改送完整清單
+                        self._drain(q)
+                        self._fresh.add(q)
+
+    @staticmethod
+    def _drain(q):
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+
+    # ---------- SSE 輸出 ----------
+
+    def stream(self, store_id):
+        """產生 text/event-stream 內容；客戶端斷線時 Flask 會關閉 generator，順便取消訂閱"""
+        q = self.subscribe(store_id)
+        deadline = time.monotonic() + self.max_age
+        try:
+            yield f"retry: {int(self.interval * 1000)}\n\n"
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return   # 讓出 worker thread；EventSource 過 retry 毫秒後重連並收到完整清單
+                try:
+                    payload = q.get(timeout=min(self.heartbeat, remaining))
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: orders\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        finally:
+            self.unsubscribe(store_id, q)
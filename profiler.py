@@ -0,0 +1,205 @@
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+
+# ================== 單一 request 的取樣式 profiler ==================
+#
+# 門市反映「頁面很慢」但我們重現不出來時，讓那個 request 自己留下 profile：
+#   - 另開一條 thread，每隔 interval 秒用 sys._current_frames() 抓處理中 thread 的呼叫堆疊
+#   - 每個樣本的權重是距離上一次取樣的實際時間，GIL 被占住 (例如 pyodbc 執行查詢、Jinja render) 的時間
+#     也會算在當時的堆疊上，所以 cursor.execute / render_template 的耗時都看得到
+#   - request 結束後輸出 speedscope 格式的 JSON (https://www.speedscope.app 可直接開啟，含 flame graph)
+# 沒有要 profile 的 request 只多一次判斷，不會啟動取樣 thread。
+
+# 檔名：<UTC 時間>-<pid>-s<門市>-<endpoint>-<毫秒>ms.speedscope.json
+CAPTURE_NAME = re.compile(
+    r"^(?P<stamp>\d{8}T\d{6}\d{3})-(?P<pid>\d+)-s(?P<store>\w*)-(?P<endpoint>[\w.]+)-(?P<ms>\d+)ms\.speedscope\.json$"
+)
+
+
+class StackSampler:
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = {}   # 堆疊 (由外到內的 frame tuple) -> 累計秒數
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self.started
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                break
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack = tuple(reversed(stack))
+            self.samples[stack] = self.samples.get(stack, 0.0) + (now - last)
+            last = now
+
+    def to_speedscope(self, name):
+        frames = []
+        frame_index = {}
+        samples = []
+        weights = []
+        for stack, seconds in self.samples.items():
+            indexes = []
+            for func, filename, line in stack:
+                key = (func, filename, line)
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": func, "file": filename, "line": line})
+                indexes.append(frame_index[key])
+            samples.append(indexes)
+            weights.append(round(seconds * 1000, 3))
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "drinkshop profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 3),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+
+class RequestProfiler:
+    def __init__(self, folder, sample_every=0, interval=0.001, keep=200, should_profile=None):
+        """
+        folder         : profile 輸出資料夾
+        sample_every   : 每 N 個 request 自動 profile 一次 (0 = 只 profile 明確要求的 request)
+        keep           : 資料夾最多保留幾份，超過就刪掉最舊的
+        should_profile : 回傳 True 代表這個 request 被要求 profile (例如店家帶了 X-Profile header)
+        """
+        self.folder = folder
+        self.sample_every = sample_every
+        self.interval = interval
+        self.keep = keep
+        self.should_profile = should_profile or (lambda: False)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._seen = 0
+        self.captures = 0
+
+    # ---------- 接上 Flask ----------
+
+    def init_app(self, app, store_id=None):
+        """store_id : 回傳目前 request 所屬門市的函式，寫進檔名方便對照是哪家店反映的"""
+        from flask import request
+
+        store_id = store_id or (lambda: None)
+
+        @app.before_request
+        def _start_profile():
+            self._local.sampler = None
+            if not self._wanted():
+                return
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+            self._local.sampler = sampler
+
+        @app.teardown_request
+        def _stop_profile(exc=None):
+            sampler = getattr(self._local, "sampler", None)
+            if sampler is None:
+                return
+            self._local.sampler = None
+            sampler.stop()
+            endpoint = request.endpoint or "unmatched"
+            self._save(sampler, f"{request.method} {request.full_path.rstrip('?')}", endpoint, store_id())
+
+    def _wanted(self):
+        if self.should_profile():
+            return True
+        if self.sample_every <= 0:
+            return False
+        with self._lock:
+            self._seen += 1
+            return self._seen % self.sample_every == 0
+
+    # ---------- 輸出 ----------
+
+    def _save(self, sampler, title, endpoint, store_id):
+        now = datetime.now(timezone.utc)
+        stamp = now.strftime("%Y%m%dT%H%M%S") + f"{now.microsecond // 1000:03d}"
+        ms = int(sampler.elapsed * 1000)
+        file_name = f"{stamp}-{os.getpid()}-s{store_id or ''}-{endpoint}-{ms}ms.speedscope.json"
+
+        os.makedirs(self.folder, exist_ok=True)
+        path = os.path.join(self.folder, file_name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(sampler.to_speedscope(f"{title} ({ms} ms)"), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.captures += 1
+        self._prune()
+        return file_name
+
+    def _prune(self):
+        names = sorted(n for n in os.listdir(self.folder) if CAPTURE_NAME.match(n))
+        for name in names[:-self.keep] if self.keep else []:
+            try:
+                os.remove(os.path.join(self.folder, name))
+            except FileNotFoundError:
+                pass   # 其他 worker 已經刪掉了
+
+    def list_captures(self, limit=100, store_id=None):
+        """最近的 profile，新的在前；指定 store_id 時只列出該門市的 (檔名裡的 s<門市>)"""
+        try:
+            names = os.listdir(self.folder)
+        except FileNotFoundError:
+            return []
+        captures = []
+        for name in sorted(names, reverse=True):
+            m = CAPTURE_NAME.match(name)
+            if not m or (store_id is not None and m["store"] != str(store_id)):
+                continue
+            stamp = datetime.strptime(m["stamp"][:15], "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+            captures.append({
+                "file": name,
+                "captured_at": stamp,
+                "pid": int(m["pid"]),
+                "store_id": m["store"],
+                "endpoint": m["endpoint"],
+                "ms": int(m["ms"]),
+            })
+            if len(captures) >= limit:
+                break
+        return captures
+
+    def path_for(self, name, store_id=None):
+        """只允許讀取符合檔名格式的檔案 (避免 ../ 之類的路徑)；指定 store_id 時只能讀該門市的"""
+        m = CAPTURE_NAME.match(name)
+        if not m or (store_id is not None and m["store"] != str(store_id)):
+            return None
+        path = os.path.join(self.folder, name)
+        return path if os.path.exists(path) else None
@@ -0,0 +1,286 @@
+import argparse
+import csv
+import io
+import math
+import os
+import random
+import sys
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from multiprocessing import Pool
+
+# 讓這支腳本在 python_faker/ 底下也能 import 專案根目錄的 db.py
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from db import read_seed_csv
+
+
+# ================== 大量測試資料產生器 ==================
+#
+# customer_faker.py / store_faker.py 只產生 20 筆，而且完全沒有 [order] 與 item，
+# 沒辦法重現正式環境的資料量。這支程式產生百萬筆等級的 customer / order / item CSV：
+#   - 門市、商品沿用 database_data/store.csv、product.csv (要先 flask init-db 匯入)
+#   - 分布：午餐與下午茶尖峰、週末較多、少數門市 / 熱門飲料占大宗、熟客重複消費、冬天熱飲較多
+#   - 同一個 --seed 產生的檔案完全相同 (每一天各自一個亂數種子，與 process 數無關)
+#   - 以「天」為單位分批產生、依序寫檔；--processes 可平行產生，同時最多 2 x processes 天的資料在記憶體裡
+#
+# 用法 (在專案根目錄)：
+#   python python_faker/dataset_generator.py --customers 1000000 --orders 5000000 --days 365 --processes 4
+#   python python_sql_insert/bulk_load.py --folder database_data/generated --replace customer order item
+
+DEFAULT_OUT = os.path.join(BASE_DIR, "database_data", "generated")
+
+# 門市當地時間 (10 點開店、22 點打烊) 各小時的相對訂單量：12 點午餐、15~17 點下午茶兩個尖峰
+HOUR_WEIGHTS = {
+    10: 3, 11: 6, 12: 12, 13: 9, 14: 7, 15: 10, 16: 11,
+    17: 9, 18: 7, 19: 6, 20: 5, 21: 3,
+}
+# 星期一 ~ 星期日
+WEEKDAY_WEIGHTS = [0.9, 0.9, 0.95, 1.0, 1.15, 1.35, 1.25]
+
+LINES_PER_ORDER = ([1, 2, 3, 4, 5, 6], [50, 25, 12, 7, 4, 2])
+QUANTITY = ([1, 2, 3, 4], [80, 12, 5, 3])
+# 選項代碼與 sql/sql_database.sql 的 drink_option 相同，item 存打包後的 option_key
+SIZE = ([2, 1], [65, 35])                              # 大杯、中杯
+ICE = ([1, 2, 3, 4, 5, 6], [20, 35, 20, 15, 5, 5])     # 正常冰、少冰、微冰、去冰、溫、熱
+ICE_WINTER = (ICE[0], [12, 25, 15, 13, 15, 20])
+SUGAR = ([1, 2, 3, 4, 5], [10, 15, 35, 25, 15])        # 全糖、七分糖、半糖、三分糖、無糖
+TOPPING = ([1, 2, 3, 4], [55, 25, 10, 10])             # 無、珍珠、布丁、椰果
+
+# 熟客程度：customer_id = C * u^REPEAT_SKEW，約 2 成的顧客貢獻 6 成訂單
+REPEAT_SKEW = 3.0
+STORE_SKEW = 0.8      # 門市 Zipf 指數
+PRODUCT_SKEW = 1.1    # 商品 Zipf 指數
+
+
+def cumulative(weights):
+    total, result = 0, []
+    for w in weights:
+        total += w
+        result.append(total)
+    return result
+
+
+def zipf_cum_weights(n, s):
+    return cumulative([1 / (rank ** s) for rank in range(1, n + 1)])
+
+
+def phone_permutation(rng):
+    """i → 09 開頭電話；(a*i + b) mod 10^8 在 a 與 10^8 互質時不會重複，不需要 set 記錄已用過的號碼"""
+    while True:
+        a = rng.randrange(1, 10 ** 8)
+        if a % 2 and a % 5:
+            break
+    b = rng.randrange(10 ** 8)
+    return a, b
+
+
+def split_orders(total, days, start, rng):
+    """依星期幾加一點隨機起伏把總訂單數分到每一天 (最大餘數法，總和剛好等於 total)"""
+    weights = []
+    for d in range(days):
+        weekday = (start + timedelta(days=d)).weekday()
+        weights.append(WEEKDAY_WEIGHTS[weekday] * rng.uniform(0.85, 1.15))
+    scale = total / sum(weights)
+    exact = [w * scale for w in weights]
+    counts = [math.floor(x) for x in exact]
+    remainder = total - sum(counts)
+    for d in sorted(range(days), key=lambda d: exact[d] - counts[d], reverse=True)[:remainder]:
+        counts[d] += 1
+    return counts
+
+
+# ---------- 每一天的訂單 (在 worker process 執行) ----------
+
+CONTEXT = {}
+
+
+def init_worker(context):
+    CONTEXT.update(context)
+
+
+def generate_day(task):
+    """回傳 (order CSV 文字, item CSV 文字 (不含 item_id，由主程式依序編號), 明細筆數)"""
+    day_index, day, first_order_id, count = task
+    ctx = CONTEXT
+    rng = random.Random(f"{ctx['seed']}:{day_index}")
+    offset = timedelta(hours=ctx["utc_offset"])
+    hours = list(HOUR_WEIGHTS)
+    hour_cum = cumulative(HOUR_WEIGHTS.values())
+    # random.choices 每次都會重算累積權重，先算好再用 cum_weights
+    ice_values, ice_weights = ICE_WINTER if day.month in (12, 1, 2) else ICE
+    ice_cum = cumulative(ice_weights)
+    line_values, line_cum = LINES_PER_ORDER[0], cumulative(LINES_PER_ORDER[1])
+    qty_values, qty_cum = QUANTITY[0], cumulative(QUANTITY[1])
+    size_values, size_cum = SIZE[0], cumulative(SIZE[1])
+    sugar_values, sugar_cum = SUGAR[0], cumulative(SUGAR[1])
+    topping_values, topping_cum = TOPPING[0], cumulative(TOPPING[1])
+
+    # 先產生當天所有時間再排序，order_id 才會跟著時間遞增 (和正式環境一樣)
+    local_midnight = datetime(day.year, day.month, day.day)
+    times = sorted(
+        local_midnight + timedelta(hours=h, seconds=rng.randrange(3600))
+        for h in rng.choices(hours, cum_weights=hour_cum, k=count)
+    )
+
+    orders = io.StringIO()
+    items = io.StringIO()
+    order_writer = csv.writer(orders, lineterminator="\n")
+    item_writer = csv.writer(items, lineterminator="\n")
+    item_count = 0
+    products = ctx["products"]
+
+    for n, local_time in enumerate(times):
+        order_id = first_order_id + n
+        customer_id = int(ctx["customers"] * rng.random() ** REPEAT_SKEW) + 1
+        store_id = rng.choices(ctx["stores"], cum_weights=ctx["store_cum"])[0]
+
+        # 相同規格合併成一列 (與購物車 cart_add 相同)
+        lines = {}
+        for _ in range(rng.choices(line_values, cum_weights=line_cum)[0]):
+            product_id = rng.choices(ctx["product_ids"], cum_weights=ctx["product_cum"])[0]
+            option_key = (
+                rng.choices(size_values, cum_weights=size_cum)[0]
+                + (rng.choices(ice_values, cum_weights=ice_cum)[0] << 8)
+                + (rng.choices(sugar_values, cum_weights=sugar_cum)[0] << 16)
+                + (rng.choices(topping_values, cum_weights=topping_cum)[0] << 24)
+            )
+            spec = (product_id, option_key)
+            lines[spec] = lines.get(spec, 0) + rng.choices(qty_values, cum_weights=qty_cum)[0]
+
+        tot_amount = sum(lines.values())
+        tot_price = sum(products[spec[0]] * qty for spec, qty in lines.items())
+        created_at = local_time - offset
+        status = "未完成" if created_at >= ctx["pending_after"] else "已完成"
+        order_writer.writerow([
+            order_id, store_id, customer_id, tot_price, tot_amount, status,
+            created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        ])
+        for spec, qty in lines.items():
+            item_writer.writerow([order_id, *spec, qty])
+            item_count += 1
+
+    return orders.getvalue(), items.getvalue(), item_count
+
+
+def bounded_imap(pool, func, tasks, in_flight):
+    """和 pool.imap 一樣依序回傳結果，但同時最多只送出 in_flight 個工作。
+    pool.imap 會一口氣把所有工作送進佇列，寫檔跟不上時做好的結果會一直堆在記憶體裡"""
+    pending = deque()
+    for task in tasks:
+        if len(pending) >= in_flight:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(func, (task,)))
+    while pending:
+        yield pending.popleft().get()
+
+
+# ---------- 主程式 ----------
+
+def write_customers(path, count, rng):
+    a, b = phone_permutation(rng)
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["customer_id", "phone"])
+        for start in range(1, count + 1, 100000):
+            writer.writerows(
+                [i, f"09{(a * i + b) % 10 ** 8:08d}"]
+                for i in range(start, min(start + 100000, count + 1))
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="產生大量 customer / order / item 測試資料 (CSV)")
+    parser.add_argument("--customers", type=int, default=100000)
+    parser.add_argument("--orders", type=int, default=1000000)
+    parser.add_argument("--days", type=int, default=90, help="訂單分布在最近幾天")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(),
+                        help="最後一天 (YYYY-MM-DD)；要重現同一份資料請固定這個值")
+    parser.add_argument("--seed", type=int, default=33)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--utc-offset", type=float, default=8, help="門市時區 (資料庫存 UTC)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="輸出資料夾")
+    args = parser.parse_args()
+
+    if not 0 < args.customers < 10 ** 8:
+        raise SystemExit("--customers 必須介於 1 到 99,999,999 (電話號碼只有 8 碼可變)")
+
+    os.makedirs(args.out, exist_ok=True)
+    rng = random.Random(args.seed)
+    started = time.monotonic()
+    print(f"seed={args.seed} end={args.end.isoformat()} → {args.out}")
+
+    # 門市 / 商品的熱門程度：隨機排名後套 Zipf 分布
+    _, store_rows = read_seed_csv("store")
+    _, product_rows = read_seed_csv("product")
+    stores = [int(r[0]) for r in store_rows]
+    product_ids = [int(r[0]) for r in product_rows]
+    rng.shuffle(stores)
+    rng.shuffle(product_ids)
+
+    write_customers(os.path.join(args.out, "customer.csv"), args.customers, rng)
+    print(f"  customer: {args.customers:,} 筆")
+
+    start = args.end - timedelta(days=args.days - 1)
+    counts = split_orders(args.orders, args.days, start, rng)
+    tasks, first_id = [], 1
+    for d, count in enumerate(counts):
+        tasks.append((d, start + timedelta(days=d), first_id, count))
+        first_id += count
+
+    # 最後 20 分鐘的訂單還沒做完
+    last_close = datetime(args.end.year, args.end.month, args.end.day, max(HOUR_WEIGHTS) + 1)
+    context = {
+        "seed": args.seed,
+        "utc_offset": args.utc_offset,
+        "customers": args.customers,
+        "stores": stores,
+        "store_cum": zipf_cum_weights(len(stores), STORE_SKEW),
+        "product_ids": product_ids,
+        "product_cum": zipf_cum_weights(len(product_ids), PRODUCT_SKEW),
+        "products": {int(r[0]): int(r[3]) for r in product_rows},
+        "pending_after": last_close - timedelta(minutes=20) - timedelta(hours=args.utc_offset),
+    }
+
+    order_path = os.path.join(args.out, "order.csv")
+    item_path = os.path.join(args.out, "item.csv")
+    with open(order_path, "w", newline="", encoding="utf-8-sig") as order_f, \
+            open(item_path, "w", newline="", encoding="utf-8-sig") as item_f:
+        order_f.write("order_id,store_id,customer_id,tot_price,tot_amount,status,created_at\n")
+        item_f.write("item_id,order_id,product_id,option_key,quantity\n")
+
+        if args.processes > 1:
+            pool = Pool(args.processes, initializer=init_worker, initargs=(context,))
+            # 依序回傳，輸出與單一 process 相同
+            results = bounded_imap(pool, generate_day, tasks, in_flight=args.processes * 2)
+        else:
+            pool = None
+            init_worker(context)
+            results = map(generate_day, tasks)
+
+        item_id = 1
+        orders_done = items_done = 0
+        try:
+            for (day_index, day, _, count), (order_text, item_text, item_count) in zip(tasks, results):
+                order_f.write(order_text)
+                for line in item_text.splitlines():
+                    item_f.write(f"{item_id},{line}\n")
+                    item_id += 1
+                orders_done += count
+                items_done += item_count
+                if (day_index + 1) % 30 == 0 or day_index == len(tasks) - 1:
+                    rate = orders_done / (time.monotonic() - started)
+                    print(f"  {day.isoformat()}: order {orders_done:,} 筆、item {items_done:,} 筆 ({rate:,.0f} 單/秒)", flush=True)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    print(f"完成：{time.monotonic() - started:.1f} 秒")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from PIL import Image, features
+
+
+# ================== 商品圖片離線建置 ==================
+#
+# static/product_images 是 640x512 的原圖 (一張約 20 KB，全部約 4 MB)，
+# 點餐頁每換一次飲料就載入一張原圖，店裡 Wi-Fi 加上手機網路很慢。
+# 這支程式在部署前執行一次，產生：
+#   - 不同寬度的縮圖，各有 AVIF / WebP / JPEG 三種格式
+#   - 檔名帶內容雜湊 (原圖 + 建置設定)，可以放心讓瀏覽器長期快取
+#   - static/build/image_manifest.json：order_drink 依此輸出 srcset 與佔位底色
+# 重跑時只處理有變動的原圖，已不再使用的舊檔會一併刪除。
+#
+# 用法 (在專案根目錄)：python python_image/build_images.py
+# 完成後執行 flask --app web invalidate-cache，讓商品快取重新讀取 manifest。
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+SOURCE_DIR = os.path.join(STATIC_DIR, "product_images")
+BUILD_DIR = os.path.join(STATIC_DIR, "build")
+OUTPUT_DIR = os.path.join(BUILD_DIR, "product_images")
+MANIFEST_PATH = os.path.join(BUILD_DIR, "image_manifest.json")
+
+VALID_EXTENSIONS = (".jpg", ".jpeg", ".png")
+WIDTHS = [160, 320, 480, 640]
+
+# 格式 → (副檔名, Pillow save 參數)；AVIF 需要 Pillow 11.2 以上 (或 pillow-avif-plugin)
+FORMATS = {
+    "avif": ("avif", {"quality": 50}),
+    "webp": ("webp", {"quality": 75, "method": 6}),
+    "jpeg": ("jpg", {"quality": 80, "optimize": True, "progressive": True}),
+}
+
+
+def available_formats():
+    formats = []
+    for fmt in FORMATS:
+        if fmt == "jpeg" or features.check(fmt):
+            formats.append(fmt)
+        else:
+            print(f"[略過] 目前的 Pillow 不支援 {fmt.upper()}")
+    return formats
+
+
+def settings_key(formats):
+    """建置設定也算進雜湊：改了寬度或品質，檔名就會跟著變"""
+    return json.dumps({"widths": WIDTHS, "formats": {f: FORMATS[f] for f in formats}}, sort_keys=True)
+
+
+def content_hash(path, settings):
+    h = hashlib.sha1(settings.encode("utf-8"))
+    with open(path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:10]
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {"images": {}}
+
+
+def is_fresh(entry, digest):
+    """雜湊相同且輸出檔都還在，就不必重新產生"""
+    if not entry or entry.get("hash") != digest:
+        return False
+    for variants in entry["variants"].values():
+        for v in variants:
+            if not os.path.exists(os.path.join(STATIC_DIR, v["file"])):
+                return False
+    return True
+
+
+def average_color(img):
+    """縮成 1x1 取平均色，當作圖片載入前的佔位底色 (只多幾個位元組)"""
+    r, g, b = img.resize((1, 1), Image.LANCZOS).getpixel((0, 0))[:3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def build_one(src_path, stem, digest, formats):
+    with Image.open(src_path) as img:
+        img = img.convert("RGB")
+        src_w, src_h = img.size
+        widths = [w for w in WIDTHS if w < src_w] + [src_w]
+
+        variants = {fmt: [] for fmt in formats}
+        for w in widths:
+            h = round(src_h * w / src_w)
+            resized = img if w == src_w else img.resize((w, h), Image.LANCZOS)
+            for fmt in formats:
+                ext, options = FORMATS[fmt]
+                name = f"{stem}.{digest}.{w}.{ext}"
+                resized.save(os.path.join(OUTPUT_DIR, name), fmt.upper(), **options)
+                variants[fmt].append({"w": w, "file": f"build/product_images/{name}"})
+
+        return {
+            "hash": digest,
+            "width": src_w,
+            "height": src_h,
+            "color": average_color(img),
+            "variants": variants,
+        }
+
+
+def remove_stale(manifest):
+    """刪掉 manifest 已經不再引用的輸出檔 (原圖改過或刪除後留下的舊版本)"""
+    keep = {
+        os.path.basename(v["file"])
+        for entry in manifest["images"].values()
+        for variants in entry["variants"].values()
+        for v in variants
+    }
+    removed = 0
+    for name in os.listdir(OUTPUT_DIR):
+        if name not in keep:
+            os.remove(os.path.join(OUTPUT_DIR, name))
+            removed += 1
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="產生商品縮圖 / WebP / AVIF 與 image_manifest.json")
+    parser.add_argument("--force", action="store_true", help="忽略 manifest，全部重新產生")
+    args = parser.parse_args()
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    formats = available_formats()
+    settings = settings_key(formats)
+
+    old = {"images": {}} if args.force else load_manifest()
+    manifest = {"widths": WIDTHS, "formats": formats, "images": {}}
+    built = skipped = 0
+
+    for file_name in sorted(os.listdir(SOURCE_DIR)):
+        if not file_name.lower().endswith(VALID_EXTENSIONS):
+            continue
+        src_path = os.path.join(SOURCE_DIR, file_name)
+        key = f"product_images/{file_name}"   # 與 product.photo_url 去掉 static/ 後相同
+        digest = content_hash(src_path, settings)
+
+        entry = old["images"].get(key)
+        if is_fresh(entry, digest):
+            manifest["images"][key] = entry
+            skipped += 1
+            continue
+
+        stem = os.path.splitext(file_name)[0]
+        manifest["images"][key] = build_one(src_path, stem, digest, formats)
+        built += 1
+        print(f"  產生 {file_name}")
+
+    # 先寫到暫存檔再改名，避免 web 讀到寫一半的 manifest
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+    removed = remove_stale(manifest)
+    print(f"完成：產生 {built} 張、未變動略過 {skipped} 張、刪除舊檔 {removed} 個")
+    print("記得執行 flask --app web invalidate-cache 讓商品快取讀取新的 manifest")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
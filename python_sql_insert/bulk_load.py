@@ -0,0 +1,94 @@
+import argparse
+import os
+import sys
+import time
+
+# 讓這支腳本在 python_sql_insert/ 底下也能 import 專案根目錄的 db.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import SEED_DIR, create_backend, load_csv, table_sql_name
+
+
+# ================== CSV 批次匯入 ==================
+#
+# sql_insert.py 會把每一列 CSV 變成一句 INSERT，匯入時每一列都要一次 round trip，
+# 幾百萬筆要跑好幾個小時。這支程式直接把 database_data/*.csv 串流寫進資料庫：
+#   - 參數化 executemany，每批 batch-size 筆 (SQL Server 會開 fast_executemany，一批只要一次 round trip)
+#   - 一張表一個交易，失敗就整張表 rollback，不會留下匯入一半的資料
+#   - 逐批讀檔，記憶體只放一批；每隔幾秒印出筆數與速度
+#
+# 用法 (連線設定與 web.py 相同，讀 DB_BACKEND / MSSQL_* / SQLITE_PATH 環境變數)：
+#   python python_sql_insert/bulk_load.py                      # 匯入 database_data 底下所有 CSV
+#   python python_sql_insert/bulk_load.py --replace --batch-size 20000 order item
+
+# 外鍵相依順序：被參照的表要先匯入
+LOAD_ORDER = ["store", "product", "customer", "order", "item"]
+
+
+def progress_printer(interval):
+    last = {"at": 0.0}
+
+    def report(table, rows, seconds):
+        now = time.monotonic()
+        if now - last["at"] >= interval:
+            last["at"] = now
+            rate = rows / seconds if seconds else 0
+            print(f"  {table}: {rows:,} 筆 ({rate:,.0f} 筆/秒)", flush=True)
+
+    return report
+
+
+def find_tables(folder, requested):
+    available = {f.rsplit(".", 1)[0] for f in os.listdir(folder) if f.endswith(".csv")}
+    tables = requested or [t for t in LOAD_ORDER if t in available]
+    missing = [t for t in tables if t not in available]
+    if missing:
+        raise SystemExit(f"找不到 CSV: {', '.join(t + '.csv' for t in missing)}")
+    # 不管指令列順序如何，一律照外鍵相依順序匯入
+    return sorted(tables, key=lambda t: LOAD_ORDER.index(t) if t in LOAD_ORDER else len(LOAD_ORDER))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="把 database_data/*.csv 批次匯入資料庫")
+    parser.add_argument("tables", nargs="*", help="只匯入這些表 (預設：資料夾內全部)")
+    parser.add_argument("--folder", default=SEED_DIR, help="CSV 資料夾")
+    parser.add_argument("--batch-size", type=int, default=5000, help="每次 executemany 的筆數")
+    parser.add_argument("--replace", action="store_true", help="匯入前先清空這些表")
+    parser.add_argument("--progress", type=float, default=2.0, help="每隔幾秒印一次進度")
+    args = parser.parse_args()
+
+    tables = find_tables(args.folder, args.tables)
+    backend = create_backend()
+    conn = backend.connect()
+    report = progress_printer(args.progress)
+    total_rows = 0
+    started = time.monotonic()
+
+    try:
+        if args.replace:
+            # 反過來刪：先刪參照別人的表 (item → order → ...)
+            cursor = conn.cursor()
+            for table in reversed(tables):
+                cursor.execute(f"DELETE FROM {table_sql_name(table)}")
+            conn.commit()
+
+        for table in tables:
+            table_started = time.monotonic()
+            rows = load_csv(
+                backend, conn, table, os.path.join(args.folder, f"{table}.csv"),
+                batch_size=args.batch_size, report=report,
+            )
+            seconds = time.monotonic() - table_started
+            total_rows += rows
+            rate = rows / seconds if seconds else 0
+            print(f"[{backend.name}] {table}: 匯入 {rows:,} 筆，{seconds:.1f} 秒 ({rate:,.0f} 筆/秒)")
+    finally:
+        conn.close()
+
+    seconds = time.monotonic() - started
+    print(f"完成：共 {total_rows:,} 筆，{seconds:.1f} 秒")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,15 @@ import os
 import csv
 import re
 
+# 產生可以貼到 SSMS 執行的 insert_db_values.sql (每列一句 INSERT)。
+# 資料量大時請改用 bulk_load.py 直接批次匯入資料庫。
+
 csv_folder_path = os.path.join("..", "database_data")
 csv_names = [f for f in os.listdir(csv_folder_path) if f.endswith('.csv')]
 
+# 主鍵為 IDENTITY 的資料表，匯入固定編號前要先打開 IDENTITY_INSERT
+identity_tables = {"customer", "order", "item"}
+
 def has_chinese(s):
     return bool(re.search(r'[\u4e00-\u9fff]', s))
 
@@ -26,6 +32,12 @@ for file_name in csv_names:
 
         with open("../sql/insert_db_values.sql", "a", encoding="utf-8-sig") as sql:
             tablename = file_name.rsplit(".", 1)[0]
+            # order 是保留字，表名一律加中括號
+            quoted_name = f"[{tablename}]"
+            columns_str = ", ".join(datalst[0])
+
+            if tablename in identity_tables:
+                sql.write(f"SET IDENTITY_INSERT {quoted_name} ON;\n")
 
             for line in datalst[1:]:
                 formatted_values = []
@@ -36,7 +48,10 @@ for file_name in csv_names:
                         formatted_values.append(f"'{value}'")    # 英文數字 → 'value'
 
                 values_str = ", ".join(formatted_values)
-                query = f"INSERT INTO {tablename} VALUES ({values_str});\n"
+                query = f"INSERT INTO {quoted_name} ({columns_str}) VALUES ({values_str});\n"
                 sql.write(query)
 
+            if tablename in identity_tables:
+                sql.write(f"SET IDENTITY_INSERT {quoted_name} OFF;\n")
+
             sql.write("\n")
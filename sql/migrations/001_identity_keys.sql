@@ -0,0 +1,29 @@
+USE DrinkShopDB;
+GO
+
+-- 001: 以 SEQUENCE 取代 SELECT ISNULL(MAX(id), 0) + 1 取號
+-- 既有欄位無法直接 ALTER 成 IDENTITY，因此改成 SEQUENCE + DEFAULT：
+--   INSERT 時省略主鍵就會自動取號，並可用 OUTPUT INSERTED.xxx 在同一個 round trip 取回
+--   CACHE 50 讓 SQL Server 一次預留 50 個號碼在記憶體，取號不必每次寫 log
+-- (全新安裝請直接執行 sql_database.sql，該腳本已改用 IDENTITY)
+
+DECLARE @sql NVARCHAR(400);
+DECLARE @next INT;
+
+SELECT @next = COALESCE(MAX(customer_id), 0) + 1 FROM customer;
+SET @sql = N'CREATE SEQUENCE customer_id_seq AS INT START WITH ' + CAST(@next AS NVARCHAR(12)) + N' CACHE 50;';
+EXEC sp_executesql @sql;
+
+SELECT @next = COALESCE(MAX(order_id), 0) + 1 FROM [order];
+SET @sql = N'CREATE SEQUENCE order_id_seq AS INT START WITH ' + CAST(@next AS NVARCHAR(12)) + N' CACHE 50;';
+EXEC sp_executesql @sql;
+
+SELECT @next = COALESCE(MAX(item_id), 0) + 1 FROM item;
+SET @sql = N'CREATE SEQUENCE item_id_seq AS INT START WITH ' + CAST(@next AS NVARCHAR(12)) + N' CACHE 50;';
+EXEC sp_executesql @sql;
+GO
+
+ALTER TABLE customer ADD CONSTRAINT DF_customer_customer_id DEFAULT (NEXT VALUE FOR customer_id_seq) FOR customer_id;
+ALTER TABLE [order]  ADD CONSTRAINT DF_order_order_id       DEFAULT (NEXT VALUE FOR order_id_seq)    FOR order_id;
+ALTER TABLE item     ADD CONSTRAINT DF_item_item_id         DEFAULT (NEXT VALUE FOR item_id_seq)     FOR item_id;
+GO
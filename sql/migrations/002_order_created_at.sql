@@ -0,0 +1,8 @@
+USE DrinkShopDB;
+GO
+
+-- 002: 訂單加上建立時間 (UTC)，歷史訂單依日期篩選用
+-- 既有訂單沒有可信的時間，保留 NULL；之後新增的訂單由 DEFAULT 自動填入
+ALTER TABLE [order] ADD created_at DATETIME2 NULL
+    CONSTRAINT DF_order_created_at DEFAULT (SYSUTCDATETIME());
+GO
@@ -0,0 +1,47 @@
+USE DrinkShopDB;
+GO
+
+-- 003: 熱門查詢路徑的索引 (原本只有主鍵，以下查詢全部都是整張表掃描)
+--   admin_orders / admin_history_orders : [order] 依 store_id + status 篩選、依 order_id 排序 (keyset 分頁)
+--   歷史訂單日期篩選                     : [order] 依 store_id + created_at
+--   訂單明細 / add_item 合併規格          : item 依 order_id (+ 規格欄位)
+--   顧客登入                             : customer 依 phone，並保證電話不重複
+
+-- 同一支電話若因為過去的競態條件被建立了多筆顧客，先把訂單歸到最小的 customer_id 再刪除重複資料
+WITH dup AS (
+    SELECT customer_id, MIN(customer_id) OVER (PARTITION BY phone) AS keep_id
+    FROM customer
+    WHERE phone IS NOT NULL
+)
+UPDATE o SET o.customer_id = dup.keep_id
+FROM [order] o
+JOIN dup ON o.customer_id = dup.customer_id
+WHERE dup.customer_id <> dup.keep_id;
+
+WITH dup AS (
+    SELECT customer_id, MIN(customer_id) OVER (PARTITION BY phone) AS keep_id
+    FROM customer
+    WHERE phone IS NOT NULL
+)
+DELETE c
+FROM customer c
+JOIN dup ON c.customer_id = dup.customer_id
+WHERE dup.customer_id <> dup.keep_id;
+GO
+
+CREATE NONCLUSTERED INDEX IX_order_store_status
+    ON [order] (store_id, status, order_id)
+    INCLUDE (customer_id, tot_price, created_at);
+
+CREATE NONCLUSTERED INDEX IX_order_store_created
+    ON [order] (store_id, created_at)
+    INCLUDE (status, customer_id, tot_price);
+
+CREATE NONCLUSTERED INDEX IX_item_order_spec
+    ON item (order_id, product_id, size, ice, sugar, topping)
+    INCLUDE (quantity);
+
+CREATE UNIQUE NONCLUSTERED INDEX UX_customer_phone
+    ON customer (phone)
+    WHERE phone IS NOT NULL;
+GO
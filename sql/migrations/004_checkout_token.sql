@@ -0,0 +1,17 @@
+USE DrinkShopDB;
+GO
+
+-- 004: 結帳冪等鍵
+-- checkout 第一次成功時寫入表單帶來的 token；之後同一張訂單再送出 (連點、瀏覽器重送) 都直接略過
+ALTER TABLE [order] ADD checkout_token NVARCHAR(36) NULL;
+GO
+
+-- 既有已結帳的訂單補上 token，避免舊的 Session 重送時被當成尚未結帳
+UPDATE [order]
+SET checkout_token = CONVERT(NVARCHAR(36), NEWID())
+WHERE tot_price IS NOT NULL;
+
+CREATE UNIQUE NONCLUSTERED INDEX UX_order_checkout_token
+    ON [order] (checkout_token)
+    WHERE checkout_token IS NOT NULL;
+GO
@@ -0,0 +1,41 @@
+USE DrinkShopDB;
+GO
+
+-- 005: 銷售彙總表
+-- 「X 店今天賣了幾杯珍珠綠茶」原本要掃 [order] JOIN item JOIN product，會跟點餐搶資源。
+-- checkout 在同一個交易內把每張訂單累加進下面三張表，後台報表只讀彙總表。
+-- sale_date / sale_hour 是門市當地日期與小時 (STORE_UTC_OFFSET_HOURS)。
+-- 既有訂單執行 flask --app web rebuild-sales-rollup 補算。
+CREATE TABLE sales_store_hourly
+(
+    store_id    INT,
+    sale_date   DATE,
+    sale_hour   TINYINT,
+    orders      INT,
+    quantity    INT,
+    revenue     INT,
+    PRIMARY KEY (store_id, sale_date, sale_hour)
+);
+
+CREATE TABLE sales_product_daily
+(
+    store_id    INT,
+    sale_date   DATE,
+    product_id  INT,
+    quantity    INT,
+    revenue     INT,
+    PRIMARY KEY (store_id, sale_date, product_id)
+);
+
+-- 選項分布：option_name 為 size / ice / sugar / topping
+CREATE TABLE sales_option_daily
+(
+    store_id     INT,
+    sale_date    DATE,
+    product_id   INT,
+    option_name  NVARCHAR(10),
+    option_value NVARCHAR(10),
+    quantity     INT,
+    PRIMARY KEY (store_id, sale_date, product_id, option_name, option_value)
+);
+GO
@@ -0,0 +1,47 @@
+USE DrinkShopDB;
+GO
+
+-- 006: 已完成訂單的封存表
+-- [order] / item 只增不減，待處理佇列 (admin_orders) 卻跟所有歷史訂單共用資料表與索引。
+-- flask --app web archive-orders 定期把超過一定天數的已完成訂單 (連同明細) 分批搬到這兩張表，
+-- 熱資料表只剩最近的訂單；歷史訂單 / 訂單明細頁會同時查兩邊。
+-- 保留原本的 order_id / item_id (不是 IDENTITY)；封存資料不再修改，因此不加外鍵。
+CREATE TABLE order_archive
+(
+    order_id    INT,
+    store_id    INT NULL,
+    customer_id INT NULL,
+    tot_price   INT,
+    tot_amount  INT,
+    status      NVARCHAR(10),
+    created_at  DATETIME2 NULL,
+    checkout_token NVARCHAR(36) NULL,
+    archived_at DATETIME2 NULL CONSTRAINT DF_order_archive_archived_at DEFAULT (SYSUTCDATETIME()),
+    PRIMARY KEY (order_id)
+);
+
+CREATE TABLE item_archive
+(
+    item_id     INT,
+    order_id    INT NULL,
+    product_id  INT NULL,
+    size        NVARCHAR(10),
+    ice         NVARCHAR(10),
+    sugar       NVARCHAR(10),
+    topping     NVARCHAR(10),
+    quantity    INT,
+    PRIMARY KEY (item_id)
+);
+
+-- 歷史訂單頁：依門市 + order_id 分頁 / 依門市 + 日期篩選
+CREATE NONCLUSTERED INDEX IX_order_archive_store_order
+    ON order_archive (store_id, order_id)
+    INCLUDE (customer_id, tot_price, status, created_at);
+
+CREATE NONCLUSTERED INDEX IX_order_archive_store_created
+    ON order_archive (store_id, created_at)
+    INCLUDE (status, customer_id, tot_price);
+
+CREATE NONCLUSTERED INDEX IX_item_archive_order
+    ON item_archive (order_id);
+GO
@@ -0,0 +1,121 @@
+USE DrinkShopDB;
+GO
+
+-- 007: 飲料選項改用代碼
+-- item.size / ice / sugar / topping 原本各是 NVARCHAR(10)，每一列都重複存「正常冰」「七分糖」這類字串。
+-- 改成選項對照表 drink_option (每種選項一組 1~127 的代碼)，item 只存一個打包後的 option_key：
+--   option_key = size + ice * 256 + sugar * 65536 + topping * 16777216 (代碼 0 = 未指定)
+-- 程式以記憶體中的對照表把代碼轉回文字；之後要加新選項只要新增 drink_option 的資料列。
+CREATE TABLE drink_option
+(
+    option_name NVARCHAR(10),
+    option_code TINYINT,
+    label       NVARCHAR(10),
+    PRIMARY KEY (option_name, option_code),
+    CHECK (option_code BETWEEN 1 AND 127)
+);
+
+CREATE UNIQUE NONCLUSTERED INDEX UX_drink_option_label
+    ON drink_option (option_name, label);
+
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'size', 1, N'中杯');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'size', 2, N'大杯');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 1, N'正常冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 2, N'少冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 3, N'微冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 4, N'去冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 5, N'溫');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 6, N'熱');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 1, N'全糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 2, N'七分糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 3, N'半糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 4, N'三分糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 5, N'無糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 1, N'無');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 2, N'珍珠');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 3, N'布丁');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 4, N'椰果');
+GO
+
+-- 代碼只有 1~127：舊資料的文字種類太多就直接停下 (整個 migration rollback，不會只轉換一半)，
+-- 請先整理 item / item_archive 裡的選項文字再重新執行
+IF EXISTS (
+    SELECT v.option_name
+    FROM (
+        SELECT N'size' AS option_name, size AS label FROM item UNION SELECT N'size', size FROM item_archive
+        UNION SELECT N'ice', ice FROM item UNION SELECT N'ice', ice FROM item_archive
+        UNION SELECT N'sugar', sugar FROM item UNION SELECT N'sugar', sugar FROM item_archive
+        UNION SELECT N'topping', topping FROM item UNION SELECT N'topping', topping FROM item_archive
+    ) v
+    WHERE v.label IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM drink_option d WHERE d.option_name = v.option_name AND d.label = v.label)
+    GROUP BY v.option_name
+    HAVING COUNT(*) + (SELECT MAX(d.option_code) FROM drink_option d WHERE d.option_name = v.option_name) > 127
+)
+    THROW 50007, N'007_option_codes: 舊明細中某種選項 (size / ice / sugar / topping) 的文字超過 127 種，代碼不夠用，請先整理 item / item_archive 的選項文字', 1;
+GO
+
+-- 既有明細裡不在上面清單的文字 (舊資料、手動輸入) 也給代碼，轉換後不會遺失
+INSERT INTO drink_option (option_name, option_code, label)
+SELECT N'size', m.max_code + ROW_NUMBER() OVER (ORDER BY v.label), v.label
+FROM (SELECT size AS label FROM item UNION SELECT size FROM item_archive) v
+CROSS JOIN (SELECT MAX(option_code) AS max_code FROM drink_option WHERE option_name = N'size') m
+WHERE v.label IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM drink_option d WHERE d.option_name = N'size' AND d.label = v.label);
+
+INSERT INTO drink_option (option_name, option_code, label)
+SELECT N'ice', m.max_code + ROW_NUMBER() OVER (ORDER BY v.label), v.label
+FROM (SELECT ice AS label FROM item UNION SELECT ice FROM item_archive) v
+CROSS JOIN (SELECT MAX(option_code) AS max_code FROM drink_option WHERE option_name = N'ice') m
+WHERE v.label IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM drink_option d WHERE d.option_name = N'ice' AND d.label = v.label);
+
+INSERT INTO drink_option (option_name, option_code, label)
+SELECT N'sugar', m.max_code + ROW_NUMBER() OVER (ORDER BY v.label), v.label
+FROM (SELECT sugar AS label FROM item UNION SELECT sugar FROM item_archive) v
+CROSS JOIN (SELECT MAX(option_code) AS max_code FROM drink_option WHERE option_name = N'sugar') m
+WHERE v.label IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM drink_option d WHERE d.option_name = N'sugar' AND d.label = v.label);
+
+INSERT INTO drink_option (option_name, option_code, label)
+SELECT N'topping', m.max_code + ROW_NUMBER() OVER (ORDER BY v.label), v.label
+FROM (SELECT topping AS label FROM item UNION SELECT topping FROM item_archive) v
+CROSS JOIN (SELECT MAX(option_code) AS max_code FROM drink_option WHERE option_name = N'topping') m
+WHERE v.label IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM drink_option d WHERE d.option_name = N'topping' AND d.label = v.label);
+GO
+
+ALTER TABLE item ADD option_key INT NULL;
+ALTER TABLE item_archive ADD option_key INT NULL;
+GO
+
+UPDATE item SET option_key =
+      COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'size' AND d.label = item.size), 0)
+    + COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'ice' AND d.label = item.ice), 0) * 256
+    + COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'sugar' AND d.label = item.sugar), 0) * 65536
+    + COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'topping' AND d.label = item.topping), 0) * 16777216;
+
+UPDATE item_archive SET option_key =
+      COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'size' AND d.label = item_archive.size), 0)
+    + COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'ice' AND d.label = item_archive.ice), 0) * 256
+    + COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'sugar' AND d.label = item_archive.sugar), 0) * 65536
+    + COALESCE((SELECT d.option_code FROM drink_option d WHERE d.option_name = N'topping' AND d.label = item_archive.topping), 0) * 16777216;
+GO
+
+-- 原本的規格索引含四個文字欄位，要先刪掉才能刪欄位
+DROP INDEX IX_item_order_spec ON item;
+
+ALTER TABLE item DROP COLUMN size;
+ALTER TABLE item DROP COLUMN ice;
+ALTER TABLE item DROP COLUMN sugar;
+ALTER TABLE item DROP COLUMN topping;
+ALTER TABLE item_archive DROP COLUMN size;
+ALTER TABLE item_archive DROP COLUMN ice;
+ALTER TABLE item_archive DROP COLUMN sugar;
+ALTER TABLE item_archive DROP COLUMN topping;
+GO
+
+CREATE NONCLUSTERED INDEX IX_item_order_option
+    ON item (order_id, product_id, option_key)
+    INCLUDE (quantity);
+GO
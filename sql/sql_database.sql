@@ -1,11 +1,18 @@
 USE DrinkShopDB;
 GO
 
+DROP TABLE IF EXISTS item_archive;
+DROP TABLE IF EXISTS order_archive;
+DROP TABLE IF EXISTS sales_option_daily;
+DROP TABLE IF EXISTS sales_product_daily;
+DROP TABLE IF EXISTS sales_store_hourly;
 DROP TABLE IF EXISTS item;
+DROP TABLE IF EXISTS drink_option;
 DROP TABLE IF EXISTS [order];
 DROP TABLE IF EXISTS product;
 DROP TABLE IF EXISTS customer;
 DROP TABLE IF EXISTS store;
+DROP TABLE IF EXISTS schema_version;
 
 -- 建立門市
 CREATE TABLE store
@@ -25,23 +32,25 @@ CREATE TABLE product
     PRIMARY KEY (product_id)
 );
 
--- 建立顧客
+-- 建立顧客 (流水號由資料庫產生，INSERT 時以 OUTPUT 取回)
 CREATE TABLE customer
 (
-    customer_id INT,
+    customer_id INT IDENTITY(1,1),
     phone       NVARCHAR(10),
     PRIMARY KEY (customer_id)
-)
+);
 
 -- 建立訂單（order 是保留字，要用中括號）
 CREATE TABLE [order]
 (
-    order_id    INT,
+    order_id    INT IDENTITY(1,1),
     store_id    INT NULL,
     customer_id INT NULL,
     tot_price   INT,
     tot_amount  INT,
     status      NVARCHAR(10),
+    created_at  DATETIME2 NULL CONSTRAINT DF_order_created_at DEFAULT (SYSUTCDATETIME()),
+    checkout_token NVARCHAR(36) NULL,
 
     PRIMARY KEY (order_id),
 
@@ -54,16 +63,45 @@ CREATE TABLE [order]
         ON DELETE SET NULL
 );
 
+-- 飲料選項對照表 (說明見 migrations/007_option_codes.sql)
+CREATE TABLE drink_option
+(
+    option_name NVARCHAR(10),
+    option_code TINYINT,
+    label       NVARCHAR(10),
+    PRIMARY KEY (option_name, option_code),
+    CHECK (option_code BETWEEN 1 AND 127)
+);
+
+CREATE UNIQUE NONCLUSTERED INDEX UX_drink_option_label
+    ON drink_option (option_name, label);
+
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'size', 1, N'中杯');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'size', 2, N'大杯');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 1, N'正常冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 2, N'少冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 3, N'微冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 4, N'去冰');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 5, N'溫');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'ice', 6, N'熱');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 1, N'全糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 2, N'七分糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 3, N'半糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 4, N'三分糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'sugar', 5, N'無糖');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 1, N'無');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 2, N'珍珠');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 3, N'布丁');
+INSERT INTO drink_option (option_name, option_code, label) VALUES (N'topping', 4, N'椰果');
+
 -- 建立訂單明細 item
+-- option_key 為打包後的選項代碼：size + ice * 256 + sugar * 65536 + topping * 16777216
 CREATE TABLE item
 (
-    item_id     INT,
+    item_id     INT IDENTITY(1,1),
     order_id    INT NULL,
     product_id  INT NULL,
-    size        NVARCHAR(10),
-    ice         NVARCHAR(10),
-    sugar       NVARCHAR(10),
-    topping     NVARCHAR(10),
+    option_key  INT NULL,
     quantity    INT,
 
     PRIMARY KEY (item_id),
@@ -77,3 +115,111 @@ CREATE TABLE item
         ON DELETE SET NULL
 );
 
+-- 熱門查詢路徑的索引 (說明見 migrations/003_hot_path_indexes.sql)
+CREATE NONCLUSTERED INDEX IX_order_store_status
+    ON [order] (store_id, status, order_id)
+    INCLUDE (customer_id, tot_price, created_at);
+
+CREATE NONCLUSTERED INDEX IX_order_store_created
+    ON [order] (store_id, created_at)
+    INCLUDE (status, customer_id, tot_price);
+
+CREATE NONCLUSTERED INDEX IX_item_order_option
+    ON item (order_id, product_id, option_key)
+    INCLUDE (quantity);
+
+CREATE UNIQUE NONCLUSTERED INDEX UX_customer_phone
+    ON customer (phone)
+    WHERE phone IS NOT NULL;
+
+-- 結帳冪等鍵 (說明見 migrations/004_checkout_token.sql)
+CREATE UNIQUE NONCLUSTERED INDEX UX_order_checkout_token
+    ON [order] (checkout_token)
+    WHERE checkout_token IS NOT NULL;
+
+-- 銷售彙總表 (說明見 migrations/005_sales_rollups.sql)
+CREATE TABLE sales_store_hourly
+(
+    store_id    INT,
+    sale_date   DATE,
+    sale_hour   TINYINT,
+    orders      INT,
+    quantity    INT,
+    revenue     INT,
+    PRIMARY KEY (store_id, sale_date, sale_hour)
+);
+
+CREATE TABLE sales_product_daily
+(
+    store_id    INT,
+    sale_date   DATE,
+    product_id  INT,
+    quantity    INT,
+    revenue     INT,
+    PRIMARY KEY (store_id, sale_date, product_id)
+);
+
+CREATE TABLE sales_option_daily
+(
+    store_id     INT,
+    sale_date    DATE,
+    product_id   INT,
+    option_name  NVARCHAR(10),
+    option_value NVARCHAR(10),
+    quantity     INT,
+    PRIMARY KEY (store_id, sale_date, product_id, option_name, option_value)
+);
+
+-- 已完成訂單封存表 (說明見 migrations/006_order_archive.sql)
+CREATE TABLE order_archive
+(
+    order_id    INT,
+    store_id    INT NULL,
+    customer_id INT NULL,
+    tot_price   INT,
+    tot_amount  INT,
+    status      NVARCHAR(10),
+    created_at  DATETIME2 NULL,
+    checkout_token NVARCHAR(36) NULL,
+    archived_at DATETIME2 NULL CONSTRAINT DF_order_archive_archived_at DEFAULT (SYSUTCDATETIME()),
+    PRIMARY KEY (order_id)
+);
+
+CREATE TABLE item_archive
+(
+    item_id     INT,
+    order_id    INT NULL,
+    product_id  INT NULL,
+    option_key  INT NULL,
+    quantity    INT,
+    PRIMARY KEY (item_id)
+);
+
+CREATE NONCLUSTERED INDEX IX_order_archive_store_order
+    ON order_archive (store_id, order_id)
+    INCLUDE (customer_id, tot_price, status, created_at);
+
+CREATE NONCLUSTERED INDEX IX_order_archive_store_created
+    ON order_archive (store_id, created_at)
+    INCLUDE (status, customer_id, tot_price);
+
+CREATE NONCLUSTERED INDEX IX_item_archive_order
+    ON item_archive (order_id);
+
+-- 資料表版本紀錄 (已套用到哪一個 sql/migrations/*.sql)
+-- 全新建立的資料庫已經包含所有 migration 的內容，直接標記為最新版本
+CREATE TABLE schema_version
+(
+    version     INT,
+    name        NVARCHAR(100),
+    applied_at  DATETIME2 DEFAULT (SYSUTCDATETIME()),
+    PRIMARY KEY (version)
+);
+
+INSERT INTO schema_version (version, name) VALUES (1, N'identity_keys');
+INSERT INTO schema_version (version, name) VALUES (2, N'order_created_at');
+INSERT INTO schema_version (version, name) VALUES (3, N'hot_path_indexes');
+INSERT INTO schema_version (version, name) VALUES (4, N'checkout_token');
+INSERT INTO schema_version (version, name) VALUES (5, N'sales_rollups');
+INSERT INTO schema_version (version, name) VALUES (6, N'order_archive');
+INSERT INTO schema_version (version, name) VALUES (7, N'option_codes');
@@ -0,0 +1,79 @@
+import os
+import re
+import sys
+import tempfile
+
+import pytest
+
+# ================== 測試共用設定 ==================
+#
+# 全部跑在暫存的 SQLite 資料庫上 (不需要 SQL Server / ODBC Driver)：
+#   python -m pytest -q
+# web.py 在 import 時就讀環境變數 (資料庫、快取與 profile 資料夾)，所以要在 import web 之前設定好，
+# 也不會動到專案 instance/ 底下的檔案。
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TMP_DIR = tempfile.mkdtemp(prefix="drinkshop-tests-")
+os.environ.update({
+    "DB_BACKEND": "sqlite",
+    "SQLITE_PATH": os.path.join(TMP_DIR, "test.sqlite3"),
+    "CACHE_DIR": os.path.join(TMP_DIR, "cache"),
+    "PROFILE_DIR": os.path.join(TMP_DIR, "profiles"),
+    "METRICS_SAMPLE_RATE": "0",
+})
+
+STORE_ID = 92347882
+PHONE = "0912345678"
+
+
+@pytest.fixture
+def web():
+    """每個測試都從剛 init-db 完的資料庫開始 (含快取)"""
+    import web as web_module
+
+    with web_module.get_db_connection() as conn:
+        web_module.db_backend.init_schema(conn)
+        web_module.db_backend.seed(conn)
+    web_module.product_cache.invalidate()
+    web_module.store_cache.invalidate()
+    web_module.option_cache.invalidate()
+    web_module.pending_orders.clear()
+    web_module.customer_ids.clear()
+    web_module.app.config["TESTING"] = True
+    return web_module
+
+
+@pytest.fixture
+def customer(web):
+    """已登入、選好門市的顧客"""
+    client = web.app.test_client()
+    client.post("/customer_login", data={"phone": PHONE, "store_id": str(STORE_ID)})
+    return client
+
+
+@pytest.fixture
+def admin(web):
+    """已登入的店家"""
+    client = web.app.test_client()
+    client.post("/admin_login", data={"shopId": str(STORE_ID)})
+    return client
+
+
+def add_to_cart(client, product_id=1, quantity=1, size=1, ice=2, sugar=3, topping=1):
+    return client.post("/add_item", data={
+        "product_id": product_id, "size": size, "ice": ice, "sugar": sugar, "topping": topping,
+        "quantity": quantity,
+    })
+
+
+def checkout_token(client):
+    """order_summary 表單裡的冪等鍵"""
+    page = client.get("/order_summary").get_data(True)
+    return re.search(r'name="checkout_token" value="([^"]+)"', page).group(1)
+
+
+def query(web, sql, params=()):
+    with web.get_db_connection() as conn:
+        return conn.execute(sql, params).fetchall()
@@ -0,0 +1,90 @@
+import json
+import subprocess
+import sys
+import textwrap
+
+from cache import StoreResultCache, VersionedCache
+from conftest import ROOT
+
+
+def in_other_process(code, **values):
+    """在另一個 process (模擬另一個 gunicorn worker) 執行 code；values 以變數的形式傳入"""
+    setup = "".join(f"{name} = {value!r}\n" for name, value in values.items())
+    result = subprocess.run([sys.executable, "-c", setup + textwrap.dedent(code)],
+                            cwd=ROOT, capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_versioned_cache_sees_invalidate_from_other_process(tmp_path):
+    version_path = str(tmp_path / "product.version")
+    loads = []
+    cache = VersionedCache("product", lambda: loads.append(1) or len(loads), ttl=600, version_path=version_path)
+
+    assert cache.get() == 1
+    assert cache.get() == 1
+    version = cache.version
+
+    in_other_process("""
+        from cache import VersionedCache
+        VersionedCache("product", lambda: None, version_path=version_path).invalidate()
+    """, version_path=version_path)
+
+    assert cache.version != version
+    assert cache.get() == 2
+    assert cache.get() == 2
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_back_to_back_invalidates_change_version(tmp_path):
+    cache = VersionedCache("store", lambda: None, version_path=str(tmp_path / "store.version"))
+    versions = set()
+    for _ in range(20):
+        cache.invalidate()
+        versions.add(cache.version)
+    assert len(versions) == 20
+
+
+def test_store_result_cache_sees_bump_from_other_process(tmp_path):
+    folder = str(tmp_path / "pending")
+    loads = []
+
+    def loader(store_id):
+        loads.append(store_id)
+        return {"store": store_id, "load": len(loads)}
+
+    cache = StoreResultCache("pending", loader, folder, ttl=300)
+    assert cache.get(1) == {"store": 1, "load": 1}
+    assert cache.get(2) == {"store": 2, "load": 2}
+    assert cache.get(1)["load"] == 1
+
+    in_other_process("""
+        from cache import StoreResultCache
+        StoreResultCache("pending", None, folder).bump(1)
+    """, folder=folder)
+
+    # 只有被 bump 的門市重新查詢
+    assert cache.get(1) == {"store": 1, "load": 3}
+    assert cache.get(2)["load"] == 2
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_store_result_cache_shares_results_between_processes(tmp_path):
+    folder = str(tmp_path / "pending")
+    cache = StoreResultCache("pending", lambda store_id: [store_id, "訂單"], folder, ttl=300)
+    cache.bump(7)
+    cache.get(7)
+
+    # 另一個 worker 直接讀結果檔，不查資料庫 (loader 一呼叫就失敗)
+    output = in_other_process("""
+        import json
+        from cache import StoreResultCache
+
+        def loader(store_id):
+            raise AssertionError("不應該重新查詢")
+
+        cache = StoreResultCache("pending", loader, folder)
+        value = cache.get(7)
+        print(json.dumps([value, cache.stats()["file_hits"], cache.stats()["misses"]]))
+    """, folder=folder)
+    assert json.loads(output) == [[7, "訂單"], 1, 0]
@@ -0,0 +1,111 @@
+import sqlite3
+
+import pytest
+
+from conftest import STORE_ID, add_to_cart, checkout_token, query
+from db import SqlServerBackend
+
+TOKEN_INDEX = ("order", "checkout_token", "UX_order_checkout_token")
+
+
+def test_resubmitting_same_token_creates_one_order(web, customer):
+    add_to_cart(customer, product_id=1, quantity=2)
+    add_to_cart(customer, product_id=5, quantity=1)
+    token = checkout_token(customer)
+    with customer.session_transaction() as sess:
+        before_submit = dict(sess)
+
+    assert customer.post("/checkout", data={"checkout_token": token}).status_code == 302
+    # 回應遺失、瀏覽器用舊的 Session (購物車還在) 重送同一張表單
+    with customer.session_transaction() as sess:
+        sess.update(before_submit)
+    assert customer.post("/checkout", data={"checkout_token": token}).status_code == 302
+
+    orders = query(web, "SELECT order_id, tot_amount FROM [order] WHERE checkout_token = ?", (token,))
+    assert len(orders) == 1
+    assert orders[0][1] == 3
+    assert query(web, "SELECT COUNT(*) FROM item WHERE order_id = ?", (orders[0][0],))[0][0] == 2
+    # 銷售彙總只累加一次
+    assert query(web, "SELECT SUM(orders) FROM sales_store_hourly")[0][0] == 1
+    with customer.session_transaction() as sess:
+        assert sess["last_order_id"] == orders[0][0]
+
+
+def test_concurrent_submit_uses_the_other_requests_order(web, customer, monkeypatch):
+    """SELECT 時還沒有訂單，INSERT 前另一個 request 先寫入同一個 token：改用它的訂單，不會 500"""
+    add_to_cart(customer)
+    token = checkout_token(customer)
+    real_insert = web.db_backend.insert_returning
+
+    def insert_after_other_request(cursor, table, columns, values, key):
+        with web.db_pool.connection() as other:
+            other.execute(
+                "INSERT INTO [order] (customer_id, store_id, status, tot_price, checkout_token) VALUES (1, ?, ?, 50, ?)",
+                (STORE_ID, "未完成", token),
+            )
+            other.commit()
+        return real_insert(cursor, table, columns, values, key)
+
+    monkeypatch.setattr(web.db_backend, "insert_returning", insert_after_other_request)
+    assert customer.post("/checkout", data={"checkout_token": token}).status_code == 302
+
+    orders = query(web, "SELECT order_id FROM [order] WHERE checkout_token = ?", (token,))
+    assert len(orders) == 1
+    with customer.session_transaction() as sess:
+        assert sess["last_order_id"] == orders[0][0]
+
+
+def test_other_integrity_errors_are_not_treated_as_resubmits(web, customer):
+    add_to_cart(customer)
+    token = checkout_token(customer)
+    # 登入後門市被刪除：外鍵錯誤要照常丟出，不能被當成重送
+    with customer.session_transaction() as sess:
+        sess["current_store_id"] = "999"
+    with pytest.raises(sqlite3.IntegrityError):
+        customer.post("/checkout", data={"checkout_token": token})
+    assert query(web, "SELECT COUNT(*) FROM [order]")[0][0] == 0
+
+
+def sqlite_error(web, sql, params=()):
+    with web.get_db_connection() as conn:
+        with pytest.raises(sqlite3.IntegrityError) as info:
+            conn.execute(sql, params)
+        conn.rollback()
+    return info.value
+
+
+def test_sqlite_is_duplicate_key(web):
+    backend = web.db_backend
+    with web.get_db_connection() as conn:
+        conn.execute("INSERT INTO [order] (store_id, checkout_token) VALUES (?, 't-1')", (STORE_ID,))
+        conn.execute("INSERT INTO customer (phone) VALUES ('0900000001')")
+        conn.commit()
+
+    duplicate_token = sqlite_error(web, "INSERT INTO [order] (store_id, checkout_token) VALUES (?, 't-1')", (STORE_ID,))
+    foreign_key = sqlite_error(web, "INSERT INTO [order] (store_id, checkout_token) VALUES (999, 't-2')")
+    other_unique = sqlite_error(web, "INSERT INTO customer (phone) VALUES ('0900000001')")
+
+    assert backend.is_duplicate_key(duplicate_token, *TOKEN_INDEX)
+    assert not backend.is_duplicate_key(foreign_key, *TOKEN_INDEX)
+    assert not backend.is_duplicate_key(other_unique, *TOKEN_INDEX)
+
+
+def pyodbc_error(message, native):
+    """pyodbc.IntegrityError 的 args 格式：(SQLSTATE, '[SQLSTATE] [driver]...訊息 (原生錯誤碼) (SQLExecDirectW)')"""
+    return Exception("23000", f"[23000] [Microsoft][ODBC Driver 18 for SQL Server][SQL Server]{message} ({native}) (SQLExecDirectW)")
+
+
+@pytest.mark.parametrize("exc, expected", [
+    (pyodbc_error("Cannot insert duplicate key row in object 'dbo.order' with unique index "
+                  "'UX_order_checkout_token'. The duplicate key value is (t-1).", 2601), True),
+    (pyodbc_error("無法在具有唯一索引 'UX_order_checkout_token' 的物件 'dbo.order' 中插入重複的索引鍵資料列。", 2601), True),
+    (pyodbc_error("Violation of UNIQUE KEY constraint 'UX_order_checkout_token'. Cannot insert duplicate key.", 2627), True),
+    (pyodbc_error("Cannot insert duplicate key row in object 'dbo.customer' with unique index "
+                  "'UX_customer_phone'.", 2601), False),
+    (pyodbc_error("The INSERT statement conflicted with the FOREIGN KEY constraint \"FK_order_store\". "
+                  "The conflict occurred in database \"DrinkShopDB\", table \"dbo.store\".", 547), False),
+    # 錯誤碼不對：訊息剛好提到索引名稱也不算
+    (pyodbc_error("The statement has been terminated. 'UX_order_checkout_token'", 3621), False),
+])
+def test_sql_server_is_duplicate_key(exc, expected):
+    assert SqlServerBackend("").is_duplicate_key(exc, *TOKEN_INDEX) is expected
@@ -0,0 +1,64 @@
+import html
+import re
+
+import pytest
+
+from conftest import STORE_ID, query
+
+ORDER_ID = re.compile(r"admin_select_order\?order_id=(\d+)")
+NEWER = re.compile(r'<a href="([^"]+)"[^>]*>← 較新的訂單')
+OLDER = re.compile(r'<a href="([^"]+)"[^>]*>較舊的訂單 →')
+
+
+@pytest.fixture
+def history(web, monkeypatch):
+    """熱資料與封存交錯的已完成訂單，另外混入未完成與其他門市的訂單"""
+    other_store = query(web, "SELECT MIN(store_id) FROM store WHERE store_id <> ?", (STORE_ID,))[0][0]
+    expected = []
+    with web.get_db_connection() as conn:
+        for order_id in range(1, 61):
+            table = "order_archive" if order_id % 3 else "[order]"
+            store_id, status = STORE_ID, "已完成"
+            if order_id % 11 == 0:
+                status = "未完成"
+            elif order_id % 13 == 0:
+                store_id = other_store
+            else:
+                expected.append(order_id)
+            conn.execute(
+                f"INSERT INTO {table} (order_id, store_id, customer_id, tot_price, tot_amount, status) "
+                "VALUES (?, ?, 1, 100, 1, ?)",
+                (order_id, store_id, status),
+            )
+        conn.commit()
+    monkeypatch.setattr(web, "HISTORY_PAGE_SIZE", 7)
+    return sorted(expected, reverse=True)
+
+
+def read_page(admin, url):
+    page = admin.get(url).get_data(True)
+    ids = [int(i) for i in ORDER_ID.findall(page)]
+    newer, older = NEWER.search(page), OLDER.search(page)
+    return ids, newer and html.unescape(newer.group(1)), older and html.unescape(older.group(1))
+
+
+def test_keyset_pages_cover_both_tiers_without_gaps(admin, history):
+    pages, url = [], "/admin_history_orders"
+    while url:
+        ids, _, url = read_page(admin, url)
+        assert ids == sorted(set(ids), reverse=True)
+        assert 0 < len(ids) <= 7
+        pages.append(ids)
+
+    seen = [order_id for ids in pages for order_id in ids]
+    assert seen == history
+    assert all(len(ids) == 7 for ids in pages[:-1])
+
+    # 從最後一頁往回翻，每一頁都要和往前翻時一模一樣
+    ids, url, _ = read_page(admin, "/admin_history_orders?before=%d" % pages[-2][-1])
+    assert ids == pages[-1]
+    for expected in reversed(pages[:-1]):
+        assert url
+        ids, url, _ = read_page(admin, url)
+        assert ids == expected
+    assert url is None
@@ -0,0 +1,52 @@
+import itertools
+
+from conftest import add_to_cart
+
+
+def all_combinations(web):
+    choices = web.option_cache.get()["choices"]
+    return itertools.product(*([c["code"] for c in choices[name]] for name in web.OPTION_NAMES))
+
+
+def expected_labels(web, codes):
+    labels = web.option_cache.get()["labels"]
+    return {name: labels[name][code] for name, code in zip(web.OPTION_NAMES, codes)}
+
+
+def test_seeded_options_round_trip(web):
+    with web.app.app_context():
+        combinations = list(all_combinations(web))
+        assert combinations
+        for codes in combinations:
+            assert web.option_labels(web.pack_options(codes)) == expected_labels(web, codes)
+
+
+def test_highest_code_round_trips(web):
+    """代碼 127 (migration 007 的上限) 放在最高位元組也不會變成負數或溢位"""
+    with web.get_db_connection() as conn:
+        for name in web.OPTION_NAMES:
+            conn.execute("INSERT INTO drink_option (option_name, option_code, label) VALUES (?, 127, ?)",
+                         (name, f"{name}-127"))
+        conn.commit()
+    web.option_cache.invalidate()
+
+    with web.app.app_context():
+        key = web.pack_options((127, 127, 127, 127))
+        assert 0 < key < 2 ** 31
+        assert web.option_labels(key) == {name: f"{name}-127" for name in web.OPTION_NAMES}
+        for codes in all_combinations(web):
+            assert web.option_labels(web.pack_options(codes)) == expected_labels(web, codes)
+
+
+def test_unknown_codes_show_dash(web):
+    with web.app.app_context():
+        labels = web.option_labels(web.pack_options((1, 126, 1, 126)))
+        assert labels["ice"] == labels["topping"] == "-"
+        assert web.option_labels(None) == {name: "-" for name in web.OPTION_NAMES}
+
+
+def test_add_item_stores_packed_key(web, customer):
+    add_to_cart(customer, product_id=1, size=2, ice=3, sugar=1, topping=2, quantity=2)
+    add_to_cart(customer, product_id=1, size=2, ice=3, sugar=1, topping=2, quantity=1)
+    with customer.session_transaction() as sess:
+        assert sess["cart"] == [[1, web.pack_options((2, 3, 1, 2)), 3]]
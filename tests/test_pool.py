@@ -0,0 +1,101 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import db
+from db import ConnectionPool, PoolTimeout
+
+
+class Connector:
+    """記錄建立過的 in-memory sqlite 連線，並把 close() 記下來"""
+
+    def __init__(self):
+        self.opened = []
+        self.closed = []
+
+    def __call__(self):
+        conn = TrackedConnection(self)
+        self.opened.append(conn)
+        return conn
+
+
+class TrackedConnection:
+    def __init__(self, connector):
+        self._connector = connector
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        self._connector.closed.append(self)
+        self._conn.close()
+
+
+def test_fill_opens_min_size_connections():
+    connect = Connector()
+    pool = ConnectionPool(connect, min_size=3, max_size=5)
+    pool.fill()
+    pool.fill()
+    stats = pool.stats()
+    assert len(connect.opened) == 3
+    assert (stats["size"], stats["idle"], stats["in_use"], stats["created"]) == (3, 3, 0, 3)
+
+    # 預先建立的連線直接拿來用，不再另外連線
+    with pool.connection():
+        pass
+    assert len(connect.opened) == 3
+
+
+def test_warm_up_fills_in_background():
+    connect = Connector()
+    pool = ConnectionPool(connect, min_size=2, max_size=4)
+    pool.warm_up()
+    pool.warm_up()
+    deadline = time.monotonic() + 5
+    while pool.stats()["idle"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.stats()["idle"] == 2
+    assert len(connect.opened) == 2
+
+
+def test_acquire_times_out_when_pool_is_exhausted():
+    pool = ConnectionPool(Connector(), min_size=0, max_size=2, timeout=0.1)
+    held = [pool.acquire(), pool.acquire()]
+
+    started = time.monotonic()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    assert time.monotonic() - started >= 0.1
+    stats = pool.stats()
+    assert (stats["waits"], stats["timeouts"], stats["in_use"]) == (1, 1, 2)
+
+    # 有人歸還後，排隊中的 thread 拿得到連線
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    pool.timeout = 5
+    waiter.start()
+    pool.release(held.pop())
+    waiter.join(5)
+    assert len(got) == 1
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_forked_child_does_not_reuse_parent_connections(monkeypatch):
+    connect = Connector()
+    pool = ConnectionPool(connect, min_size=2, max_size=2, timeout=0.1)
+    pool.fill()
+    parent_conn = pool.acquire()
+    parent_pid = pool.stats()["pid"]
+
+    # 模擬 gunicorn fork 出 worker：pid 變了
+    monkeypatch.setattr(db.os, "getpid", lambda: parent_pid + 1)
+    pool.release(parent_conn)   # 父 process 的連線不能歸還到子 process 的池
+    child_conn = pool.acquire()
+    stats = pool.stats()
+    assert child_conn not in connect.opened[:2]
+    assert (stats["pid"], stats["size"], stats["in_use"], stats["idle"], stats["created"]) == (parent_pid + 1, 1, 1, 0, 1)
+    # 父 process 的連線直接丟掉，不 close (socket 還是父 process 在用)
+    assert connect.closed == []
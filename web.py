@@ -1,7 +1,18 @@
-from flask import Flask, render_template, request, redirect, url_for, session
-import pyodbc
-from datetime import date
+from flask import Flask, Response, abort, g, render_template, request, redirect, send_file, url_for, session, jsonify
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+import click
+import hashlib
+import json
+import os
 import re
+import uuid
+
+from cache import LruCache, StoreResultCache, VersionedCache
+from db import ConnectionPool, apply_migrations, create_backend, read_seed_csv, write_seed_csv
+from metrics import RequestMetrics
+from profiler import RequestProfiler
+from order_feed import OrderFeed
 
 app = Flask(
     __name__,
@@ -12,25 +23,336 @@ app = Flask(
 
 app.secret_key = 'drinkshop_secret_key'
 
-# ---------- Azure SQL Connection Config ----------
-server = 'drinkshop-sqlserver.database.windows.net,1433'
-database = 'DrinkShopDB'
-username = 'drinkshopadmin'
-password = 'DrinkShop2025'
-
-conn_str = (
-    "DRIVER={ODBC Driver 17 for SQL Server};"
-    f"SERVER={server};"
-    f"DATABASE={database};"
-    f"UID={username};"
-    f"PWD={password};"
-    "Encrypt=yes;"
-    "TrustServerCertificate=no;"
-    "Connection Timeout=30;"
+# ---------- Database Backend Config ----------
+# DB_BACKEND=mssql (預設，Azure SQL) 或 DB_BACKEND=sqlite (本機壓測用，先執行 flask --app web init-db)
+db_backend = create_backend()
+
+# ---------- Connection Pool Config ----------
+# 每個 gunicorn worker 各自一組連線池，總連線數 = worker 數 x DB_POOL_MAX
+db_pool = ConnectionPool(
+    db_backend.connect,
+    min_size=int(os.environ.get("DB_POOL_MIN", 1)),
+    max_size=int(os.environ.get("DB_POOL_MAX", 10)),
+    timeout=float(os.environ.get("DB_POOL_TIMEOUT", 10)),
+    recycle=float(os.environ.get("DB_POOL_RECYCLE", 1800)),
+    ping_after=float(os.environ.get("DB_POOL_PING_AFTER", 30)),
+)
+
+# worker 收到第一個 request 時在背景先建好 DB_POOL_MIN 條連線
+# (不在 import 時建立：gunicorn --preload 會在 fork 前 import，父 process 的連線不能給 worker 用)
+@app.before_request
+def warm_db_pool():
+    db_pool.warm_up()
+
+# ---------- Request Metrics Config ----------
+# 每個 request 都記錄耗時；METRICS_SAMPLE_RATE 比例的 request 另外量資料庫查詢與模板 render
+# (預設 0.05，正式環境的額外負擔可以忽略；本機除錯或壓測時設成 1 量每一個 request)
+# 超過 SLOW_QUERY_MS 的查詢會連同 SQL 與參數寫進 log；統計值從 /metrics 以 Prometheus 格式輸出
+request_metrics = RequestMetrics(
+    sample_rate=float(os.environ.get("METRICS_SAMPLE_RATE", 0.05)),
+    slow_query_ms=float(os.environ.get("SLOW_QUERY_MS", 200)),
+)
+request_metrics.init_app(app)
+
+# ---------- Request Profiler Config ----------
+# 已登入的店家帶 X-Profile: 1 header 或 ?_profile=1 時，profile 這個 request；
+# PROFILE_SAMPLE_N=N 則每 N 個 request 自動 profile 一次 (0 = 關閉)。結果列在 /admin_profiles
+def profile_requested():
+    if not session.get('admin_store_id'):
+        return False
+    return request.headers.get("X-Profile") == "1" or request.args.get("_profile") == "1"
+
+request_profiler = RequestProfiler(
+    os.environ.get("PROFILE_DIR", os.path.join(app.instance_path, "profiles")),
+    sample_every=int(os.environ.get("PROFILE_SAMPLE_N", 0)),
+    interval=float(os.environ.get("PROFILE_INTERVAL_MS", 1)) / 1000,
+    keep=int(os.environ.get("PROFILE_KEEP", 200)),
+    should_profile=profile_requested,
+)
+request_profiler.init_app(
+    app, store_id=lambda: session.get('admin_store_id') or session.get('current_store_id')
 )
 
+@contextmanager
 def get_db_connection():
-    return pyodbc.connect(conn_str)
+    """用法：with get_db_connection() as conn: ... 離開 with 區塊時自動歸還連線池"""
+    with db_pool.connection() as conn:
+        wrapped = request_metrics.wrap(conn)
+        try:
+            yield wrapped
+        finally:
+            if wrapped is not conn:
+                wrapped.close_cursors()
+
+# ---------- 商品目錄 / 門市清單快取 ----------
+# 幾乎不會變動的資料放在記憶體，更新商品或門市後呼叫 /admin_cache_invalidate (或 flask invalidate-cache)
+CATALOG_CACHE_TTL = float(os.environ.get("CATALOG_CACHE_TTL", 600))
+# 各快取的版本檔 / 共用結果檔放在這裡 (同一台機器的 worker 共用)；壓測之類的暫時環境請指到別的資料夾
+CACHE_DIR = os.environ.get("CACHE_DIR", app.instance_path)
+
+# python_image/build_images.py 產生的縮圖清單；還沒建置過就沿用原圖
+IMAGE_MANIFEST_PATH = os.path.join(app.static_folder, "build", "image_manifest.json")
+
+def load_image_manifest():
+    try:
+        with open(IMAGE_MANIFEST_PATH, encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest["images"], manifest["formats"]
+    except (FileNotFoundError, ValueError, KeyError):
+        return {}, []
+
+def photo_variants(entry):
+    """manifest 的一筆 → 縮圖共用的網址前綴、寬度、預設 src 與佔位底色
+    (完整 srcset 由點餐頁的 JS 用前綴 + 寬度組出來，避免 HTML 塞進上千個網址)"""
+    jpegs = entry["variants"]["jpeg"]
+    # 檔名格式為 <原檔名>.<雜湊>.<寬度>.<副檔名>，去掉後兩段就是前綴
+    base = jpegs[0]["file"].rsplit(".", 2)[0]
+    # 不支援 srcset 的瀏覽器拿中間尺寸，大約等於點餐頁圖片框的寬度
+    return {
+        "base": url_for('static', filename=base),
+        "widths": ",".join(str(v["w"]) for v in jpegs),
+        "src": url_for('static', filename=jpegs[len(jpegs) // 2]["file"]),
+        "color": entry["color"],
+    }
+
+def load_products():
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT product_id, name, photo_url, price FROM product")
+        rows = cursor.fetchall()
+
+    images, image_formats = load_image_manifest()
+
+    # 靜態圖片網址在載入時就先算好，不必每次 render 都跑 url_for
+    products = []
+    for row in rows:
+        raw_url = row[2] if row[2] else ""
+        clean_path = raw_url[len("static/"):] if raw_url.startswith("static/") else raw_url
+        final_url = url_for('static', filename=clean_path) if clean_path else ""
+        entry = images.get(clean_path)
+        products.append({
+            "id": row[0], "name": row[1], "photo_url": final_url, "price": row[3] or 0,
+            "photo": photo_variants(entry) if entry else None,
+        })
+    # 圖片網址帶著 ?v= / 雜湊檔名：圖片換了但目錄版本沒變時，頁面的 ETag 也要跟著變
+    urls = [p["photo_url"] + (p["photo"]["src"] if p["photo"] else "") for p in products]
+    static_digest = hashlib.sha1("|".join(urls).encode("utf-8")).hexdigest()[:10]
+    return {
+        "list": products, "by_id": {p["id"]: p for p in products},
+        "image_formats": image_formats, "static_digest": static_digest,
+    }
+
+def load_stores():
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT store_id, name FROM store")
+        rows = cursor.fetchall()
+    return {
+        "list": [{"id": r[0], "name": r[1]} for r in rows],
+        "names": {r[0]: r[1] for r in rows},
+    }
+
+product_cache = VersionedCache(
+    "product", load_products, ttl=CATALOG_CACHE_TTL,
+    version_path=os.path.join(CACHE_DIR, "product.version"),
+)
+store_cache = VersionedCache(
+    "store", load_stores, ttl=CATALOG_CACHE_TTL,
+    version_path=os.path.join(CACHE_DIR, "store.version"),
+)
+
+# 熟客的 電話 → customer_id (顧客資料建立後不會改變，程式也不會刪除顧客)
+customer_ids = LruCache("customer_id", max_size=int(os.environ.get("CUSTOMER_CACHE_SIZE", 10000)))
+
+# ---------- 飲料選項代碼 ----------
+# item 只存打包後的 option_key (說明見 sql/migrations/007_option_codes.sql)，代碼 ↔ 文字的對照放在記憶體。
+# 新增選項：在 drink_option 加一列後執行 flask --app web invalidate-cache，點餐頁就會出現
+OPTION_NAMES = ("size", "ice", "sugar", "topping")   # option_key 由低位元組到高位元組的順序
+
+def load_options():
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT option_name, option_code, label FROM drink_option ORDER BY option_name, option_code")
+        rows = cursor.fetchall()
+    choices = {name: [] for name in OPTION_NAMES}
+    for name, code, label in rows:
+        if name in choices:
+            choices[name].append({"code": code, "label": label})
+    return {
+        "choices": choices,
+        "labels": {name: {c["code"]: c["label"] for c in values} for name, values in choices.items()},
+        "codes": {name: {c["label"]: c["code"] for c in values} for name, values in choices.items()},
+    }
+
+option_cache = VersionedCache(
+    "option", load_options, ttl=CATALOG_CACHE_TTL,
+    version_path=os.path.join(CACHE_DIR, "option.version"),
+)
+
+def pack_options(codes):
+    """(size, ice, sugar, topping) 代碼 → option_key"""
+    return sum(code << (8 * i) for i, code in enumerate(codes))
+
+def option_labels(option_key):
+    """option_key → {"size": "中杯", "ice": ..., ...}；不認得的代碼顯示 "-" """
+    labels = option_cache.get()["labels"]
+    key = option_key or 0
+    return {
+        name: labels[name].get((key >> (8 * i)) & 0xFF, "-")
+        for i, name in enumerate(OPTION_NAMES)
+    }
+
+# ---------- 靜態檔指紋 / HTTP 快取 ----------
+# url_for('static', ...) 自動加上 ?v=<內容雜湊>，檔案內容一變網址就變，因此可以讓瀏覽器快取一年不再詢問。
+# python_image 產生的縮圖檔名本身就帶雜湊，不必再加 ?v=
+STATIC_MAX_AGE = 365 * 24 * 3600
+HASHED_STATIC_NAME = re.compile(r"\.[0-9a-f]{10}\.\d+\.\w+$")
+_static_hashes = {}   # filename -> ((mtime_ns, size), digest)
+_template_statics = {}   # 模板 -> 上一次 render 時產生過網址的 static 檔名
+
+def static_fingerprint(filename):
+    path = os.path.join(app.static_folder, filename)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _static_hashes.get(filename)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:10]
+    _static_hashes[filename] = (key, digest)
+    return digest
+
+@app.url_defaults
+def add_static_fingerprint(endpoint, values):
+    if endpoint != "static" or "v" in values:
+        return
+    filename = values.get("filename", "")
+    if HASHED_STATIC_NAME.search(filename):
+        return
+    digest = static_fingerprint(filename)
+    if digest:
+        values["v"] = digest
+        used = g.get("static_files")
+        if used is not None:
+            used.add(filename)
+
+@app.after_request
+def static_cache_headers(response):
+    # 只有帶指紋的網址才能 immutable；沒帶 ?v= 的照 Flask 預設 (每次用 ETag / Last-Modified 確認)
+    if request.endpoint == "static" and response.status_code in (200, 304):
+        filename = (request.view_args or {}).get("filename", "")
+        if request.args.get("v") or HASHED_STATIC_NAME.search(filename):
+            response.cache_control.public = True
+            response.cache_control.no_cache = None
+            response.cache_control.max_age = STATIC_MAX_AGE
+            response.cache_control.immutable = True
+    return response
+
+def template_version(name):
+    try:
+        return os.stat(os.path.join(app.root_path, app.template_folder, name)).st_mtime_ns
+    except OSError:
+        return 0
+
+def template_static_version(name):
+    """模板直接引用的 static 檔 (背景圖等) 目前的指紋；這個 process 還沒 render 過就回 None"""
+    files = _template_statics.get(name)
+    if files is None:
+        return None
+    return ",".join(static_fingerprint(f) or "-" for f in files)
+
+def catalog_etag(template, etag_parts=()):
+    key = "|".join(str(p) for p in (
+        product_cache.version, store_cache.version, option_cache.version, product_cache.get()["static_digest"],
+        template_version(template), template_static_version(template), *etag_parts
+    ))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+
+def render_catalog_page(template, etag_parts=(), **context):
+    """商品 / 門市目錄產生的頁面：目錄版本、模板與頁面上的個人資料都沒變就回 304，不重新 render。
+    etag_parts 必須涵蓋畫面上所有會因人而異的值 (電話、門市、日期...)"""
+    etag = catalog_etag(template, etag_parts)
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        # 記下頁面用到哪些 static 檔，之後 static 檔內容變了 (?v= 跟著變) ETag 也會不同
+        g.static_files = set()
+        response = Response(render_template(template, **context))
+        _template_statics[template] = tuple(sorted(g.pop("static_files")))
+        etag = catalog_etag(template, etag_parts)
+    response.set_etag(etag)
+    # 內容因人而異：只能存在瀏覽器 (private)，每次使用前都要帶 If-None-Match 回來確認 (no-cache)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+# ---------- 歷史訂單分頁 / 時區 ----------
+HISTORY_PAGE_SIZE = int(os.environ.get("HISTORY_PAGE_SIZE", 50))
+HISTORY_COUNT_CAP = int(os.environ.get("HISTORY_COUNT_CAP", 1000))
+# 資料庫一律存 UTC (SYSUTCDATETIME)，門市看到的日期 / 時間要換算成當地時間
+STORE_UTC_OFFSET = timedelta(hours=float(os.environ.get("STORE_UTC_OFFSET_HOURS", 8)))
+
+def parse_local_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
+def local_date_to_utc(value):
+    return (value - STORE_UTC_OFFSET).strftime("%Y-%m-%d %H:%M:%S")
+
+def format_local_time(value):
+    if not value:
+        return "-"
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return (value + STORE_UTC_OFFSET).strftime("%Y-%m-%d %H:%M")
+
+# ---------- 待處理訂單即時推播 ----------
+# 每個 worker 一條偵測 thread；SSE 連線會占住一條 thread (最多 ORDER_FEED_MAX_AGE 秒)，
+# 所以 gunicorn 必須用 gthread worker (設定見 gunicorn.conf.py)
+order_feed = OrderFeed(
+    get_db_connection,
+    interval=float(os.environ.get("ORDER_FEED_INTERVAL", 2)),
+    max_age=float(os.environ.get("ORDER_FEED_MAX_AGE", 300)),
+)
+
+# ---------- 待處理訂單快取 ----------
+# 每家門市一個版本號，結帳與更新訂單狀態時 bump；平板重新整理時版本沒變就直接用快取 (或回 304)，不查資料庫
+PENDING_ORDERS_SQL = """
+    SELECT o.order_id, c.phone, o.status, o.tot_price
+    FROM [order] o 
+    LEFT JOIN customer c ON o.customer_id = c.customer_id
+    WHERE o.store_id = ? 
+      AND COALESCE(o.tot_price, 0) > 0 
+      AND o.status = ?
+    ORDER BY o.order_id ASC
+"""
+
+def load_pending_orders(store_id):
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(PENDING_ORDERS_SQL, (store_id, "未完成"))
+        return [
+            { "order_id": r[0], "phone": r[1] or "未知", "status": r[2] or "未完成", "tot_price": r[3] or 0 } 
+            for r in cursor.fetchall()
+        ]
+
+pending_orders = StoreResultCache(
+    "pending_orders", load_pending_orders,
+    folder=os.path.join(CACHE_DIR, "pending_orders"),
+    ttl=int(os.environ.get("PENDING_ORDERS_CACHE_TTL", 300)),
+)
+
+def get_store_name(store_id):
+    try:
+        return store_cache.get()["names"].get(int(store_id), "未知店家")
+    except (TypeError, ValueError):
+        return "未知店家"
 
 # ================== 路由設定 ==================
 
@@ -40,6 +362,54 @@ def get_db_connection():
 def index():
     return render_template("index.html")
 
+# 連線池狀態 (使用中、等待次數、逾時次數…)；只有登入的店家看得到 (Prometheus 請用 /metrics)
+@app.route("/pool_stats")
+def pool_stats():
+    if not session.get('admin_store_id'): return redirect(url_for("admin_login"))
+    return jsonify(db_pool.stats())
+
+# 快取命中率 (misses 只在 TTL 到期或失效後增加，代表真的有去查資料庫)；只有登入的店家看得到
+@app.route("/cache_stats")
+def cache_stats():
+    if not session.get('admin_store_id'): return redirect(url_for("admin_login"))
+    return jsonify([product_cache.stats(), store_cache.stats(), option_cache.stats(), customer_ids.stats(),
+                    pending_orders.stats()])
+
+# 即時推播狀態 (訂閱中的門市 / 連線數、偵測次數)；只有登入的店家看得到
+@app.route("/order_feed_stats")
+def order_feed_stats():
+    if not session.get('admin_store_id'): return redirect(url_for("admin_login"))
+    return jsonify(order_feed.stats())
+
+# Prometheus 抓取用：request 耗時 / 資料庫 / 模板統計，加上連線池、快取與推播的數字
+# (每個 gunicorn worker 各自累計；連線池的數字附上 pid，方便看出是哪個 worker)
+@app.route("/metrics")
+def metrics():
+    pool = db_pool.stats()
+    pid = {"pid": pool["pid"]}
+    caches = [product_cache.stats(), store_cache.stats(), option_cache.stats(), customer_ids.stats()]
+    pending = pending_orders.stats()
+    feed = order_feed.stats()
+    extra = [
+        ("db_pool_connections", "gauge", "Connections in the pool by state",
+         [(dict(pid, state="in_use"), pool["in_use"]), (dict(pid, state="idle"), pool["idle"])]),
+        ("db_pool_max_size", "gauge", "Pool max size", [(pid, pool["max_size"])]),
+    ]
+    for key in ("checkouts", "created", "recycled", "failed_health_checks", "discarded", "waits", "timeouts", "wait_seconds"):
+        extra.append((f"db_pool_{key}_total", "counter", f"Pool {key.replace('_', ' ')}", [(pid, pool[key])]))
+    extra += [
+        ("cache_hits_total", "counter", "In-process cache hits", [({"cache": c["name"]}, c["hits"]) for c in caches]),
+        ("cache_misses_total", "counter", "In-process cache misses (DB loads)", [({"cache": c["name"]}, c["misses"]) for c in caches]),
+        ("pending_orders_cache_total", "counter", "Pending order list lookups by result",
+         [({"result": "memory_hit"}, pending["hits"]), ({"result": "file_hit"}, pending["file_hits"]),
+          ({"result": "miss"}, pending["misses"])]),
+        ("pending_orders_cache_bumps_total", "counter", "Store version bumps from order writes", [({}, pending["bumps"])]),
+        ("order_feed_subscribers", "gauge", "Open SSE connections", [({}, feed["subscribers"])]),
+        ("order_feed_polls_total", "counter", "Order feed DB polls", [({}, feed["polls"])]),
+        ("order_feed_events_total", "counter", "Order feed events sent", [({}, feed["events_sent"])]),
+    ]
+    return Response(request_metrics.render(extra), mimetype="text/plain; version=0.0.4")
+
 # ================== 店家端 (Admin) ==================
 
 @app.route("/admin_login", methods=["GET", "POST"])
@@ -47,11 +417,10 @@ def index():
 def admin_login():
     if request.method == "POST":
         store_id = request.form.get("shopId", "").strip()
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT store_id, name FROM store WHERE store_id = ?", (store_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT store_id, name FROM store WHERE store_id = ?", (store_id,))
+            row = cursor.fetchone()
 
         if row:
             session['admin_store_id'] = row[0]
@@ -63,6 +432,15 @@ def admin_login():
             return render_template("admin_login.html", error_msg="店家 ID 不存在", old_shopId=store_id)
     return render_template("admin_login.html")
 
+# 商品或門市資料異動後，讓所有 worker 的快取失效
+@app.route("/admin_cache_invalidate", methods=["POST"])
+def admin_cache_invalidate():
+    if not session.get('admin_store_id'): return redirect(url_for("admin_login"))
+    product_cache.invalidate()
+    store_cache.invalidate()
+    option_cache.invalidate()
+    return jsonify([product_cache.stats(), store_cache.stats(), option_cache.stats()])
+
 # ✅ 新增：專門處理「選取訂單」的路由 (寫入 Session 並轉跳)
 @app.route("/admin_select_order")
 def admin_select_order():
@@ -73,7 +451,9 @@ def admin_select_order():
         session['admin_selected_id'] = order_id
     
     if source == 'history':
-        return redirect(url_for('admin_history_orders'))
+        # 保留歷史訂單頁的篩選條件與目前頁數
+        keep = {k: v for k, v in request.args.items() if k not in ('order_id', 'source')}
+        return redirect(url_for('admin_history_orders', **keep))
     else:
         return redirect(url_for('admin_orders'))
 
@@ -87,33 +467,25 @@ def admin_orders():
     selected_id = session.get('admin_selected_id')
 
     if not store_id: return redirect(url_for("admin_login"))
-    
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # 1. 列表：只撈未完成
-    cursor.execute("""
-        SELECT o.order_id, c.phone, o.status, o.tot_price
-        FROM [order] o 
-        LEFT JOIN customer c ON o.customer_id = c.customer_id
-        WHERE o.store_id = ? 
-          AND ISNULL(o.tot_price, 0) > 0 
-          AND o.status = N'未完成'
-        ORDER BY o.order_id ASC
-    """, (store_id,))
-    
-    orders = [
-        { "order_id": r[0], "phone": r[1] or "未知", "status": r[2] or "未完成", "tot_price": r[3] or 0 } 
-        for r in cursor.fetchall()
-    ]
 
-    # 2. 明細 (共用函式)
-    selected_info, selected_items = get_order_details(conn, selected_id, store_id)
+    # 門市的訂單版本沒變、選取的訂單也一樣：瀏覽器手上那份就是最新的，只花一次 os.stat 就回 304
+    version = pending_orders.version(store_id)
+    etag_parts = (store_id, store_name, selected_id, version)
+    if request.if_none_match.contains(catalog_etag("admin_order.html", etag_parts)):
+        return render_catalog_page("admin_order.html", etag_parts)
 
-    conn.close()
+    # 1. 列表：只撈未完成 (同一個版本所有 worker 共用一份查詢結果)
+    orders = pending_orders.get(store_id, version)
+
+    # 2. 明細 (共用函式)
+    selected_info, selected_items = None, []
+    if selected_id:
+        with get_db_connection() as conn:
+            selected_info, selected_items = get_order_details(conn, selected_id, store_id)
     
-    return render_template(
+    return render_catalog_page(
         "admin_order.html", 
+        etag_parts,
         orders=orders, 
         store_id=store_id, 
         store_name=store_name,
@@ -121,6 +493,43 @@ def admin_orders():
         selected_items=selected_items
     )
 
+# 待處理訂單即時推播 (admin_order.html 以 EventSource 訂閱，只收新增 / 變動 / 完成的訂單)
+@app.route("/admin_orders/stream")
+def admin_orders_stream():
+    store_id = session.get('admin_store_id')
+    if not store_id: return redirect(url_for("admin_login"))
+
+    return Response(
+        order_feed.stream(store_id),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# 最近的 profile 清單 (下載的 JSON 拖進 https://www.speedscope.app 即可看 flame graph)
+# profile 含完整的網址與查詢字串，每家門市只看得到自己門市的紀錄 (沒有門市的 request 只能從伺服器上的資料夾取得)
+@app.route("/admin_profiles")
+def admin_profiles():
+    if not session.get('admin_store_id'):
+        return redirect(url_for("admin_login"))
+    captures = request_profiler.list_captures(store_id=session['admin_store_id'])
+    for c in captures:
+        c["captured_at"] = format_local_time(c["captured_at"].replace(tzinfo=None))
+    return render_template(
+        "admin_profiles.html",
+        store_name=session.get('admin_store_name', '店家'),
+        captures=captures,
+        sample_every=request_profiler.sample_every,
+    )
+
+@app.route("/admin_profiles/<name>")
+def admin_profile_file(name):
+    if not session.get('admin_store_id'):
+        return redirect(url_for("admin_login"))
+    path = request_profiler.path_for(name, store_id=session['admin_store_id'])
+    if path is None:
+        abort(404)
+    return send_file(path, mimetype="application/json", as_attachment=True, download_name=name)
+
 # ✅ 更新狀態
 @app.route("/admin_update_status", methods=["POST"])
 def admin_update_status():
@@ -128,59 +537,83 @@ def admin_update_status():
     order_id = request.form.get("order_id")
     
     if store_id and order_id:
-        conn = get_db_connection()
-        conn.execute("UPDATE [order] SET status = N'已完成' WHERE order_id = ? AND store_id = ?", (order_id, store_id))
-        conn.commit()
-        conn.close()
+        with get_db_connection() as conn:
+            conn.execute("UPDATE [order] SET status = ? WHERE order_id = ? AND store_id = ?", ("已完成", order_id, store_id))
+            conn.commit()
+        pending_orders.bump(store_id)
+        order_feed.notify()
         
         # 訂單完成後，清除目前的選取狀態，避免畫面右側還顯示那張已經消失的訂單
         session.pop('admin_selected_id', None)
         
     return redirect(url_for("admin_orders"))
 
-# 輔助函式：避免重複寫查詢明細的程式碼
+# 輔助函式：一次查詢取回訂單 Header + 店名 + 電話 + 所有明細
+# 小計、總金額、總杯數都在 SQL 內算好 (window function)，只需要一個 round trip
+# 訂單分成兩層：熱資料 ([order] / item) 與封存 (order_archive / item_archive，見 archive-orders)
+# order_id 在兩層之間不會重複 (IDENTITY / SEQUENCE / SQLite AUTOINCREMENT 都不會重用已刪除的編號)，
+# 讀歷史訂單的地方依序查兩層
+ORDER_TIERS = (("[order]", "item"), ("order_archive", "item_archive"))
+
+ORDER_DETAIL_SQL = """
+    SELECT o.order_id, o.status, o.tot_price, o.store_id, s.name, c.phone,
+           d.product_name, d.option_key, d.quantity, d.price,
+           d.quantity * d.price AS subtotal,
+           SUM(d.quantity * d.price) OVER () AS items_price,
+           SUM(d.quantity) OVER () AS items_qty
+    FROM {order_table} o
+    LEFT JOIN store s ON o.store_id = s.store_id
+    LEFT JOIN customer c ON o.customer_id = c.customer_id
+    LEFT JOIN (
+        SELECT i.item_id, i.order_id, p.name AS product_name, i.option_key, i.quantity, p.price
+        FROM {item_table} i
+        JOIN product p ON i.product_id = p.product_id
+    ) d ON d.order_id = o.order_id
+    WHERE o.order_id = ? {store_filter}
+    ORDER BY d.item_id
+"""
+
+def load_order(conn, order_id, store_id=None):
+    """回傳 (order_info, items)；找不到訂單 (或不屬於該門市) 時 order_info 為 None
+    先查熱資料，找不到才查封存 (大多數查詢是最近的訂單，只需要一次查詢)"""
+    params = [order_id]
+    store_filter = ""
+    if store_id is not None:
+        store_filter = "AND o.store_id = ?"
+        params.append(store_id)
+
+    cursor = conn.cursor()
+    for order_table, item_table in ORDER_TIERS:
+        cursor.execute(ORDER_DETAIL_SQL.format(
+            order_table=order_table, item_table=item_table, store_filter=store_filter
+        ), params)
+        rows = cursor.fetchall()
+        if rows:
+            break
+    else:
+        return None, []
+
+    head = rows[0]
+    order_info = {
+        "order_id": head[0],
+        "status": head[1],
+        "tot_price": head[2],
+        "store_id": head[3],
+        "store_name": head[4] or "未知店家",
+        "phone": head[5] if head[5] else "未知",
+        "total_price": head[11] or 0,
+        "total_qty": head[12] or 0,
+    }
+    items = [
+        {"product_name": r[6], **option_labels(r[7]), "quantity": r[8], "price": r[9], "subtotal": r[10]}
+        for r in rows if r[6] is not None
+    ]
+    return order_info, items
+
 def get_order_details(conn, selected_id, store_id):
-    selected_info = None
-    selected_items = []
-    
-    if selected_id:
-        cursor = conn.cursor()
-        # 查 Header
-        cursor.execute("""
-            SELECT o.order_id, o.status, c.phone, o.tot_price
-            FROM [order] o
-            LEFT JOIN customer c ON o.customer_id = c.customer_id
-            WHERE o.order_id = ? AND o.store_id = ?
-        """, (selected_id, store_id))
-        row = cursor.fetchone()
-        
-        if row:
-            selected_info = {
-                "order_id": row[0],
-                "status": row[1],
-                "phone": row[2] if row[2] else "未知",
-                "tot_price": row[3]
-            }
-
-            # 查 Items
-            cursor.execute("""
-                SELECT i.item_id, p.name, i.size, i.ice, i.sugar, i.topping, i.quantity, p.price
-                FROM item i 
-                JOIN product p ON i.product_id = p.product_id 
-                WHERE i.order_id = ?
-            """, (selected_id,))
-            
-            tot_q = 0
-            for r in cursor.fetchall():
-                sub = r[7] * r[6]
-                tot_q += r[6]
-                selected_items.append({
-                    "product_name": r[1], "size": r[2], "ice": r[3], "sugar": r[4], 
-                    "topping": r[5], "quantity": r[6], "price": r[7], "subtotal": sub
-                })
-            selected_info['total_qty'] = tot_q
-            
-    return selected_info, selected_items
+    if not selected_id:
+        return None, []
+    return load_order(conn, selected_id, store_id)
 
 # ✅ 歷史訂單 (改從 Session 讀取 selected_id)
 @app.route("/admin_history_orders")
@@ -192,156 +625,260 @@ def admin_history_orders():
     selected_id = session.get('admin_selected_id')
 
     if not store_id: return redirect(url_for("admin_login"))
-    
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # 1. 列表：只撈已完成
-    cursor.execute("""
-        SELECT o.order_id, c.phone, o.status, o.tot_price
-        FROM [order] o 
-        LEFT JOIN customer c ON o.customer_id = c.customer_id
-        WHERE o.store_id = ? 
-          AND ISNULL(o.tot_price, 0) > 0 
-          AND o.status = N'已完成'
-        ORDER BY o.order_id DESC
-    """, (store_id,))
-    
-    orders = [
-        { "order_id": r[0], "phone": r[1] or "未知", "status": r[2] or "已完成", "tot_price": r[3] or 0 } 
-        for r in cursor.fetchall()
-    ]
 
-    # 2. 明細
-    selected_info, selected_items = get_order_details(conn, selected_id, store_id)
+    # 篩選條件：電話 (前綴比對) 與日期區間 (門市當地日期)
+    phone = request.args.get("phone", "").strip()
+    if not re.fullmatch(r"\d{1,10}", phone):
+        phone = ""
+    date_from = parse_local_date(request.args.get("date_from"))
+    date_to = parse_local_date(request.args.get("date_to"))
+
+    where = ["o.store_id = ?", "COALESCE(o.tot_price, 0) > 0", "o.status = ?"]
+    params = [store_id, "已完成"]
+    if phone:
+        where.append("c.phone LIKE ?")
+        params.append(phone + "%")
+    if date_from:
+        where.append("o.created_at >= ?")
+        params.append(local_date_to_utc(date_from))
+    if date_to:
+        where.append("o.created_at < ?")
+        params.append(local_date_to_utc(date_to + timedelta(days=1)))
+
+    # Keyset 分頁：以 order_id 定位，不用 OFFSET，翻到第幾頁都只讀一頁的資料
+    before = request.args.get("before", type=int)
+    after = request.args.get("after", type=int)
+    page_where, page_params = list(where), list(params)
+    if after is not None:
+        page_where.append("o.order_id > ?")
+        page_params.append(after)
+        direction = "ASC"
+    else:
+        if before is not None:
+            page_where.append("o.order_id < ?")
+            page_params.append(before)
+        direction = "DESC"
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+
+        # 1. 列表：只撈已完成 (多抓一筆判斷是否還有下一頁)
+        #    熱資料與封存各取一頁，合併後再取前 N 筆，換頁的 keyset 對兩層都適用
+        rows = []
+        for order_table, _ in ORDER_TIERS:
+            cursor.execute(f"""
+                SELECT o.order_id, c.phone, o.status, o.tot_price, o.created_at
+                FROM {order_table} o 
+                LEFT JOIN customer c ON o.customer_id = c.customer_id
+                WHERE {" AND ".join(page_where)}
+                ORDER BY o.order_id {direction}
+                {db_backend.limit_clause(HISTORY_PAGE_SIZE + 1)}
+            """, page_params)
+            rows += cursor.fetchall()
+        rows.sort(key=lambda r: r[0], reverse=(direction == "DESC"))
+        rows = rows[:HISTORY_PAGE_SIZE + 1]
+
+        has_more = len(rows) > HISTORY_PAGE_SIZE
+        rows = rows[:HISTORY_PAGE_SIZE]
+        if direction == "ASC":
+            rows.reverse()
+            has_prev, has_next = has_more, True
+        else:
+            has_prev, has_next = before is not None, has_more
+
+        orders = [
+            { "order_id": r[0], "phone": r[1] or "未知", "status": r[2] or "已完成", "tot_price": r[3] or 0,
+              "created_at": format_local_time(r[4]) } 
+            for r in rows
+        ]
+
+        # 2. 概略筆數：最多只數到 HISTORY_COUNT_CAP，超過就顯示「N+」，成本固定
+        total = 0
+        for order_table, _ in ORDER_TIERS:
+            if total > HISTORY_COUNT_CAP:
+                break
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM (
+                    SELECT o.order_id
+                    FROM {order_table} o
+                    LEFT JOIN customer c ON o.customer_id = c.customer_id
+                    WHERE {" AND ".join(where)}
+                    ORDER BY o.order_id
+                    {db_backend.limit_clause(HISTORY_COUNT_CAP + 1)}
+                ) t
+            """, params)
+            total += cursor.fetchone()[0]
+        total_text = f"{HISTORY_COUNT_CAP}+" if total > HISTORY_COUNT_CAP else str(total)
+
+        # 3. 明細
+        selected_info, selected_items = get_order_details(conn, selected_id, store_id)
+
+    filters = {k: v for k, v in (
+        ("phone", phone),
+        ("date_from", date_from.strftime("%Y-%m-%d") if date_from else ""),
+        ("date_to", date_to.strftime("%Y-%m-%d") if date_to else ""),
+    ) if v}
+    page_args = dict(filters)
+    if before is not None:
+        page_args["before"] = before
+    if after is not None:
+        page_args["after"] = after
 
-    conn.close()
-    
     return render_template(
         "admin_history_orders.html",
         orders=orders, 
         store_id=store_id, 
         store_name=store_name,
         selected_info=selected_info,
-        selected_items=selected_items
+        selected_items=selected_items,
+        filters=filters,
+        page_args=page_args,
+        total_text=total_text,
+        prev_url=url_for("admin_history_orders", after=orders[0]["order_id"], **filters) if has_prev and orders else None,
+        next_url=url_for("admin_history_orders", before=orders[-1]["order_id"], **filters) if has_next and orders else None,
     )
+
 @app.route("/admin_order_detail/<int:order_id>")
 def admin_order_detail(order_id):
     if not session.get('admin_store_id'): return redirect(url_for("admin_login"))
     
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # 1. 查詢 Item 明細
-    cursor.execute("""
-        SELECT i.item_id, p.name, i.size, i.ice, i.sugar, i.topping, i.quantity, p.price
-        FROM item i 
-        JOIN product p ON i.product_id = p.product_id 
-        WHERE i.order_id = ?
-    """, (order_id,))
-    
-    items = []
-    tot_p, tot_q = 0, 0
-    for r in cursor.fetchall():
-        sub = r[7] * r[6]
-        tot_p += sub
-        tot_q += r[6]
-        items.append({
-            "product_name": r[1], 
-            "size": r[2], 
-            "ice": r[3], 
-            "sugar": r[4], 
-            "topping": r[5], 
-            "quantity": r[6], 
-            "price": r[7], 
-            "subtotal": sub
-        })
-        
-    # 2. ✅ 修正：查詢訂單 Header (加入 customer join 以取得電話)
-    cursor.execute("""
-        SELECT o.order_id, o.status, c.phone, o.tot_price
-        FROM [order] o
-        LEFT JOIN customer c ON o.customer_id = c.customer_id
-        WHERE o.order_id = ?
-    """, (order_id,))
-    
-    row = cursor.fetchone()
-    if row:
-        order_info = {
-            "order_id": row[0],
-            "status": row[1],
-            "phone": row[2] if row[2] else "未知",
-            "tot_price": row[3]
-        }
-    else:
-        order_info = None
-
-    conn.close()
+    with get_db_connection() as conn:
+        order_info, items = load_order(conn, order_id)
     
     return render_template(
         "admin_order_detail.html", 
         items=items, 
-        total_price=tot_p, 
-        total_qty=tot_q, 
+        total_price=order_info["total_price"] if order_info else 0, 
+        total_qty=order_info["total_qty"] if order_info else 0, 
         order_info=order_info
     )
 
+# 銷售報表：只讀彙總表 (sales_*)，不碰 [order] / item，查幾年的區間也只是幾千列
+SALES_OPTION_LABELS = {"size": "尺寸", "ice": "冰塊", "sugar": "甜度", "topping": "加料"}
+
+@app.route("/admin_analytics")
+def admin_analytics():
+    store_id = session.get('admin_store_id')
+    if not store_id: return redirect(url_for("admin_login"))
+
+    today = (datetime.utcnow() + STORE_UTC_OFFSET).replace(hour=0, minute=0, second=0, microsecond=0)
+    date_to = parse_local_date(request.args.get("date_to")) or today
+    date_from = parse_local_date(request.args.get("date_from")) or date_to - timedelta(days=6)
+    product_id = request.args.get("product_id", type=int)
+    date_range = (store_id, date_from.strftime("%Y-%m-%d"), date_to.strftime("%Y-%m-%d"))
+    where = "store_id = ? AND sale_date BETWEEN ? AND ?"
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT sale_date, SUM(orders), SUM(quantity), SUM(revenue)
+            FROM sales_store_hourly WHERE {where}
+            GROUP BY sale_date ORDER BY sale_date
+        """, date_range)
+        daily = [{"date": str(r[0]), "orders": r[1], "quantity": r[2], "revenue": r[3]} for r in cursor.fetchall()]
+
+        cursor.execute(f"""
+            SELECT sale_hour, SUM(orders), SUM(quantity), SUM(revenue)
+            FROM sales_store_hourly WHERE {where}
+            GROUP BY sale_hour ORDER BY sale_hour
+        """, date_range)
+        hourly = [{"hour": r[0], "orders": r[1], "quantity": r[2], "revenue": r[3]} for r in cursor.fetchall()]
+
+        cursor.execute(f"""
+            SELECT product_id, SUM(quantity), SUM(revenue)
+            FROM sales_product_daily WHERE {where}
+            GROUP BY product_id ORDER BY SUM(quantity) DESC
+        """, date_range)
+        product_rows = cursor.fetchall()
+
+        option_where, option_params = where, list(date_range)
+        if product_id:
+            option_where += " AND product_id = ?"
+            option_params.append(product_id)
+        cursor.execute(f"""
+            SELECT option_name, option_value, SUM(quantity)
+            FROM sales_option_daily WHERE {option_where}
+            GROUP BY option_name, option_value
+            ORDER BY option_name, SUM(quantity) DESC
+        """, option_params)
+        option_rows = cursor.fetchall()
+
+    names = {p["id"]: p["name"] for p in product_cache.get()["list"]}
+    products = [
+        {"id": r[0], "name": names.get(r[0], f"#{r[0]}"), "quantity": r[1], "revenue": r[2]}
+        for r in product_rows
+    ]
+    options = {}
+    for name, value, quantity in option_rows:
+        options.setdefault(name, []).append({"value": value or "-", "quantity": quantity})
+    option_mix = []
+    for name in OPTION_NAMES:
+        values = options.get(name, [])
+        total = sum(v["quantity"] for v in values) or 1
+        for v in values:
+            v["share"] = round(v["quantity"] * 100 / total, 1)
+        option_mix.append({"label": SALES_OPTION_LABELS[name], "choices": values})
+
+    return render_template(
+        "admin_analytics.html",
+        store_name=session.get('admin_store_name', '店家'),
+        date_from=date_from.strftime("%Y-%m-%d"),
+        date_to=date_to.strftime("%Y-%m-%d"),
+        product_id=product_id,
+        totals={
+            "orders": sum(d["orders"] for d in daily),
+            "quantity": sum(d["quantity"] for d in daily),
+            "revenue": sum(d["revenue"] for d in daily),
+        },
+        daily=daily,
+        hourly=hourly,
+        products=products,
+        option_mix=option_mix,
+    )
+
 # ================== 客人端 (Customer) - 修改重點 ==================
 
 # 顧客登入：customer_login.html (選店家) 寫入 Session
 @app.route("/customer_login", methods=["GET", "POST"])
 @app.route("/customer_login.html", methods=["GET", "POST"])
 def customer_login():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     if request.method == "POST":
         phone = request.form.get("phone", "").strip()
         store_id = request.form.get("store_id")
 
         if not re.match(r"^09\d{8}$", phone):
-            cursor.execute("SELECT store_id, name FROM store")
-            stores = [{"id": r[0], "name": r[1]} for r in cursor.fetchall()]
-            conn.close()
+            stores = store_cache.get()["list"]
             return render_template("customer_login.html", error_msg="格式錯誤，請輸入 09 開頭的 10 位數字號碼", old_phone=phone, stores=stores)
 
-        # 1. 檢查顧客
-        cursor.execute("SELECT customer_id FROM customer WHERE phone = ?", (phone,))
-        row = cursor.fetchone()
-        if row:
-            customer_id = row[0]
-        else:
-            cursor.execute("SELECT ISNULL(MAX(customer_id), 0) + 1 FROM customer")
-            customer_id = cursor.fetchone()[0]
-            cursor.execute("INSERT INTO customer (customer_id, phone) VALUES (?, ?)", (customer_id, phone))
-            conn.commit()
-        
-        # 2. 建立訂單
-        cursor.execute("SELECT ISNULL(MAX(order_id), 0) + 1 FROM [order]")
-        new_order_id = cursor.fetchone()[0]
+        # 訂單到結帳才建立，門市要在這裡先檢查，不然顧客點完餐才會在結帳時撞上外鍵錯誤
+        stores = store_cache.get()
+        if not (store_id or "").isdigit() or int(store_id) not in stores["names"]:
+            stores = stores["list"]
+            return render_template("customer_login.html", error_msg="請選擇有效的店家", old_phone=phone, stores=stores)
+
+        # 1. 找出 (或建立) 顧客：熟客直接從記憶體拿，不碰資料庫；
+        #    其餘用一個 find-or-create 敘述 (MERGE / upsert) 完成，同一支電話同時登入也不會重複建立
+        customer_id = customer_ids.get(phone)
+        if customer_id is None:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                customer_id = db_backend.find_or_create(cursor, "customer", "phone", phone, "customer_id")
+                conn.commit()
+            customer_ids.put(phone, customer_id)
 
-        cursor.execute(
-            "INSERT INTO [order] (order_id, customer_id, store_id, status) VALUES (?, ?, ?, ?)",
-            (new_order_id, customer_id, store_id, "未完成")
-        )
-        conn.commit()
-        conn.close()
-        
         # ✅ 重要：將關鍵資訊存入 Session，而不是放在 URL 傳遞
+        # 訂單列等到結帳時才建立，只登入沒點餐的人不會在 [order] 留下空訂單
         session['customer_phone'] = phone
         session['customer_id'] = customer_id
-        session['current_order_id'] = new_order_id
         session['current_store_id'] = store_id
-        
+        session['cart'] = []
+
         # 3. 轉跳點餐畫面 (網址乾淨了)
         return redirect(url_for("order_drink"))
 
-    # GET 請求
-    cursor.execute("SELECT store_id, name FROM store")
-    stores = [{"id": r[0], "name": r[1]} for r in cursor.fetchall()]
-    conn.close()
-
-    return render_template("customer_login.html", stores=stores)
+    # GET 請求 (門市清單走快取；清單沒變就回 304)
+    stores = store_cache.get()["list"]
+    return render_catalog_page("customer_login.html", stores=stores)
 
 
 # 點餐畫面：order_drink.html
@@ -351,90 +888,95 @@ def order_drink():
     # ✅ 從 Session 拿資料，如果沒有 Session 就踢回登入頁
     phone = session.get('customer_phone')
     customer_id = session.get('customer_id')
-    order_id = session.get('current_order_id')
     store_id = session.get('current_store_id')
     
-    if not phone or not order_id:
+    if not phone or not store_id:
         return redirect(url_for("customer_login"))
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    # 店名與商品目錄都從快取拿，這頁不需要查資料庫
+    store_name = get_store_name(store_id)
+    catalog = product_cache.get()
+    products = catalog["list"]
 
-    store_name = "未知店家"
-    if store_id:
-        cursor.execute("SELECT name FROM store WHERE store_id = ?", (store_id,))
-        row = cursor.fetchone()
-        if row:
-            store_name = row[0]
+    today = date.today().strftime("%Y-%m-%d")
 
-    cursor.execute("SELECT product_id, name, photo_url, price FROM product")
-    rows = cursor.fetchall()
-    products = []
-    for row in rows:
-        raw_url = row[2] if row[2] else ""
-        clean_path = raw_url[len("static/"):] if raw_url.startswith("static/") else raw_url
-        final_url = url_for('static', filename=clean_path) if clean_path else ""
-        products.append({"id": row[0], "name": row[1], "photo_url": final_url, "price": row[3] or 0})
-
-    conn.close()
-
-    return render_template(
+    return render_catalog_page(
         "order_drink.html",
+        etag_parts=(phone, customer_id, store_id, today),
         customer_phone=phone,
         customer_id=customer_id,
-        order_id=order_id,
         store_id=store_id,
         store_name=store_name,
         products=products,
-        today=date.today().strftime("%Y-%m-%d")
+        image_formats=catalog["image_formats"],
+        options=option_cache.get()["choices"],
+        today=today
     )
 
 
+# ---------- 購物車 (存在 Session，結帳時才寫入資料庫) ----------
+# 每一列為 [product_id, option_key, quantity]
+
+def get_cart():
+    """Session 內的購物車；改用選項代碼之前留下的舊格式 (6 欄) 直接捨棄"""
+    return [line for line in session.get('cart', []) if len(line) == 3]
+
+def cart_add(cart, product_id, option_key, quantity):
+    """相同規格的飲料合併數量，否則新增一列"""
+    for line in cart:
+        if line[0] == product_id and line[1] == option_key:
+            line[2] += quantity
+            return
+    cart.append([product_id, option_key, quantity])
+
+def cart_items(cart):
+    """把購物車轉成畫面用的明細 (品名、單價來自商品快取)，回傳 (items, 總金額, 總杯數)"""
+    products = product_cache.get()["by_id"]
+    items = []
+    tot_p, tot_q = 0, 0
+    for product_id, option_key, quantity in cart:
+        product = products.get(product_id)
+        if not product:
+            continue
+        sub = product["price"] * quantity
+        tot_p += sub
+        tot_q += quantity
+        items.append({"product_name": product["name"], **option_labels(option_key),
+                      "quantity": quantity, "price": product["price"], "subtotal": sub})
+    return items, tot_p, tot_q
+
 # ✅ 加入訂單 (新增合併邏輯)
 @app.route("/add_item", methods=["POST"])
 def add_item():
     # 從 Session 取得關鍵 ID，確保安全
-    order_id = session.get('current_order_id')
-    
-    if not order_id:
+    if not session.get('customer_id') or not session.get('current_store_id'):
         return redirect(url_for("customer_login"))
 
     # 表單只負責傳遞商品內容
-    product_id = request.form.get("product_id")
-    size = request.form.get("size")
-    ice = request.form.get("ice")
-    sugar = request.form.get("sugar")
-    topping = request.form.get("topping", "無")
+    try:
+        product_id = int(request.form.get("product_id"))
+    except (TypeError, ValueError):
+        return redirect(url_for("order_drink"))
+    # 選項以代碼送出 (點餐頁的 <option value> 來自 drink_option)；沒選加料視為「無」
+    options = option_cache.get()
+    codes = []
+    for name in OPTION_NAMES:
+        default = options["codes"]["topping"].get("無") if name == "topping" else None
+        code = request.form.get(name, default, type=int)
+        if code not in options["labels"][name]:
+            return redirect(url_for("order_drink"))
+        codes.append(code)
     try:
         quantity = int(request.form.get("quantity", 1))
     except ValueError:
         quantity = 1
+    if quantity < 1 or product_id not in product_cache.get()["by_id"]:
+        return redirect(url_for("order_drink"))
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # 檢查是否已存在相同規格 (合併邏輯)
-    cursor.execute("""
-        SELECT item_id, quantity 
-        FROM item 
-        WHERE order_id = ? AND product_id = ? AND size = ? AND ice = ? AND sugar = ? AND topping = ?
-    """, (order_id, product_id, size, ice, sugar, topping))
-    
-    existing_item = cursor.fetchone()
-
-    if existing_item:
-        new_qty = existing_item[1] + quantity
-        cursor.execute("UPDATE item SET quantity = ? WHERE item_id = ?", (new_qty, existing_item[0]))
-    else:
-        cursor.execute("SELECT ISNULL(MAX(item_id), 0) + 1 FROM item")
-        new_item_id = cursor.fetchone()[0]
-        cursor.execute("""
-            INSERT INTO item (item_id, order_id, product_id, size, ice, sugar, topping, quantity)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (new_item_id, order_id, product_id, size, ice, sugar, topping, quantity)) 
-    
-    conn.commit()
-    conn.close()
+    # 只更新 Session 內的購物車，不碰資料庫
+    cart = get_cart()
+    cart_add(cart, product_id, pack_options(codes), quantity)
+    session['cart'] = cart
 
     return redirect(url_for("order_drink")) # 不需要帶參數了
 
@@ -443,33 +985,13 @@ def add_item():
 def order_summary():
     # 從 Session 讀取
     phone = session.get('customer_phone')
-    order_id = session.get('current_order_id')
-    
-    if not order_id: return redirect(url_for("customer_login"))
-    
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    store_id = session.get('current_store_id')
     
-    cursor.execute("""
-        SELECT i.item_id, p.name, i.size, i.ice, i.sugar, i.topping, i.quantity, p.price
-        FROM item i JOIN product p ON i.product_id = p.product_id WHERE i.order_id = ?
-    """, (order_id,))
+    if not phone or not store_id: return redirect(url_for("customer_login"))
     
-    items = []
-    tot_p, tot_q = 0, 0
-    for r in cursor.fetchall():
-        sub = r[7]*r[6]; tot_p+=sub; tot_q+=r[6]
-        items.append({"product_name": r[1], "size": r[2], "ice": r[3], "sugar": r[4], "topping": r[5], "quantity": r[6], "price": r[7], "subtotal": sub})
-    
-    # 查詢店名
-    store_name = "未知店家"
-    store_id = session.get('current_store_id')
-    if store_id:
-        cursor.execute("SELECT name FROM store WHERE store_id = ?", (store_id,))
-        row = cursor.fetchone()
-        if row: store_name = row[0]
-
-    conn.close()
+    # 明細來自 Session 購物車 + 商品快取，這頁不需要查資料庫
+    items, tot_p, tot_q = cart_items(get_cart())
+    store_name = get_store_name(store_id)
     
     # Render 時不需要再傳 ID 給前端的按鈕連結，因為後端都會從 Session 抓
     return render_template(
@@ -478,62 +1000,414 @@ def order_summary():
         total_price=tot_p, 
         total_qty=tot_q, 
         phone=phone, 
-        order_id=order_id, 
-        store_name=store_name
+        store_name=store_name,
+        checkout_token=str(uuid.uuid4())
     )
 
+# 由 item JOIN product 重新計算總金額 / 總杯數，一個 set-based UPDATE 完成，不信任前端傳來的金額
+CHECKOUT_TOTALS_SQL = """
+    UPDATE [order]
+    SET tot_price = (
+            SELECT COALESCE(SUM(i.quantity * p.price), 0)
+            FROM item i JOIN product p ON i.product_id = p.product_id
+            WHERE i.order_id = ?
+        ),
+        tot_amount = (
+            SELECT COALESCE(SUM(i.quantity), 0) FROM item i WHERE i.order_id = ?
+        ),
+        status = ?
+    WHERE order_id = ?
+"""
+
+# ---------- 銷售彙總 ----------
+# 彙總表說明見 sql/migrations/005_sales_rollups.sql；checkout 與 rebuild-sales-rollup 共用同一套累加邏輯
+# 彙總需要的訂單明細 (item 沒有存單價，以目前的商品價格計算，與結帳時的 CHECKOUT_TOTALS_SQL 相同)
+SALES_LINES_SQL = """
+    SELECT o.order_id, o.store_id, o.created_at,
+           i.product_id, i.option_key, i.quantity, COALESCE(p.price, 0)
+    FROM {order_table} o
+    JOIN {item_table} i ON i.order_id = o.order_id
+    LEFT JOIN product p ON p.product_id = i.product_id
+    WHERE {where}
+"""
+
+def sales_rollup_rows(lines):
+    """SALES_LINES_SQL 的結果 → 三張彙總表各自要累加的列 (鍵值 + 數值，順序同 write_sales_rollup)"""
+    store_rows, product_rows, option_rows = {}, {}, {}
+    counted = set()
+    for order_id, store_id, created_at, product_id, option_key, quantity, price in lines:
+        if store_id is None or created_at is None:
+            continue
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        local = created_at + STORE_UTC_OFFSET
+        sale_date, sale_hour = local.strftime("%Y-%m-%d"), local.hour
+        quantity = quantity or 0
+        revenue = quantity * price
+
+        row = store_rows.setdefault((store_id, sale_date, sale_hour), [0, 0, 0])
+        if order_id not in counted:
+            counted.add(order_id)
+            row[0] += 1
+        row[1] += quantity
+        row[2] += revenue
+
+        row = product_rows.setdefault((store_id, sale_date, product_id), [0, 0])
+        row[0] += quantity
+        row[1] += revenue
+
+        # 選項分布存文字 (報表直接顯示，選項代碼日後調整也不影響歷史報表)
+        for name, value in option_labels(option_key).items():
+            key = (store_id, sale_date, product_id, name, value)
+            option_rows[key] = option_rows.get(key, 0) + quantity
+
+    return (
+        [(*k, *v) for k, v in store_rows.items()],
+        [(*k, *v) for k, v in product_rows.items()],
+        [(*k, v) for k, v in option_rows.items()],
+    )
+
+def write_sales_rollup(cursor, rollup, fresh=False):
+    """累加進彙總表 (不 commit)；fresh=True 表示這段日期已經清空，直接 INSERT"""
+    store_rows, product_rows, option_rows = rollup
+    tables = [
+        ("sales_store_hourly", ("store_id", "sale_date", "sale_hour"), ("orders", "quantity", "revenue"), store_rows),
+        ("sales_product_daily", ("store_id", "sale_date", "product_id"), ("quantity", "revenue"), product_rows),
+        ("sales_option_daily", ("store_id", "sale_date", "product_id", "option_name", "option_value"), ("quantity",), option_rows),
+    ]
+    for table, keys, values, rows in tables:
+        if fresh:
+            db_backend.bulk_insert(cursor, table, keys + values, rows)
+        else:
+            db_backend.increment_rows(cursor, table, keys, values, rows)
+
 @app.route("/checkout", methods=["POST"])
 def checkout():
-    order_id = session.get('current_order_id') # 從 Session 拿
-    if not order_id: return redirect(url_for("customer_login"))
+    customer_id = session.get('customer_id') # 從 Session 拿
+    store_id = session.get('current_store_id')
+    if not customer_id or not store_id: return redirect(url_for("customer_login"))
 
-    # 金額從後端重算比較安全，或者暫時信任前端傳來的 hidden
-    tot_price = request.form.get("tot_price")
-    tot_amount = request.form.get("tot_amount")
-    
-    conn = get_db_connection()
-    conn.execute("UPDATE [order] SET tot_price = ?, tot_amount = ?, status = N'未完成' WHERE order_id = ?", (tot_price, tot_amount, order_id))
-    conn.commit()
-    conn.close()
+    # 冪等鍵：order_summary 產生、放在表單 hidden 欄位
+    token = request.form.get("checkout_token", "")
+    try:
+        token = str(uuid.UUID(token))
+    except ValueError:
+        return redirect(url_for("order_summary"))
+
+    cart = get_cart()
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        # 同一個 token 已經建立過訂單 = 連點 / 重送，什麼都不寫
+        cursor.execute("SELECT order_id FROM [order] WHERE checkout_token = ?", (token,))
+        row = cursor.fetchone()
+        order_id = row[0] if row else None
+        first_submit = order_id is None
+
+        if first_submit and not cart:
+            return redirect(url_for("order_summary"))
+
+        if first_submit:
+            try:
+                # 訂單在這裡才建立；明細一次寫入，總計由資料庫計算，全部在同一個交易
+                order_id = db_backend.insert_returning(
+                    cursor, "[order]", ("customer_id", "store_id", "status", "checkout_token"),
+                    (customer_id, store_id, "未完成", token), "order_id"
+                )
+                db_backend.bulk_insert(
+                    cursor, "item", ("order_id", "product_id", "option_key", "quantity"),
+                    [(order_id, *line) for line in cart]
+                )
+                cursor.execute(CHECKOUT_TOTALS_SQL, (order_id, order_id, "未完成", order_id))
+                # 銷售彙總跟訂單在同一個交易：重送被擋下 rollback 時也不會重複累加
+                cursor.execute(SALES_LINES_SQL.format(order_table="[order]", item_table="item", where="o.order_id = ?"), (order_id,))
+                write_sales_rollup(cursor, sales_rollup_rows(cursor.fetchall()))
+                conn.commit()
+            except db_backend.IntegrityError as exc:
+                # 同時送出兩次：另一個 request 先建好了 (唯一索引擋下)，改用它的訂單
+                # 其他限制 (例如門市 / 商品已被刪除的外鍵錯誤) 照常丟出
+                conn.rollback()
+                if not db_backend.is_duplicate_key(exc, "order", "checkout_token", "UX_order_checkout_token"):
+                    raise
+                first_submit = False
+                cursor.execute("SELECT order_id FROM [order] WHERE checkout_token = ?", (token,))
+                row = cursor.fetchone()
+                if not row:
+                    raise
+                order_id = row[0]
+
+    if first_submit:
+        pending_orders.bump(store_id)
+        order_feed.notify()
+
+    # 訂單已送出：清空購物車，同一次登入可以繼續點下一張
+    session.pop('cart', None)
+    session['last_order_id'] = order_id
     
     return redirect(url_for("order_success")) # 不需要參數
 
 @app.route("/order_success")
 def order_success():
-    order_id = session.get('current_order_id') # 從 Session 拿
+    order_id = session.get('last_order_id') # 結帳時建立的訂單編號
     if not order_id: return redirect(url_for("customer_login"))
     
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT o.order_id, s.name, o.tot_price, c.phone, s.store_id
-        FROM [order] o JOIN store s ON o.store_id = s.store_id 
-        LEFT JOIN customer c ON o.customer_id = c.customer_id WHERE o.order_id = ?
-    """, (order_id,))
-    order_info = cursor.fetchone() 
-
-    cursor.execute("""
-        SELECT p.name, i.size, i.ice, i.sugar, i.topping, i.quantity, p.price
-        FROM item i JOIN product p ON i.product_id = p.product_id WHERE i.order_id = ?
-    """, (order_id,))
-    
-    items = [{"product_name": r[0], "size": r[1], "ice": r[2], "sugar": r[3], "topping": r[4], "quantity": r[5], "price": r[6], "subtotal": r[5]*r[6]} for r in cursor.fetchall()]
-    
-    conn.close()
-    
-    # 結帳完成後，可以考慮清除 current_order_id，或是留著讓使用者看
-    # session.pop('current_order_id', None) 
+    with get_db_connection() as conn:
+        order_info, items = load_order(conn, order_id)
+    if not order_info: return redirect(url_for("customer_login"))
 
     return render_template(
         "order_success.html", 
-        order_id=order_info[0],       
-        store_name=order_info[1],     
-        total_amount=order_info[2],   
-        customer_phone=order_info[3], 
-        store_id=order_info[4],       
+        order_id=order_info["order_id"],       
+        store_name=order_info["store_name"],     
+        total_amount=order_info["tot_price"],   
+        customer_phone=order_info["phone"], 
+        store_id=order_info["store_id"],       
         items=items                   
     )
 
+# ================== 管理指令 (flask --app web <指令>) ==================
+
+@app.cli.command("init-db")
+def init_db_command():
+    """依 sql/sql_database.sql 重建資料表，並匯入 database_data/*.csv"""
+    with get_db_connection() as conn:
+        db_backend.init_schema(conn)
+        db_backend.seed(conn)
+    product_cache.invalidate()
+    store_cache.invalidate()
+    option_cache.invalidate()
+    pending_orders.clear()
+    print(f"[{db_backend.name}] 資料表已重建並匯入種子資料")
+
+@app.cli.command("invalidate-cache")
+def invalidate_cache_command():
+    """商品 / 門市 / 飲料選項資料異動 (或直接匯入訂單) 後執行，讓所有 worker 重新載入快取"""
+    product_cache.invalidate()
+    store_cache.invalidate()
+    option_cache.invalidate()
+    pending_orders.clear()
+    print("商品目錄、門市清單、飲料選項與待處理訂單快取已失效")
+
+@app.cli.command("migrate")
+def migrate_command():
+    """套用 sql/migrations/ 底下尚未執行的 migration (升級既有資料庫用)"""
+    with get_db_connection() as conn:
+        applied = apply_migrations(db_backend, conn)
+    for version, name in applied:
+        print(f"[{db_backend.name}] 已套用 migration {version:03d}_{name}")
+    if not applied:
+        print(f"[{db_backend.name}] 資料庫已是最新版本")
+
+# 已放棄的空訂單：沒有金額、也沒有結帳 token (改成結帳時才建立訂單之前，每次登入都會留下一筆)
+ABANDONED_ORDERS_SQL = """
+    SELECT order_id FROM [order]
+    WHERE COALESCE(tot_price, 0) = 0
+      AND checkout_token IS NULL
+      AND (created_at IS NULL OR created_at < ?)
+    ORDER BY order_id
+    {limit}
+"""
+
+@app.cli.command("reap-orders")
+@click.option("--older-than", default=24, show_default=True, help="只清除建立超過幾小時的空訂單")
+@click.option("--batch-size", default=500, show_default=True, help="每個交易刪除的訂單數")
+def reap_orders_command(older_than, batch_size):
+    """分批刪除已放棄的零元訂單 (連同明細)，每批各自 commit，不會長時間鎖住 [order]"""
+    cutoff = (datetime.utcnow() - timedelta(hours=older_than)).strftime("%Y-%m-%d %H:%M:%S")
+    sql = ABANDONED_ORDERS_SQL.format(limit=db_backend.limit_clause(batch_size))
+    orders = items = batches = 0
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        while True:
+            cursor.execute(sql, (cutoff,))
+            ids = [r[0] for r in cursor.fetchall()]
+            if not ids:
+                break
+            placeholders = ", ".join("?" for _ in ids)
+            cursor.execute(f"DELETE FROM item WHERE order_id IN ({placeholders})", ids)
+            items += max(cursor.rowcount, 0)
+            cursor.execute(f"DELETE FROM [order] WHERE order_id IN ({placeholders})", ids)
+            orders += max(cursor.rowcount, 0)
+            conn.commit()
+            batches += 1
+            print(f"  第 {batches} 批：{len(ids)} 筆訂單")
+    print(f"[{db_backend.name}] 共清除 {orders} 筆空訂單、{items} 筆明細 ({batches} 批)")
+
+# 可以封存的訂單：已完成且建立超過指定天數
+ARCHIVABLE_ORDERS_SQL = """
+    SELECT order_id FROM [order]
+    WHERE status = ? AND created_at < ?
+    ORDER BY order_id
+    {limit}
+"""
+ARCHIVE_ORDER_COLUMNS = "order_id, store_id, customer_id, tot_price, tot_amount, status, created_at, checkout_token"
+ARCHIVE_ITEM_COLUMNS = "item_id, order_id, product_id, option_key, quantity"
+
+@app.cli.command("archive-orders")
+@click.option("--older-than-days", default=int(os.environ.get("ARCHIVE_AFTER_DAYS", 90)), show_default=True,
+              help="封存建立超過幾天的已完成訂單")
+@click.option("--batch-size", default=500, show_default=True, help="每個交易搬移的訂單數")
+@click.option("--max-batches", default=0, show_default=True, help="最多跑幾批就停 (0 = 不限)")
+def archive_orders_command(older_than_days, batch_size, max_batches):
+    """分批把舊的已完成訂單 (連同明細) 搬到 order_archive / item_archive；每批各自 commit，不會長時間鎖住 [order]"""
+    cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).strftime("%Y-%m-%d %H:%M:%S")
+    sql = ARCHIVABLE_ORDERS_SQL.format(limit=db_backend.limit_clause(batch_size))
+    orders = items = batches = 0
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        while not max_batches or batches < max_batches:
+            cursor.execute(sql, ("已完成", cutoff))
+            ids = [r[0] for r in cursor.fetchall()]
+            if not ids:
+                break
+            placeholders = ", ".join("?" for _ in ids)
+            try:
+                # 先複製再刪除，同一個交易：中途失敗整批 rollback，訂單不會消失也不會重複
+                cursor.execute(f"""
+                    INSERT INTO order_archive ({ARCHIVE_ORDER_COLUMNS})
+                    SELECT {ARCHIVE_ORDER_COLUMNS} FROM [order] WHERE order_id IN ({placeholders})
+                """, ids)
+                cursor.execute(f"""
+                    INSERT INTO item_archive ({ARCHIVE_ITEM_COLUMNS})
+                    SELECT {ARCHIVE_ITEM_COLUMNS} FROM item WHERE order_id IN ({placeholders})
+                """, ids)
+                items += max(cursor.rowcount, 0)
+                cursor.execute(f"DELETE FROM item WHERE order_id IN ({placeholders})", ids)
+                cursor.execute(f"DELETE FROM [order] WHERE order_id IN ({placeholders})", ids)
+                orders += max(cursor.rowcount, 0)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            batches += 1
+            print(f"  第 {batches} 批：{len(ids)} 筆訂單")
+    # 銷售彙總表不受影響 (結帳時就已累加)
+    print(f"[{db_backend.name}] 共封存 {orders} 筆訂單、{items} 筆明細 ({batches} 批)")
+
+@app.cli.command("rebuild-sales-rollup")
+@click.option("--date-from", help="門市當地日期 YYYY-MM-DD (預設：最早一筆訂單)")
+@click.option("--date-to", help="門市當地日期 YYYY-MM-DD (預設：今天)")
+@click.option("--chunk-days", default=7, show_default=True, help="每個交易重算幾天")
+def rebuild_sales_rollup_command(date_from, date_to, chunk_days):
+    """由訂單明細重算銷售彙總表 (補算既有訂單，或彙總表與訂單對不起來時)；每段日期一個交易，先刪再寫"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        start = parse_local_date(date_from)
+        if date_from and not start:
+            raise click.BadParameter("日期格式為 YYYY-MM-DD", param_hint="--date-from")
+        if start is None:
+            firsts = []
+            for order_table, _ in ORDER_TIERS:
+                cursor.execute(f"SELECT MIN(created_at) FROM {order_table} WHERE COALESCE(tot_price, 0) > 0")
+                first = cursor.fetchone()[0]
+                if first is not None:
+                    firsts.append(datetime.fromisoformat(first) if isinstance(first, str) else first)
+            if not firsts:
+                print(f"[{db_backend.name}] 沒有已結帳的訂單")
+                return
+            first = min(firsts)
+            start = (first + STORE_UTC_OFFSET).replace(hour=0, minute=0, second=0, microsecond=0)
+        end = parse_local_date(date_to) or (datetime.utcnow() + STORE_UTC_OFFSET).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+
+        # 已封存的訂單也要算進去
+        lines_sqls = [
+            SALES_LINES_SQL.format(
+                order_table=order_table, item_table=item_table,
+                where="COALESCE(o.tot_price, 0) > 0 AND o.created_at >= ? AND o.created_at < ?",
+            )
+            for order_table, item_table in ORDER_TIERS
+        ]
+        day = start
+        total_orders = 0
+        while day <= end:
+            # 以門市當地的整天切段，同一天的彙總列不會跨兩段
+            chunk_end = min(day + timedelta(days=chunk_days), end + timedelta(days=1))
+            date_range = (day.strftime("%Y-%m-%d"), (chunk_end - timedelta(days=1)).strftime("%Y-%m-%d"))
+            for table in ("sales_store_hourly", "sales_product_daily", "sales_option_daily"):
+                cursor.execute(f"DELETE FROM {table} WHERE sale_date BETWEEN ? AND ?", date_range)
+            lines = []
+            for lines_sql in lines_sqls:
+                cursor.execute(lines_sql, (local_date_to_utc(day), local_date_to_utc(chunk_end)))
+                lines += cursor.fetchall()
+            rollup = sales_rollup_rows(lines)
+            write_sales_rollup(cursor, rollup, fresh=True)
+            conn.commit()
+            orders = sum(row[3] for row in rollup[0])
+            total_orders += orders
+            print(f"  {date_range[0]} ~ {date_range[1]}：{orders} 筆訂單")
+            day = chunk_end
+    print(f"[{db_backend.name}] 銷售彙總重算完成，共 {total_orders} 筆訂單")
+
+def apply_product_changes(current, changes, next_id):
+    """
+    current : {name: [product_id, name, photo_url, price]} (會直接修改)
+    changes : catalog_diff.json 的 added + repriced
+    以名稱比對：已存在就更新價格 / 圖片，不存在才給新編號；回傳 (新增的列, 更新的列)
+    """
+    inserted, updated = [], []
+    for c in changes:
+        row = current.get(c["name"])
+        price = c["price"] if c["price"] is not None else (row[3] if row else None)
+        if row is None:
+            row = [next_id, c["name"], c["photo_url"], price]
+            next_id += 1
+            current[c["name"]] = row
+            inserted.append(row)
+        elif (row[2], row[3]) != (c["photo_url"], price):
+            row[2], row[3] = c["photo_url"], price
+            updated.append(row)
+    return inserted, updated
+
+@app.cli.command("apply-catalog-diff")
+@click.argument("path", default=os.path.join(app.root_path, "crawler", "catalog_diff.json"))
+@click.option("--seed/--no-seed", default=True, show_default=True, help="同步更新 database_data/product.csv")
+def apply_catalog_diff_command(path, seed):
+    """套用爬蟲產生的 catalog_diff.json：只新增 / 改價有變動的商品，不再整份重建 product 資料"""
+    with open(path, encoding="utf-8") as f:
+        diff = json.load(f)
+    changes = diff["added"] + diff["repriced"]
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT product_id, name, photo_url, price FROM product")
+        current = {r[1]: list(r) for r in cursor.fetchall()}
+        next_id = max((r[0] for r in current.values()), default=0) + 1
+        inserted, updated = apply_product_changes(current, changes, next_id)
+        if inserted:
+            db_backend.bulk_insert(cursor, "product", ("product_id", "name", "photo_url", "price"), inserted)
+        if updated:
+            cursor.executemany(
+                "UPDATE product SET photo_url = ?, price = ? WHERE product_id = ?",
+                [(r[2], r[3], r[0]) for r in updated]
+            )
+        conn.commit()
+    product_cache.invalidate()
+    print(f"[{db_backend.name}] 商品新增 {len(inserted)} 筆、更新 {len(updated)} 筆")
+
+    # 下架商品仍被歷史訂單的明細引用，只列出來不刪除
+    for p in diff["removed"]:
+        print(f"  已下架 (保留在資料表): {p['name']}")
+
+    if seed:
+        columns, rows = read_seed_csv("product")
+        rows = [[int(r[0]), r[1], r[2], int(r[3]) if r[3] else None] for r in rows]
+        by_name = {r[1]: r for r in rows}
+        next_id = max((int(r[0]) for r in rows), default=0) + 1
+        inserted, updated = apply_product_changes(by_name, changes, next_id)
+        rows.extend(inserted)
+        write_seed_csv("product", columns, rows)
+        print(f"database_data/product.csv 新增 {len(inserted)} 筆、更新 {len(updated)} 筆")
+
+@app.cli.command("explain")
+@click.argument("sql")
+@click.argument("params", nargs=-1)
+def explain_command(sql, params):
+    """印出查詢的執行計畫，方便比較 mssql / sqlite 兩種後端"""
+    with get_db_connection() as conn:
+        for line in db_backend.explain(conn, sql, params):
+            print(line)
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file